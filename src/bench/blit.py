@@ -0,0 +1,77 @@
+"""
+Tile blit benchmark. Compares blits per second of tiles cropped from the raw tile sets with tiles
+converted to the display pixel format, as the pages of atlases are.
+
+PYTHONPATH=. python src/bench/blit.py
+"""
+import os
+import time
+from typing import List
+
+import pygame
+from pygame import Surface
+
+from src.core.settings import Settings
+from src.world.util import crop_image, scale_image
+
+# Number of blits per measurement
+NUM_BLITS = 200_000
+
+
+def load_tiles(path: str, scale_factor: int) -> List[Surface]:
+    """
+    Crops and scales all 16x16 tiles of a tile set, the same way tiles are registered.
+    :param path: The path of the tile set file.
+    :param scale_factor: The scale factor.
+    :return: The tiles.
+    """
+    tile_set = pygame.image.load(os.path.join(Settings().assets_dir, path))
+    tiles = []
+    for y in range(0, tile_set.get_height() - 15, 16):
+        for x in range(0, tile_set.get_width() - 15, 16):
+            tiles.append(scale_image(crop_image(tile_set, (x, y), (16, 16)), scale_factor))
+
+    return tiles
+
+
+def measure(layer: Surface, tiles: List[Surface]) -> float:
+    """
+    Blits tiles all over a layer.
+    :param layer: The layer to blit on.
+    :param tiles: The tiles to blit.
+    :return: Blits per second.
+    """
+    tile_width, tile_height = tiles[0].get_size()
+    num_cols = layer.get_width() // tile_width
+    num_rows = layer.get_height() // tile_height
+    positions = [
+        ((index % num_cols) * tile_width, (index // num_cols % num_rows) * tile_height)
+        for index in range(NUM_BLITS)
+    ]
+
+    start = time.perf_counter()
+    for index, position in enumerate(positions):
+        layer.blit(tiles[index % len(tiles)], position)
+
+    return NUM_BLITS / (time.perf_counter() - start)
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+    settings = Settings()
+    pygame.display.set_mode(settings.display_window_size.toTuple())
+    layer = Surface(settings.display_window_size.toTuple(), pygame.SRCALPHA)
+
+    raw_tiles = load_tiles("tilesets/ground/grass.png", settings.display_tile_scale_factor)
+    converted_tiles = [tile.convert_alpha() for tile in raw_tiles]
+
+    raw = measure(layer, raw_tiles)
+    converted = measure(layer, converted_tiles)
+    print(f"raw tiles:       {raw:12,.0f} blits/s")
+    print(f"converted tiles: {converted:12,.0f} blits/s ({converted / raw:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
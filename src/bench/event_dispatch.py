@@ -0,0 +1,114 @@
+"""
+Event dispatch benchmark. Runs the internal phases of frames, a few simulation steps, the
+before-render event and the after-render event, through the Pygame event queue, as the game did
+before it dispatched its own events directly, and through the event manager directly.
+
+PYTHONPATH=. python src/bench/event_dispatch.py
+"""
+import os
+import time
+from typing import Dict, List
+
+import pygame
+
+from src.core.constant import EventTypes
+from src.core.context import Context
+from src.core.event import EventManager, EventListener
+
+# Number of frames per measurement
+NUM_FRAMES = 20_000
+
+# Number of simulation steps per frame
+NUM_STEPS = 2
+
+# Numbers of listeners of each event type, as registered by the game
+NUM_LISTENERS: Dict[int, int] = {
+    EventTypes.SIMULATE: 2,
+    EventTypes.BEFORE_RENDER: 7,
+    EventTypes.AFTER_RENDER: 1,
+}
+
+
+def create_event_manager() -> EventManager:
+    """
+    Creates an event manager with listeners that do nothing; half of them take the context.
+    """
+    event_manager = EventManager()
+    for event_type, num_listeners in NUM_LISTENERS.items():
+        for index in range(num_listeners):
+            if index % 2 == 0:
+                event_manager.on(event_type, lambda context: None)
+            else:
+                event_manager.on(event_type, lambda: None)
+
+    return event_manager
+
+
+def trigger_queued(event_listener_map: Dict[int, List[EventListener]], context: Context) -> None:
+    """
+    Triggers the events in the Pygame event queue, setting the event data for each listener and
+    checking the number of parameters of each callback.
+    """
+    for event in pygame.event.get():
+        for event_listener in event_listener_map.get(event.type, ()):
+            context.event_data = event.dict
+            if event_listener._callback_param_len == 0:
+                event_listener._callback()
+            else:
+                event_listener._callback(context)
+
+
+def measure_queue() -> float:
+    """
+    Measures posting the phases to the Pygame event queue and draining it.
+    :return: Microseconds per frame.
+    """
+    event_manager = create_event_manager()
+    event_listener_map = event_manager._event_listener_map
+    context = Context(None)
+
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        for _ in range(NUM_STEPS):
+            pygame.event.post(pygame.event.Event(EventTypes.SIMULATE))
+        pygame.event.post(pygame.event.Event(EventTypes.BEFORE_RENDER))
+        trigger_queued(event_listener_map, context)
+        after_render_event = pygame.event.Event(EventTypes.AFTER_RENDER)
+        for event_listener in event_listener_map[after_render_event.type]:
+            context.event_data = after_render_event.dict
+            event_listener._callback(context)
+
+    return (time.perf_counter() - start) / NUM_FRAMES * 1_000_000
+
+
+def measure_dispatch() -> float:
+    """
+    Measures dispatching the phases directly.
+    :return: Microseconds per frame.
+    """
+    event_manager = create_event_manager()
+    context = Context(None)
+
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        pygame.event.get()
+        for _ in range(NUM_STEPS):
+            event_manager.dispatch(EventTypes.SIMULATE, context)
+        event_manager.dispatch(EventTypes.BEFORE_RENDER, context)
+        event_manager.dispatch(EventTypes.AFTER_RENDER, context)
+
+    return (time.perf_counter() - start) / NUM_FRAMES * 1_000_000
+
+
+def main():
+    # The event queue needs the video system, which runs without a window
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    queue = measure_queue()
+    dispatch = measure_dispatch()
+    print(f"queue    {queue:6.2f} us/frame")
+    print(f"dispatch {dispatch:6.2f} us/frame ({queue / dispatch:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Loop scheduling benchmark. Updates thousands of concurrent loops, such as per-crop animations,
+with the loop manager and with a reference that walks every loop each frame, as the loop manager
+did before it kept deadlines in a priority queue.
+
+PYTHONPATH=. python src/bench/loops.py
+"""
+import random
+import time
+from typing import Callable, List
+
+from src.core.loop import LoopManager
+
+# Numbers of concurrent loops to measure
+NUM_LOOPS = (100, 1_000, 10_000)
+
+# Number of frames per measurement
+NUM_FRAMES = 600
+
+# Delta time of each frame in milliseconds
+DT = 16
+
+
+class LinearLoop:
+    """
+    A loop that decides whether it fires by itself each frame.
+    """
+
+    def __init__(self, fps: float, count_per_period: int, callback: Callable[[int], None]):
+        self.each_count_time: float = 1000 / fps
+        self.count_per_period: int = count_per_period
+        self.callback: Callable[[int], None] = callback
+        self.elapsed_time: float = 0
+        self.current_count: int = -1
+
+    def update(self, dt: float) -> None:
+        self.elapsed_time += dt
+        if self.elapsed_time < (self.current_count + 1) * self.each_count_time:
+            return
+
+        self.current_count += 1
+        if self.current_count >= self.count_per_period:
+            self.elapsed_time = 0
+            self.current_count = 0
+
+        self.callback(self.current_count)
+
+
+def measure_linear(num_loops: int) -> float:
+    """
+    Measures walking every loop each frame.
+    :param num_loops: The number of loops.
+    :return: Frames per second.
+    """
+    random.seed(0)
+    loops: List[LinearLoop] = [
+        LinearLoop(random.uniform(1, 4), 4, lambda index: None) for _ in range(num_loops)
+    ]
+
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        for loop in loops:
+            loop.update(DT)
+
+    return NUM_FRAMES / (time.perf_counter() - start)
+
+
+def measure_queue(num_loops: int) -> float:
+    """
+    Measures the loop manager, which only visits due loops each frame.
+    :param num_loops: The number of loops.
+    :return: Frames per second.
+    """
+    random.seed(0)
+    loop_manager = LoopManager()
+    for _ in range(num_loops):
+        loop_manager.loop(random.uniform(1, 4), 4, lambda index: None)
+
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        loop_manager.update(DT)
+
+    return NUM_FRAMES / (time.perf_counter() - start)
+
+
+def main():
+    for num_loops in NUM_LOOPS:
+        linear = measure_linear(num_loops)
+        queue = measure_queue(num_loops)
+        print(
+            f"{num_loops:6,} loops: linear {linear:10,.0f} frames/s, "
+            f"queue {queue:10,.0f} frames/s ({queue / linear:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Registry lookup benchmark. Looks resources up by freshly created locations, as shipping does for
+each item, and by resources. Lookups are measured with interned locations and with a reference
+that keeps the locations of the registry as they were before they were interned and hashable:
+a fresh location misses the location dictionary and is found through its string form.
+
+PYTHONPATH=. python src/bench/registry.py
+"""
+import time
+from typing import Callable, Dict, List
+
+from src.registry import RegistryUtil, Registry, Ref
+
+# Number of resources in the registry
+NUM_RESOURCES = 200
+
+# Number of lookups per measurement
+NUM_LOOKUPS = 200_000
+
+
+class LegacyResLoc:
+    """
+    A resource location that is hashed and compared by identity.
+    """
+
+    def __init__(self, namespace: str, path: str):
+        self.namespace: str = namespace
+        self.path: str = path
+
+    def __repr__(self):
+        return f"{self.namespace}:{self.path}"
+
+
+class LegacyRegistry:
+    """
+    The lookups of a registry keyed by locations that are hashed by identity; the references are
+    the ones of a registry.
+    """
+
+    def __init__(self, registry: Registry):
+        self.by_loc: Dict[LegacyResLoc, Ref] = {}
+        self.key_map: Dict[str, LegacyResLoc] = {}
+        self.by_res: Dict[object, LegacyResLoc] = {}
+        for ref in registry.get_ref_list():
+            res_loc = LegacyResLoc(ref.res_key.loc.namespace, ref.res_key.loc.path)
+            self.by_loc[res_loc] = ref
+            self.key_map[repr(res_loc)] = res_loc
+            self.by_res[ref.res] = res_loc
+
+    def get_ref(self, res_loc: LegacyResLoc) -> Ref:
+        ref = self.by_loc.get(res_loc)
+        if ref is None:
+            return self.get_ref(self.key_map[repr(res_loc)])
+
+        _ = ref.res
+        return ref
+
+    def get_by_loc(self, res_loc: LegacyResLoc) -> object:
+        return self.get_ref(res_loc).res
+
+    def get_ref_by_res(self, res: object) -> Ref:
+        return self.get_ref(self.by_res[res])
+
+
+def measure(lookup: Callable[[str], object], paths: List[str]) -> float:
+    """
+    Measures a lookup.
+    :param lookup: A function that looks a resource up by its path.
+    :param paths: The paths to look up, in order.
+    :return: Nanoseconds per lookup.
+    """
+    start = time.perf_counter()
+    for path in paths:
+        lookup(path)
+
+    return (time.perf_counter() - start) / len(paths) * 1_000_000_000
+
+
+def main():
+    names = [f"bench/resource_{index}" for index in range(NUM_RESOURCES)]
+    registry = RegistryUtil.createRegistry("bench")
+    for name in names:
+        registry.register(RegistryUtil.createLoc(name), name)
+    legacy_registry = LegacyRegistry(registry)
+    paths = [names[index % NUM_RESOURCES] for index in range(NUM_LOOKUPS)]
+
+    create_loc = RegistryUtil.createLoc
+    results = [
+        (
+            "get_ref",
+            measure(lambda path: legacy_registry.get_ref(LegacyResLoc("Builtin", path)), paths),
+            measure(lambda path: registry.get_ref(create_loc(path)), paths),
+        ),
+        (
+            "get_by_loc",
+            measure(lambda path: legacy_registry.get_by_loc(LegacyResLoc("Builtin", path)), paths),
+            measure(lambda path: registry.get_by_loc(create_loc(path)), paths),
+        ),
+        (
+            "get_ref_by_res",
+            measure(legacy_registry.get_ref_by_res, paths),
+            measure(registry.get_ref_by_res, paths),
+        ),
+    ]
+    for name, legacy, interned in results:
+        print(
+            f"{name:14} legacy {legacy:7.0f} ns, interned {interned:7.0f} ns "
+            f"({legacy / interned:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+UI update benchmark. Walks the character around the farm in headless mode and counts the layer
+fills and blits per frame with the update scheduler enabled and disabled; the difference is the
+work the scheduler avoids for hidden or idle modules.
+
+PYTHONPATH=. python src/bench/ui_updates.py
+"""
+import time
+from typing import Dict, Tuple
+
+import pygame
+
+from src.core.display import Layer
+from src.core.game import Game
+from src.core.settings import Settings
+
+# Number of frames to walk in each direction
+NUM_FRAMES_PER_DIRECTION = 60
+
+# Number of times to walk around a square
+NUM_LAPS = 5
+
+# Layer calls counted by name
+counts: Dict[str, int] = {"fill": 0, "blit": 0}
+
+
+def count(name: str):
+    """
+    Wraps a Layer method so that each call is counted.
+    :param name: The name of the method.
+    """
+    method = getattr(Layer, name)
+
+    def counted(*args, **kwargs):
+        counts[name] += 1
+        return method(*args, **kwargs)
+
+    setattr(Layer, name, counted)
+
+
+def walk(game: Game, scheduled: bool) -> Tuple[int, float]:
+    """
+    Walks the character around a square on the farm.
+    :param game: The game.
+    :param scheduled: Whether the update scheduler skips inactive modules.
+    :return: (the number of frames, seconds)
+    """
+    game.context["update_scheduler"].enabled = scheduled
+    counts.update(fill=0, blit=0)
+
+    num_frames = 0
+    start = time.perf_counter()
+    for _ in range(NUM_LAPS):
+        for key in (pygame.K_d, pygame.K_s, pygame.K_a, pygame.K_w):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+            for _ in range(NUM_FRAMES_PER_DIRECTION):
+                game.step(16, render=True)
+                num_frames += 1
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key))
+
+    return num_frames, time.perf_counter() - start
+
+
+def main():
+    Settings().headless = True
+    count("fill")
+    count("blit")
+
+    game = Game()
+    game.init()
+
+    # Skip the opening messages and go to the farm
+    for _ in range(10):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_j))
+        game.step(16)
+    from src.world.data.maps import Maps
+
+    character = game.context["character"]
+    game.context["scene_manager"].change_map(Maps.Farm, lambda: character.teleport((12, 9)))
+    for _ in range(60):
+        game.step(16)
+
+    results = {}
+    for scheduled in (False, True):
+        num_frames, seconds = walk(game, scheduled)
+        results[scheduled] = (counts["fill"] / num_frames, counts["blit"] / num_frames)
+        label = "scheduled:  " if scheduled else "unscheduled:"
+        print(
+            f"{label} {results[scheduled][0]:6.2f} fills/frame {results[scheduled][1]:6.2f} "
+            f"blits/frame {num_frames / seconds:8.1f} frames/s"
+        )
+
+    avoided_fills = results[False][0] - results[True][0]
+    avoided_blits = results[False][1] - results[True][1]
+    print(f"avoided:      {avoided_fills:6.2f} fills/frame {avoided_blits:6.2f} blits/frame")
+
+
+if __name__ == "__main__":
+    main()
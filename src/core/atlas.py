@@ -0,0 +1,239 @@
+"""
+Texture atlas module.
+"""
+import hashlib
+import json
+import os
+from typing import List, Tuple, Optional, Dict, Callable, Any
+
+import pygame
+from pygame import Surface, Rect
+
+from src.core.common import Size
+
+
+class Atlas:
+    """
+    A texture atlas packs many small images into a few large page surfaces. Images are placed on
+    shelves from left to right and top to bottom, in the order they are added.
+    """
+
+    def __init__(self, page_size: Size):
+        # The size of each page
+        self.page_size: Size = page_size
+
+        # Page surfaces
+        self.pages: List[Surface] = []
+
+        # The page images are currently placed on
+        self._page: Optional[Surface] = None
+
+        # The position where the next image is placed on the current page
+        self._cursor: Tuple[int, int] = (0, 0)
+
+        # The height of the current shelf, that is, the tallest image on it
+        self._shelf_height: int = 0
+
+    def add(self, image: Surface) -> Surface:
+        """
+        Copies an image into this atlas.
+        :param image: The image to add.
+        :return: The region of the atlas holding the image, which is a subsurface of a page.
+        """
+        width, height = image.get_size()
+        page_width, page_height = self.page_size.toTuple()
+
+        # Images larger than a page get a page of their own
+        if width > page_width or height > page_height:
+            page = self._create_page(Size(width, height))
+            self.pages.append(page)
+            return self._copy(page, image, (0, 0))
+
+        x, y = self._cursor
+        if x + width > page_width:
+            x, y = 0, y + self._shelf_height
+            self._shelf_height = 0
+        if self._page is None or y + height > page_height:
+            self._page = self._create_page(self.page_size)
+            self.pages.append(self._page)
+            x, y = 0, 0
+            self._shelf_height = 0
+
+        self._cursor = (x + width, y)
+        self._shelf_height = max(self._shelf_height, height)
+
+        return self._copy(self._page, image, (x, y))
+
+    @staticmethod
+    def locate(surface: Surface) -> Tuple[Surface, Rect]:
+        """
+        Locates a surface in its top-level parent surface. For an atlas region this is the page
+        and the area of the region; any other surface is located in itself.
+        :param surface: The surface to locate.
+        :return: (parent surface, area in the parent surface)
+        """
+        return surface.get_abs_parent(), Rect(surface.get_abs_offset(), surface.get_size())
+
+    @staticmethod
+    def _create_page(size: Size) -> Surface:
+        """
+        Creates a transparent page in the display pixel format.
+        """
+        page = Surface(size.toTuple(), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+
+        return page
+
+    @staticmethod
+    def _copy(page: Surface, image: Surface, position: Tuple[int, int]) -> Surface:
+        """
+        Copies an image onto a page and returns the region.
+        """
+        # Blending with BLEND_RGBA_MAX onto a transparent page copies the pixels as they are
+        page.blit(image, position, special_flags=pygame.BLEND_RGBA_MAX)
+
+        return page.subsurface(Rect(position, image.get_size()))
+
+
+class AtlasCache:
+    """
+    An on-disk cache of an atlas. The pages are saved as PNG files along with an index file that
+    maps resource paths to regions. The cache is keyed by the contents of the source files and by
+    parameters such as scale factors; if any of them changes, the images are created again and
+    the atlas is baked again.
+    """
+
+    # Version of the cache format; bump it to invalidate existing caches
+    VERSION = 1
+
+    def __init__(
+        self, atlas: Atlas, name: str, cache_dir: str, sources: List[str], params: Tuple[Any, ...]
+    ):
+        # The atlas to cache
+        self.atlas: Atlas = atlas
+
+        # The name of the cache, which prefixes the cache files
+        self.name: str = name
+
+        # The directory of cache files
+        self.cache_dir: str = cache_dir
+
+        # The cache key
+        self.key: str = AtlasCache._hash(sources, params)
+
+        # A map from resource paths to atlas regions
+        self.regions: Dict[str, Surface] = {}
+
+        # Whether regions were added since the cache was loaded or baked
+        self.dirty: bool = False
+
+        self._load()
+
+    def get(self, path: str, create: Callable[[], Surface]) -> Surface:
+        """
+        Returns the atlas region of a resource. On a cache miss, the image is created and added to
+        the atlas.
+        :param path: The path of the resource.
+        :param create: A function that creates the image.
+        :return: The atlas region holding the image.
+        """
+        region = self.regions.get(path)
+        if region is None:
+            region = self.atlas.add(create())
+            self.regions[path] = region
+            self.dirty = True
+
+        return region
+
+    def bake(self) -> None:
+        """
+        Writes the atlas and the index to the cache directory if regions were added, and removes
+        stale cache files of the same name. If the cache directory cannot be written, such as on a
+        read-only installation, the atlas is only kept in memory.
+        """
+        if not self.dirty:
+            return
+
+        try:
+            self._write()
+        except (OSError, pygame.error):
+            return
+
+        self.dirty = False
+
+    def _write(self) -> None:
+        """
+        Writes the atlas and the index to the cache directory.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for file in os.listdir(self.cache_dir):
+            if file.startswith(f"{self.name}-") and not file.startswith(self._get_prefix()):
+                os.remove(os.path.join(self.cache_dir, file))
+
+        pages = self.atlas.pages
+        for index, page in enumerate(pages):
+            pygame.image.save(page, self._get_page_file(index))
+
+        regions: Dict[str, List[int]] = {}
+        for path, region in self.regions.items():
+            page, area = Atlas.locate(region)
+            regions[path] = [pages.index(page), area.x, area.y, area.width, area.height]
+
+        # The index is written last, so that an interrupted bake leaves no valid cache behind
+        index_file = self._get_index_file()
+        with open(index_file + ".tmp", "w", encoding="utf-8") as file:
+            json.dump({"pages": len(pages), "regions": regions}, file)
+        os.replace(index_file + ".tmp", index_file)
+
+    def _load(self) -> None:
+        """
+        Loads the atlas pages and the index from the cache directory, if they exist.
+        """
+        try:
+            with open(self._get_index_file(), encoding="utf-8") as file:
+                index = json.load(file)
+
+            pages = [
+                pygame.image.load(self._get_page_file(page_index))
+                for page_index in range(index["pages"])
+            ]
+        except (OSError, ValueError, KeyError, pygame.error):
+            return
+
+        if pygame.display.get_surface() is not None:
+            pages = [page.convert_alpha() for page in pages]
+
+        self.atlas.pages.extend(pages)
+        for path, (page_index, x, y, width, height) in index["regions"].items():
+            self.regions[path] = pages[page_index].subsurface(Rect(x, y, width, height))
+
+    def _get_prefix(self) -> str:
+        """
+        Returns the prefix of the cache files.
+        """
+        return f"{self.name}-{self.key}"
+
+    def _get_index_file(self) -> str:
+        """
+        Returns the path of the index file.
+        """
+        return os.path.join(self.cache_dir, f"{self._get_prefix()}.json")
+
+    def _get_page_file(self, page_index: int) -> str:
+        """
+        Returns the path of a page file.
+        """
+        return os.path.join(self.cache_dir, f"{self._get_prefix()}-{page_index}.png")
+
+    @staticmethod
+    def _hash(sources: List[str], params: Tuple[Any, ...]) -> str:
+        """
+        Hashes the contents of source files and parameters.
+        """
+        sha1 = hashlib.sha1(repr((AtlasCache.VERSION, params)).encode())
+        for source in sources:
+            with open(source, "rb") as file:
+                sha1.update(file.read())
+
+        return sha1.hexdigest()[:16]
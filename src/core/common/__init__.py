@@ -1,5 +1,7 @@
+from .array_grid import *
 from .coordinate_set import *
 from .grid import *
 from .list_wrapper import *
 from .methodical import *
+from .observable import *
 from .size import *
@@ -0,0 +1,164 @@
+"""
+Array grid module.
+"""
+
+from typing import Tuple, Any, Iterator
+
+import numpy as np
+
+from .grid import Grid, T
+from .size import Size
+
+
+class ArrayGrid(Grid[T]):
+    """
+    A grid whose cells are stored in a NumPy array of a declared data type, such as booleans for
+    block grids, small integers for tile IDs or structured records, so that large grids do not
+    hold a Python object per cell. Cells can be accessed by coordinates and indices like a general
+    grid, and the array supports slicing, rectangular views and vectorized operations.
+
+    The empty cell is None for the object data type and zero for the others.
+    """
+
+    def __init__(self, size: Size, dtype: Any = object, default_cell: T | None = None):
+        # The size of this grid
+        self.size = size
+
+        # The data type of cells
+        self.dtype: np.dtype = np.dtype(dtype)
+
+        # The value of empty cells
+        self.empty: Any = ArrayGrid._get_empty(self.dtype)
+
+        # Cells, indexed by (row, col)
+        self.array: np.ndarray = np.full((size.height, size.width), self.empty, self.dtype)
+
+        # Fill
+        if default_cell is not None:
+            self.fill(default_cell)
+
+    @staticmethod
+    def of_array(array: np.ndarray) -> "ArrayGrid":
+        """
+        Creates a grid that shares the cells of a two-dimensional array.
+        :param array: The array of cells, indexed by (row, col).
+        :return: The grid.
+        """
+        grid = ArrayGrid.__new__(ArrayGrid)
+        grid.size = Size(array.shape[1], array.shape[0])
+        grid.dtype = array.dtype
+        grid.empty = ArrayGrid._get_empty(grid.dtype)
+        grid.array = array
+
+        return grid
+
+    def get(self, coordinate: Tuple[int, int]) -> T | None:
+        """
+        Retrieves a cell.
+        :param coordinate: The coordinate of the cell to retrieve.
+        :return: The cell at the specified coordinate.
+        """
+        return self.array[coordinate[1], coordinate[0]]
+
+    def set(self, coordinate: Tuple[int, int], cell: T | None) -> None:
+        """
+        Sets a cell.
+        :param coordinate: The coordinate of the cell to set.
+        :param cell: The cell to set.
+        """
+        self.array[coordinate[1], coordinate[0]] = cell
+
+    def fill(self, cell: Any, mask: np.ndarray | None = None) -> None:
+        """
+        Fills cells with a given value.
+        :param cell: The value of fill.
+        :param mask: A boolean array of the shape of the grid that is true where to fill; None
+        fills all cells.
+        """
+        if mask is None:
+            self.array.fill(cell)
+        else:
+            self.array[mask] = cell
+
+    def get_mask(self) -> np.ndarray:
+        """
+        Returns a boolean array of the shape of the grid that is true where cells are not empty.
+        """
+        if self.dtype == object:
+            return np.not_equal(self.array, None)
+
+        return self.array != self.empty
+
+    def view(self, col_range: Tuple[int, int], row_range: Tuple[int, int]) -> "ArrayGrid[T]":
+        """
+        Returns a rectangular view of this grid; the view shares cells with this grid.
+        :param col_range: The range of columns.
+        :param row_range: The range of rows.
+        """
+        (row_start, row_end), (col_start, col_end) = row_range, col_range
+        return ArrayGrid.of_array(self.array[row_start:row_end, col_start:col_end])
+
+    def iter_nonempty(self) -> Iterator[Tuple[Tuple[int, int], T]]:
+        """
+        Iterates over the cells that are not empty, row by row.
+        :return: An iterator of (coordinate, cell).
+        """
+        for coordinate in ArrayGrid.iter_coordinates(self.get_mask()):
+            yield coordinate, self.array[coordinate[1], coordinate[0]]
+
+    @staticmethod
+    def iter_coordinates(mask: np.ndarray) -> Iterator[Tuple[int, int]]:
+        """
+        Iterates over the coordinates where a mask is true, row by row.
+        :param mask: A boolean array indexed by (row, col), such as a comparison of a grid array.
+        :return: An iterator of coordinates.
+        """
+        rows, cols = np.nonzero(mask)
+        return zip(cols.tolist(), rows.tolist())
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Retrieves a cell of a specified index. Tuples of rows and columns, including slices, are
+        passed to the array.
+        :param index: The index of the cell to retrieve.
+        """
+        if isinstance(index, tuple):
+            return self.array[index]
+
+        return self.array[divmod(index, self.size.width)]
+
+    def __setitem__(self, index: Any, cell: Any) -> None:
+        """
+        Sets the value of a cell. Tuples of rows and columns, including slices, are passed to the
+        array.
+        :param index: The index of the cell.
+        :param cell: The cell to set.
+        """
+        if isinstance(index, tuple):
+            self.array[index] = cell
+        else:
+            self.array[divmod(index, self.size.width)] = cell
+
+    def __len__(self) -> int:
+        """
+        Returns the size of cells.
+        """
+        return self.array.size
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.array.flat)
+
+    def get_iterator(self, row_range: Tuple[int, int], col_range: Tuple[int, int]) -> Iterator[T]:
+        """
+        Returns an iterator.
+        :param row_range: The range of row.
+        :param col_range: The range of column.
+        """
+        return iter(self.view(col_range, row_range).array.flat)
+
+    @staticmethod
+    def _get_empty(dtype: np.dtype) -> Any:
+        """
+        Returns the value of empty cells of a data type.
+        """
+        return None if dtype == object else np.zeros((), dtype)[()]
@@ -0,0 +1,70 @@
+"""
+Observable module.
+"""
+
+from typing import Callable, List, Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Observable:
+    """
+    An object that notifies its observers when it changes.
+    """
+
+    def __init__(self):
+        # Functions to call when this object changes
+        self._observers: List[Callable[..., None]] = []
+
+    def observe(self, observer: Callable[..., None]) -> Callable[..., None]:
+        """
+        Adds an observer.
+        :param observer: The function to call with the arguments of each notification.
+        :return: The observer.
+        """
+        self._observers.append(observer)
+
+        return observer
+
+    def unobserve(self, observer: Callable[..., None]) -> None:
+        """
+        Removes an observer if it exists.
+        :param observer: The observer to remove.
+        """
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def notify(self, *args: Any) -> None:
+        """
+        Notifies all observers of a change.
+        :param args: Arguments describing the change.
+        """
+        for observer in self._observers:
+            observer(*args)
+
+
+class Observed(Generic[T]):
+    """
+    An attribute of an Observable that notifies the observers with the name of the attribute
+    whenever it is set to a different value. Changes made inside a mutable value are not seen, so
+    they should be notified explicitly.
+    """
+
+    def __init__(self):
+        # The name of the attribute
+        self.name: str = ""
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Observable | None, owner: Any) -> T:
+        if instance is None:
+            return self
+
+        return instance.__dict__[self.name]
+
+    def __set__(self, instance: Observable, value: T) -> None:
+        changed = instance.__dict__.get(self.name, value) != value
+        instance.__dict__[self.name] = value
+        if changed:
+            instance.notify(self.name)
@@ -22,6 +22,9 @@ class EventTypes:
     # After-render event
     AFTER_RENDER = BASE + 3
 
+    # Simulation event; triggered once per fixed simulation step, before the before-render event
+    SIMULATE = BASE + 4
+
 
 class Direction:
     """
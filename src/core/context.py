@@ -2,7 +2,7 @@
 Game context module.
 """
 
-from typing import Dict, TYPE_CHECKING, Any, Callable
+from typing import Dict, TYPE_CHECKING, Any, Callable, Mapping
 
 if TYPE_CHECKING:
     from src.core.settings import Settings
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from src.core.display import Display
     from src.core.event import EventManager
     from src.core.loop import LoopManager
+    from src.core.profiler import Profiler
 
 
 class Context:
@@ -22,11 +23,16 @@ class Context:
         self.game: "Game" = game
 
         # Delta time in milliseconds
-        # (dt is short for delta time, which refers to the time of a single frame)
+        # (dt is short for delta time, which refers to the time of a single frame; during a
+        # simulation step, it is the fixed time of the step)
         self.dt: int = 0
 
+        # How far the frame being rendered is between the last two simulation steps, from 0 to 1;
+        # rendering interpolates positions by it
+        self.alpha: float = 1
+
         # Event data
-        self.event_data: Dict[str, Any] = {}
+        self.event_data: Mapping[str, Any] = {}
 
         # Extra context data store
         self._data: Dict[str, object] = {}
@@ -59,6 +65,13 @@ class Context:
         """
         return self.game.loop_manager
 
+    @property
+    def profiler(self) -> "Profiler":
+        """
+        Returns the profiler.
+        """
+        return self.game.profiler
+
     def __getitem__(self, key) -> Any:
         """
         Retrieves the value associated with a given key in the extra data store.
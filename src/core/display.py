@@ -1,12 +1,17 @@
 """
 Display module.
 """
-from typing import List, Dict, Tuple, Optional
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Optional, Iterator, Iterable
 
+import numpy as np
 import pygame
 from pygame import Surface, Vector2, Rect
 
-from src.core.common import Size, Grid
+from src.core.atlas import Atlas
+from src.core.common import Size, Grid, ArrayGrid, Observable
+from src.core.profiler import Profiler
+from src.registry import Registry
 
 
 class Layer:
@@ -24,31 +29,118 @@ class Layer:
         # The offset when this layer is displayed on the screen
         self.offset: Vector2 = Vector2(0, 0)
 
-        # Rectangle to crop
+        # Rectangle to crop; only this area of the surface is displayed (the viewport)
         self.rect: Optional[Rect] = None
 
         # If true, this layer will not be displayed
         self.hidden = False
 
+        # Rectangles (relative to the surface) that have changed since the last composition
+        self.damaged_rects: List[Rect] = []
+
+        # The screen rectangle, the surface and the crop rectangle in the last composition
+        self._composited_rect: Optional[Rect] = None
+        self._composited_surface: Optional[Surface] = None
+        self._composited_viewport: Optional[Rect] = None
+
     def render(self) -> None:
         """
         Renders this layer.
         """
 
-    def blit(self, surface: Surface, offset: Vector2 = Vector2(0, 0)) -> None:
+    def damage(self, rect: Optional[Rect] = None) -> None:
         """
-        Blits a surface on this layer.
+        Marks an area of this layer as changed so that the display recomposites it.
+        :param rect: The changed area relative to the surface; None marks the whole surface.
+        """
+        self.damaged_rects.append(self.surface.get_rect() if rect is None else Rect(rect))
+
+    def blit(
+        self, surface: Surface, offset: Vector2 = Vector2(0, 0), area: Optional[Rect] = None
+    ) -> None:
+        """
+        Blits a surface (or an area of it) on this layer.
         :param: surface The surface to blit on this layer.
         :param: offset The offset of the surface.
+        :param area: The area of the surface to blit; None blits the whole surface.
+        """
+        self.damaged_rects.append(self.surface.blit(surface, offset, area))
+
+    def fill(self, color, rect: Optional[Rect] = None) -> None:
+        """
+        Fills this layer (or an area of it) with a solid color.
+        :param color: The color to fill.
+        :param rect: The area to fill; None fills the whole surface.
+        """
+        self.damaged_rects.append(self.surface.fill(color, rect))
+
+    def clear(self, rect: Optional[Rect] = None) -> None:
+        """
+        Clears this layer (or an area of it) in place, making it transparent.
+        :param rect: The area to clear; None clears the whole surface.
+        """
+        self.damaged_rects.append(self.surface.fill((0, 0, 0, 0), rect))
+
+    def get_screen_rect(self) -> Rect:
+        """
+        Returns the area this layer covers on the screen.
         """
-        self.surface.blit(surface, offset)
+        return Rect(self.offset, self.surface.get_size())
 
-    def clear(self, flag: int = pygame.SRCALPHA) -> None:
+    def to_screen_rect(self, rect: Rect) -> Rect:
         """
-        Clears the surface.
-        :param flag An extra parameter for initializing the surface.
+        Converts a rectangle relative to the surface to a rectangle on the screen.
+        :param rect: The rectangle relative to the surface.
         """
-        self.surface = Surface(self.size.toTuple(), flag)
+        return rect.move(self.offset)
+
+    def pop_screen_damage(self) -> List[Rect]:
+        """
+        Returns the screen areas this layer changed since the last composition and clears the
+        damaged rectangles. Moving, hiding, showing, scrolling or replacing the surface damages
+        both the old and the new screen areas.
+        """
+        screen_rect = None if self.hidden else self.get_screen_rect()
+
+        if (
+            screen_rect != self._composited_rect
+            or self.surface is not self._composited_surface
+            or self.rect != self._composited_viewport
+        ):
+            rects = [rect for rect in (self._composited_rect, screen_rect) if rect is not None]
+        elif screen_rect is None:
+            rects = []
+        else:
+            rects = [self.to_screen_rect(rect).clip(screen_rect) for rect in self.damaged_rects]
+
+        self.damaged_rects = []
+        self._composited_rect = screen_rect
+        self._composited_surface = self.surface
+        self._composited_viewport = None if self.rect is None else Rect(self.rect)
+
+        return rects
+
+    def reset_composition(self) -> Optional[Rect]:
+        """
+        Forgets the last composition of this layer, so that it is fully recomposited the next
+        time it is displayed.
+        :return: The screen rectangle this layer covered in the last composition, if any.
+        """
+        composited_rect = self._composited_rect
+        self.damaged_rects = []
+        self._composited_rect = None
+        self._composited_surface = None
+        self._composited_viewport = None
+
+        return composited_rect
+
+    def draw(self, screen: Surface) -> None:
+        """
+        Blits the surface on the screen without rendering it.
+        :param screen: The screen to blit.
+        """
+        if not self.hidden:
+            screen.blit(self.surface, self.offset)
 
     def display(self, screen: Surface) -> None:
         """
@@ -56,14 +148,15 @@ class Layer:
         :param screen: The screen to blit.
         """
         self.render()
+        self.draw(screen)
 
-        if not self.hidden:
-            screen.blit(self.surface, self.offset)
 
-
-class GridLayer(Layer):
+class GridLayer(Layer, Observable):
     """
-    Grid layer.
+    Grid layer. Cells whose surfaces are tiles of the tile registry also hold the tile IDs, so
+    that tiles can be compared and tested for tags without their surfaces; the ID of other cells
+    is -1. Observers are notified with the coordinate, the previous tile ID and the new tile ID of
+    each updated cell.
     """
 
     class Cell:
@@ -78,8 +171,9 @@ class GridLayer(Layer):
             # The surface of this cell
             self.surface: Surface | None = None
 
-    def __init__(self, grid_size: Size, cell_size: Size):
-        super().__init__(grid_size * cell_size)
+    def __init__(self, grid_size: Size, cell_size: Size, registry: Registry | None = None):
+        Layer.__init__(self, grid_size * cell_size)
+        Observable.__init__(self)
 
         # Grid size
         self.grid_size: Size = grid_size
@@ -95,8 +189,18 @@ class GridLayer(Layer):
                 index = self.grid.get_index(coordinate)
                 self.grid[index] = GridLayer.Cell(coordinate)
 
-        # Updated cells' indices
-        self.updated_indices: List[int] = []
+        # The tile registry; None if cells hold no tile IDs
+        self.registry: Registry | None = registry
+
+        # The tile ID of each cell
+        self.tile_ids: ArrayGrid[int] = ArrayGrid(grid_size, np.int32, -1)
+
+        # Updated cells' indices; a dictionary is used as an ordered set, so that a cell updated
+        # several times is rendered once
+        self.updated_indices: Dict[int, None] = {}
+
+        # How many cells to the right and below the surface of a cell may stick out into
+        self._overflow: Tuple[int, int] = (0, 0)
 
     def get_cell(self, coordinate: Tuple[int, int]) -> "GridLayer.Cell":
         """
@@ -106,6 +210,14 @@ class GridLayer(Layer):
         """
         return self.grid.get(coordinate)
 
+    def get_tile_id(self, coordinate: Tuple[int, int]) -> int:
+        """
+        Returns the tile ID of a cell.
+        :param coordinate The coordinate of the cell.
+        :return: The tile ID; -1 if the cell is empty or its surface is not a tile.
+        """
+        return self.tile_ids.array[coordinate[1], coordinate[0]]
+
     def update_cell(self, coordinate: Tuple[int, int], surface: Surface | None) -> None:
         """
         Updates a cell at a specified position.
@@ -115,7 +227,35 @@ class GridLayer(Layer):
         cell: GridLayer.Cell = self.grid[index]
         cell.surface = surface
 
-        self.updated_indices.append(index)
+        self.updated_indices[index] = None
+        self._update_tile_id(coordinate, surface)
+        if surface is not None:
+            self._update_overflow(surface)
+
+    def _update_overflow(self, surface: Surface) -> None:
+        """
+        Widens the overflow range so that it covers a surface larger than a cell.
+        """
+        cell_width, cell_height = self.cell_size.toTuple()
+        width, height = surface.get_size()
+        if width > cell_width or height > cell_height:
+            self._overflow = (
+                max(self._overflow[0], -(-width // cell_width) - 1),
+                max(self._overflow[1], -(-height // cell_height) - 1),
+            )
+
+    def _update_tile_id(self, coordinate: Tuple[int, int], surface: Surface | None) -> None:
+        """
+        Updates the tile ID of an updated cell and notifies the observers.
+        """
+        tile_id = -1
+        if surface is not None and self.registry is not None:
+            tile_id = self.registry.get_id_by_res(surface)
+
+        tile_ids = self.tile_ids.array
+        previous_tile_id = tile_ids[coordinate[1], coordinate[0]]
+        tile_ids[coordinate[1], coordinate[0]] = tile_id
+        self.notify(coordinate, previous_tile_id, tile_id)
 
     def wipe_cell(self, coordinate: Tuple[int, int], alpha: int = 0) -> None:
         """
@@ -123,60 +263,536 @@ class GridLayer(Layer):
         :param coordinate: The coordinate to wipe.
         :param alpha:
         """
-        rect = (
+        rect = Rect(
             coordinate[0] * self.cell_size.width,
             coordinate[1] * self.cell_size.height,
             self.cell_size.width,
             self.cell_size.height,
         )
-        self.surface.fill((0, 0, 0, alpha), rect)
+        self.fill((0, 0, 0, alpha), rect)
+
+    def iter_cells(self) -> Iterator["GridLayer.Cell"]:
+        """
+        Iterates over all cells in this layer.
+        """
+        return iter(self.grid)
 
     def render_all(self):
         """
         Renders all cells in this layer; clears the updated indices.
         :return:
         """
-        self._render_indices(list(range(len(self.grid))))
-        self.updated_indices = []
+        self._render_indices(range(len(self.grid)))
+        self.updated_indices = {}
 
     def render(self):
         """
-        Renders this layer; blit the updated cells on the surface.
+        Renders this layer; blit the updated cells on the surface. If the layer has a viewport,
+        only the updated cells whose surfaces may intersect it are rendered; the others stay
+        pending until they come into view. Surfaces larger than a cell stick out to the right and
+        below, so cells above and on the left of the viewport are rendered as far as they do.
         """
-        self._render_indices(self.updated_indices)
-        self.updated_indices = []
+        if self.rect is None:
+            self._render_indices(self.updated_indices)
+            self.updated_indices = {}
+            return
+
+        col_start, col_end, row_start, row_end = self.get_viewport_range()
+        col_start -= self._overflow[0]
+        row_start -= self._overflow[1]
+        visible_indices: List[int] = []
+        pending_indices: Dict[int, None] = {}
+        for index in self.updated_indices:
+            col, row = self.grid[index].coordinate
+            if col_start <= col < col_end and row_start <= row < row_end:
+                visible_indices.append(index)
+            else:
+                pending_indices[index] = None
 
-    def _render_indices(self, indices: List[int]):
+        self._render_indices(visible_indices)
+        self.updated_indices = pending_indices
+
+    def get_viewport(self) -> Rect:
         """
-        Renders cells of given indices.
+        Returns the visible area of this layer, that is, the crop rectangle clipped to the layer.
         """
+        bounds = Rect((0, 0), self.size.toTuple())
+
+        return bounds if self.rect is None else self.rect.clip(bounds)
+
+    def get_viewport_range(self) -> Tuple[int, int, int, int]:
+        """
+        Returns the range of cells intersecting the viewport.
+        :return: (col_start, col_end, row_start, row_end); the ends are exclusive.
+        """
+        cell_width, cell_height = self.cell_size.toTuple()
+        rect = self.get_viewport()
+
+        return (
+            rect.left // cell_width,
+            -(-rect.right // cell_width),
+            rect.top // cell_height,
+            -(-rect.bottom // cell_height),
+        )
+
+    def get_screen_rect(self) -> Rect:
+        area = self.get_viewport()
+        crop_x, crop_y = (0, 0) if self.rect is None else self.rect.topleft
+
+        return Rect(self.offset + Vector2(area.x - crop_x, area.y - crop_y), area.size)
+
+    def to_screen_rect(self, rect: Rect) -> Rect:
+        if self.rect is None:
+            return super().to_screen_rect(rect)
+
+        return rect.move(self.offset - Vector2(self.rect.topleft))
+
+    def draw(self, screen: Surface) -> None:
+        """
+        Blits the visible area of the surface on the screen.
+        :param screen: The screen to blit.
+        """
+        if not self.hidden:
+            screen.blit(self.surface, self.offset, self.rect)
+
+    def _render_indices(self, indices: Iterable[int]):
+        """
+        Renders cells of given indices with a single batched blit. Cell surfaces that are atlas
+        regions are blitted from the atlas pages.
+        """
+        cell_width, cell_height = self.cell_size.toTuple()
+        blit_sequence: List[Tuple[Surface, Tuple[int, int], Rect]] = []
         for index in indices:
             cell: GridLayer.Cell = self.grid[index]
-            dest = (
-                cell.coordinate[0] * self.cell_size.width,
-                cell.coordinate[1] * self.cell_size.height,
-            )
             surface = cell.surface
             if surface is not None:
-                self.surface.blit(surface, dest)
+                page, area = Atlas.locate(surface)
+                dest = (cell.coordinate[0] * cell_width, cell.coordinate[1] * cell_height)
+                blit_sequence.append((page, dest, area))
+                self.damaged_rects.append(Rect(dest, area.size))
+
+        self.surface.blits(blit_sequence, doreturn=False)
 
     def clone(self) -> "GridLayer":
         """
         Returns a deep copy of this grid layer.
         """
-        grid_layer = GridLayer(self.grid_size, self.cell_size)
+        grid_layer = GridLayer(self.grid_size, self.cell_size, self.registry)
         for index in range(len(self.grid)):
             grid_layer.grid[index].surface = self.grid[index].surface
+        grid_layer.tile_ids.array[...] = self.tile_ids.array
+        grid_layer._overflow = self._overflow
 
         return grid_layer
 
 
+class ChunkedGridLayer(GridLayer):
+    """
+    Grid layer for very large maps. The grid is split into fixed-size chunks. The cells of a chunk
+    are created when one of them is first updated, and the surface of a chunk is only materialized
+    while the viewport is near it. Materialized chunks far out of view are evicted in
+    least-recently-used order.
+
+    Each cell keeps the operations that drew its pixels, that is, the surfaces blitted by renders
+    and the wipes, so that a chunk materialized again replays them in the order they were done
+    and holds the same pixels as a grid layer that was never evicted.
+    """
+
+    class Cell(GridLayer.Cell):
+        """
+        Grid cell that keeps the operations on its pixels.
+        """
+
+        def __init__(self, coordinate: Tuple[int, int]):
+            super().__init__(coordinate)
+
+            # The operations on the pixels of this cell in the order they were done; each is
+            # (sequence number, surface blitted or None for a wipe, alpha of a wipe)
+            self.operations: List[Tuple[int, Surface | None, int]] = []
+
+    class Chunk:
+        """
+        A rectangular block of cells with its own surface.
+        """
+
+        def __init__(self, position: Tuple[int, int], chunk_size: Size, cell_size: Size):
+            # The position of this chunk in the chunk grid
+            self.position: Tuple[int, int] = position
+
+            # The area (in pixels) this chunk covers in the layer
+            self.rect: Rect = Rect(
+                position[0] * chunk_size.width * cell_size.width,
+                position[1] * chunk_size.height * cell_size.height,
+                chunk_size.width * cell_size.width,
+                chunk_size.height * cell_size.height,
+            )
+
+            # Cells of this chunk, indexed row by row
+            origin = (position[0] * chunk_size.width, position[1] * chunk_size.height)
+            self.cells: List[ChunkedGridLayer.Cell] = [
+                ChunkedGridLayer.Cell((origin[0] + col, origin[1] + row))
+                for row in range(chunk_size.height)
+                for col in range(chunk_size.width)
+            ]
+
+            # The surface of this chunk; None if it is not materialized
+            self.surface: Surface | None = None
+
+    def __init__(
+        self,
+        grid_size: Size,
+        cell_size: Size,
+        chunk_size: Size = Size(16, 16),
+        margin: int = 1,
+        max_chunks: int = 32,
+        registry: Registry | None = None,
+    ):
+        # Chunks own the pixels; the layer surface is an empty placeholder
+        Layer.__init__(self, Size(0, 0))
+        Observable.__init__(self)
+        self.size = grid_size * cell_size
+
+        # Grid size
+        self.grid_size: Size = grid_size
+
+        # The size of each cell
+        self.cell_size: Size = cell_size
+
+        # The number of cells in each chunk
+        self.chunk_size: Size = chunk_size
+
+        # Chunks within this many chunks of the viewport are materialized
+        self.margin: int = margin
+
+        # The maximum number of materialized chunks to keep
+        self.max_chunks: int = max_chunks
+
+        # The tile registry; None if cells hold no tile IDs
+        self.registry: Registry | None = registry
+
+        # The tile ID of each cell
+        self.tile_ids: ArrayGrid[int] = ArrayGrid(grid_size, np.int32, -1)
+
+        # A map from chunk positions to chunks that contain updated cells
+        self._chunks: Dict[Tuple[int, int], ChunkedGridLayer.Chunk] = {}
+
+        # Materialized chunks, from the least recently used to the most recently used
+        self._materialized: OrderedDict[Tuple[int, int], ChunkedGridLayer.Chunk] = OrderedDict()
+
+        # Updated cells; a dictionary is used as an ordered set, so that a cell updated several
+        # times is rendered once
+        self.updated_cells: Dict[ChunkedGridLayer.Cell, None] = {}
+
+        # How many chunks to the right and below the surface of a cell may stick out into
+        self._overflow: Tuple[int, int] = (0, 0)
+
+        # The sequence number of the last operation on the pixels of cells
+        self._sequence: int = 0
+
+    def _locate(self, coordinate: Tuple[int, int]) -> Tuple[Tuple[int, int], int]:
+        """
+        Locates a cell.
+        :param coordinate: The coordinate of the cell.
+        :return: The chunk position and the index of the cell within the chunk.
+        """
+        chunk_width, chunk_height = self.chunk_size.toTuple()
+        chunk_col, col = divmod(coordinate[0], chunk_width)
+        chunk_row, row = divmod(coordinate[1], chunk_height)
+
+        return (chunk_col, chunk_row), row * chunk_width + col
+
+    def get_cell(self, coordinate: Tuple[int, int]) -> GridLayer.Cell:
+        """
+        Retrieves a cell at a specified position. Cells in chunks that have never been updated
+        are empty and detached from the layer.
+        :param coordinate The coordinate of the cell.
+        :return: The cell located at the specified position in the grid.
+        """
+        position, index = self._locate(coordinate)
+        chunk = self._chunks.get(position)
+        if chunk is None:
+            return GridLayer.Cell(coordinate)
+
+        return chunk.cells[index]
+
+    def update_cell(self, coordinate: Tuple[int, int], surface: Surface | None) -> None:
+        """
+        Updates a cell at a specified position.
+        """
+        position, index = self._locate(coordinate)
+        cell = self._get_chunk(position).cells[index]
+        cell.surface = surface
+
+        self.updated_cells[cell] = None
+        self._update_tile_id(coordinate, surface)
+
+    def wipe_cell(self, coordinate: Tuple[int, int], alpha: int = 0) -> None:
+        """
+        Wipes a certain cell. The wipe is kept by the cell, so that it is replayed when the chunk
+        of the cell is materialized.
+        :param coordinate: The coordinate to wipe.
+        :param alpha:
+        """
+        position, index = self._locate(coordinate)
+        chunk = self._get_chunk(position)
+        cell = chunk.cells[index]
+
+        # The wipe covers the earlier operations of the cell, except for surfaces sticking out
+        self._sequence += 1
+        cell.operations = [
+            operation
+            for operation in cell.operations
+            if operation[1] is not None and self._is_overflowing(operation[1])
+        ]
+        cell.operations.append((self._sequence, None, alpha))
+
+        if chunk.surface is not None:
+            self._replay(chunk, [(coordinate, None, alpha)])
+
+    def iter_cells(self) -> Iterator[GridLayer.Cell]:
+        """
+        Iterates over the cells of chunks that have been updated.
+        """
+        width, height = self.grid_size.toTuple()
+        for chunk in self._chunks.values():
+            for cell in chunk.cells:
+                # Chunks on the edges may stick out of the grid
+                if cell.coordinate[0] < width and cell.coordinate[1] < height:
+                    yield cell
+
+    def render_all(self):
+        """
+        Renders all cells in this layer; clears the updated cells.
+        """
+        self.updated_cells = {}
+        cells = [cell for cell in self.iter_cells() if cell.surface is not None]
+        cells.sort(key=lambda _cell: (_cell.coordinate[1], _cell.coordinate[0]))
+        self._draw_cells(cells)
+
+    def render(self):
+        """
+        Renders the updated cells, materializes the chunks near the viewport, and evicts the least
+        recently used chunks beyond the budget.
+        """
+        self._draw_cells(self.updated_cells)
+        self.updated_cells = {}
+
+        chunk_width, chunk_height = (self.cell_size * self.chunk_size).toTuple()
+        viewport = self.get_viewport()
+        col_start = viewport.left // chunk_width - self.margin
+        col_end = -(-viewport.right // chunk_width) + self.margin
+        row_start = viewport.top // chunk_height - self.margin
+        row_end = -(-viewport.bottom // chunk_height) + self.margin
+
+        num_near_chunks = 0
+        for position, chunk in self._chunks.items():
+            if col_start <= position[0] < col_end and row_start <= position[1] < row_end:
+                if chunk.surface is None:
+                    self._materialize(chunk)
+                self._materialized[position] = chunk
+                self._materialized.move_to_end(position)
+                num_near_chunks += 1
+
+        # Evict the least recently used chunks; chunks near the viewport are never evicted
+        num_evictable = len(self._materialized) - num_near_chunks
+        while len(self._materialized) > self.max_chunks and num_evictable > 0:
+            _, chunk = self._materialized.popitem(last=False)
+            chunk.surface = None
+            num_evictable -= 1
+
+    def draw(self, screen: Surface) -> None:
+        """
+        Blits the visible area of each materialized chunk on the screen.
+        :param screen: The screen to blit.
+        """
+        if self.hidden:
+            return
+
+        viewport = self.get_viewport()
+        crop_pos = Vector2(0, 0) if self.rect is None else Vector2(self.rect.topleft)
+        for chunk in self._materialized.values():
+            area = chunk.rect.clip(viewport)
+            if area.width > 0 and area.height > 0:
+                dest = self.offset + Vector2(area.topleft) - crop_pos
+                screen.blit(chunk.surface, dest, area.move(-chunk.rect.x, -chunk.rect.y))
+
+    def clone(self) -> "ChunkedGridLayer":
+        """
+        Returns a deep copy of this grid layer. The copy keeps the operations of cells, so that
+        its chunks are materialized with the same pixels.
+        """
+        grid_layer = ChunkedGridLayer(
+            self.grid_size,
+            self.cell_size,
+            self.chunk_size,
+            self.margin,
+            self.max_chunks,
+            self.registry,
+        )
+        for position, chunk in self._chunks.items():
+            cloned_chunk = grid_layer._get_chunk(position)
+            for cell, cloned_cell in zip(chunk.cells, cloned_chunk.cells):
+                cloned_cell.surface = cell.surface
+                cloned_cell.operations = list(cell.operations)
+                if cell in self.updated_cells:
+                    grid_layer.updated_cells[cloned_cell] = None
+        grid_layer.tile_ids.array[...] = self.tile_ids.array
+        grid_layer._overflow = self._overflow
+        grid_layer._sequence = self._sequence
+
+        return grid_layer
+
+    def _draw_cells(self, cells: Iterable["ChunkedGridLayer.Cell"]) -> None:
+        """
+        Draws the surfaces of cells in order; the blits are kept by the cells and done on the
+        materialized chunks they cover.
+        """
+        operations_by_chunk: Dict[
+            ChunkedGridLayer.Chunk, List[Tuple[Tuple[int, int], Surface | None, int]]
+        ] = {}
+        for cell in cells:
+            surface = cell.surface
+            if surface is None:
+                continue
+
+            self._sequence += 1
+            cell.operations.append((self._sequence, surface, 0))
+
+            # Chunks the surface sticks out into have to exist to be materialized and drawn
+            self._update_overflow(surface)
+            for position in self._get_covered_positions(cell.coordinate, surface):
+                chunk = self._get_chunk(position)
+                if chunk.surface is not None:
+                    operation = (cell.coordinate, surface, 0)
+                    operations_by_chunk.setdefault(chunk, []).append(operation)
+
+        for chunk, operations in operations_by_chunk.items():
+            self._replay(chunk, operations)
+
+    def _materialize(self, chunk: "ChunkedGridLayer.Chunk") -> None:
+        """
+        Creates the surface of a chunk and replays the operations on it in order, including the
+        blits of the cells of the chunks on the left and above whose surfaces stick out into it.
+        """
+        chunk.surface = Surface(chunk.rect.size, pygame.SRCALPHA)
+
+        operations: List[Tuple[int, Tuple[int, int], Surface | None, int]] = []
+        col, row = chunk.position
+        overflow_cols, overflow_rows = self._overflow
+        for neighbour_row in range(row - overflow_rows, row + 1):
+            for neighbour_col in range(col - overflow_cols, col + 1):
+                neighbour = self._chunks.get((neighbour_col, neighbour_row))
+                if neighbour is None:
+                    continue
+
+                for cell in neighbour.cells:
+                    for sequence, surface, alpha in cell.operations:
+                        # Wipes do not stick out of their cells
+                        if surface is not None or neighbour is chunk:
+                            operations.append((sequence, cell.coordinate, surface, alpha))
+
+        operations.sort(key=lambda _operation: _operation[0])
+        self._replay(chunk, [operation[1:] for operation in operations])
+
+    def _replay(
+        self,
+        chunk: "ChunkedGridLayer.Chunk",
+        operations: List[Tuple[Tuple[int, int], Surface | None, int]],
+    ) -> None:
+        """
+        Does operations on a materialized chunk in order; consecutive blits are batched.
+        :param chunk: The chunk.
+        :param operations: The operations, each (coordinate, surface blitted or None for a wipe,
+        alpha of a wipe).
+        """
+        blit_sequence: List[Tuple[Surface, Tuple[int, int], Rect]] = []
+        for coordinate, surface, alpha in operations:
+            rect = self._get_cell_rect(coordinate)
+            if surface is None:
+                chunk.surface.blits(blit_sequence, doreturn=False)
+                blit_sequence = []
+                chunk.surface.fill((0, 0, 0, alpha), rect.move(-chunk.rect.x, -chunk.rect.y))
+                self.damaged_rects.append(rect)
+                continue
+
+            page, area = Atlas.locate(surface)
+            blit_sequence.append((page, (rect.x - chunk.rect.x, rect.y - chunk.rect.y), area))
+            self.damaged_rects.append(Rect(rect.topleft, area.size).clip(chunk.rect))
+
+        chunk.surface.blits(blit_sequence, doreturn=False)
+
+    def _is_overflowing(self, surface: Surface) -> bool:
+        """
+        Tests whether a surface is larger than a cell.
+        """
+        cell_width, cell_height = self.cell_size.toTuple()
+
+        return surface.get_width() > cell_width or surface.get_height() > cell_height
+
+    def _update_overflow(self, surface: Surface) -> None:
+        """
+        Widens the overflow range so that it covers a surface larger than a cell.
+        """
+        chunk_width, chunk_height = (self.cell_size * self.chunk_size).toTuple()
+        overflow_width = surface.get_width() - self.cell_size.width
+        overflow_height = surface.get_height() - self.cell_size.height
+        self._overflow = (
+            max(self._overflow[0], -(-overflow_width // chunk_width)),
+            max(self._overflow[1], -(-overflow_height // chunk_height)),
+        )
+
+    def _get_chunk(self, position: Tuple[int, int]) -> "ChunkedGridLayer.Chunk":
+        """
+        Returns the chunk at a specified position, creating it if it does not exist.
+        """
+        chunk = self._chunks.get(position)
+        if chunk is None:
+            chunk = ChunkedGridLayer.Chunk(position, self.chunk_size, self.cell_size)
+            self._chunks[position] = chunk
+
+        return chunk
+
+    def _get_covered_positions(
+        self, coordinate: Tuple[int, int], surface: Surface
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns the positions of the chunks covered by a surface blitted on a cell.
+        """
+        rect = Rect(self._get_cell_rect(coordinate).topleft, surface.get_size())
+        chunk_width, chunk_height = (self.cell_size * self.chunk_size).toTuple()
+
+        return [
+            (col, row)
+            for row in range(rect.top // chunk_height, (rect.bottom - 1) // chunk_height + 1)
+            for col in range(rect.left // chunk_width, (rect.right - 1) // chunk_width + 1)
+        ]
+
+    def _get_cell_rect(self, coordinate: Tuple[int, int]) -> Rect:
+        """
+        Returns the rectangle of a cell in the layer.
+        """
+        cell_width, cell_height = self.cell_size.toTuple()
+
+        return Rect(
+            coordinate[0] * cell_width, coordinate[1] * cell_height, cell_width, cell_height
+        )
+
+
 class Display:
     """
     Game display.
     """
 
-    def __init__(self, window_size: Size, background: str):
+    # When more damaged rectangles than this remain after merging, the whole screen is updated
+    MAX_UPDATED_RECTS = 32
+
+    def __init__(
+        self,
+        window_size: Size,
+        background: str,
+        dirty_rect: bool = False,
+        profiler: Profiler | None = None,
+    ):
         # Size
         self.size = window_size
 
@@ -195,6 +811,21 @@ class Display:
         # A map from layer names to layers
         self._by_name: Dict[str, Layer] = {}
 
+        # A map from layers to their names
+        self._names: Dict[Layer, str] = {}
+
+        # Whether only the damaged areas of the screen are recomposited and presented each frame
+        self.dirty_rect: bool = dirty_rect
+
+        # Screen areas to recomposite regardless of layer damage; the first frame is a full redraw
+        self._damaged_rects: List[Rect] = [self.screen.get_rect()]
+
+        # Screen areas recomposited in the last frame
+        self.updated_rects: List[Rect] = []
+
+        # The profiler to record the time of each layer and of flips
+        self.profiler: Profiler | None = profiler
+
     def unshift_layer(self, name: str, layer: Layer):
         """
         Unshifts a layer to the layer stack.
@@ -203,6 +834,7 @@ class Display:
         """
         self.layer_stack.insert(0, layer)
         self._by_name[name] = layer
+        self._names[layer] = name
 
     def append_layer(self, name: str, layer: Layer) -> None:
         """
@@ -212,6 +844,7 @@ class Display:
         """
         self.layer_stack.append(layer)
         self._by_name[name] = layer
+        self._names[layer] = name
 
     def set_layer(self, name: str, layer: Layer) -> None:
         """
@@ -221,6 +854,13 @@ class Display:
         """
         original_layer = self._by_name[name]
         self._by_name[name] = layer
+        self._names.pop(original_layer, None)
+        self._names[layer] = name
+
+        # The area covered by the replaced layer has to be recomposited
+        composited_rect = original_layer.reset_composition()
+        if composited_rect is not None:
+            self._damaged_rects.append(composited_rect)
 
         for index in range(len(self.layer_stack)):
             if original_layer == self.layer_stack[index]:
@@ -242,19 +882,106 @@ class Display:
         """
         return self.screen.get_width() // 2, self.screen.get_height() // 2
 
+    def damage(self, rect: Optional[Rect] = None) -> None:
+        """
+        Forces an area of the screen to be recomposited in the next frame.
+        :param rect: The area to recomposite; None recomposites the whole screen.
+        """
+        self._damaged_rects.append(self.screen.get_rect() if rect is None else Rect(rect))
+
     def render(self):
         """
         Renders the screen by drawing layers from bottom to top, ensuring that each subsequent
         layer covers the previous ones.
         """
-        self.screen.fill(self.background)
+        profiler = self.profiler
+        if profiler is not None and not profiler.enabled:
+            profiler = None
+
+        if not self.dirty_rect:
+            self.screen.fill(self.background)
 
+            # Damage is not tracked in this mode
+            for layer in self.layer_stack:
+                start = 0 if profiler is None else profiler.now()
+                layer.display(self.screen)
+                layer.reset_composition()
+                if profiler is not None:
+                    profiler.record(self._names.get(layer, "?"), "layer", start)
+            return
+
+        # Dirty rectangle mode: only recomposite the areas damaged since the last frame
         for layer in self.layer_stack:
-            layer.display(self.screen)
+            start = 0 if profiler is None else profiler.now()
+            layer.render()
+            if profiler is not None:
+                profiler.record(self._names.get(layer, "?"), "layer", start)
+
+        start = 0 if profiler is None else profiler.now()
+
+        damaged_rects = self._damaged_rects
+        for layer in self.layer_stack:
+            damaged_rects.extend(layer.pop_screen_damage())
+        self._damaged_rects = []
+
+        self.updated_rects = self._merge_rects(damaged_rects)
+        for rect in self.updated_rects:
+            self.screen.set_clip(rect)
+            self.screen.fill(self.background, rect)
+            for layer in self.layer_stack:
+                layer.draw(self.screen)
+        self.screen.set_clip(None)
 
-    @staticmethod
-    def flip() -> None:
+        if profiler is not None:
+            profiler.record("composite", "display", start)
+
+    def skip_frame(self) -> None:
+        """
+        Discards the changes of the current frame without rendering them. The next rendered frame
+        is a full redraw.
         """
-        Flips the display.
+        for layer in self.layer_stack:
+            layer.reset_composition()
+        self._damaged_rects = [self.screen.get_rect()]
+
+    def _merge_rects(self, rects: List[Rect]) -> List[Rect]:
         """
-        pygame.display.flip()
+        Clips rectangles to the screen and merges overlapping ones, so that no area is
+        recomposited twice in a frame.
+        :param rects: The rectangles to merge.
+        """
+        screen_rect = self.screen.get_rect()
+        merged: List[Rect] = []
+        for rect in rects:
+            rect = rect.clip(screen_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
+
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        if len(merged) > Display.MAX_UPDATED_RECTS:
+            return [merged[0].unionall(merged[1:])]
+
+        return merged
+
+    def flip(self) -> None:
+        """
+        Flips the display. In dirty rectangle mode, only the areas recomposited in the last frame
+        are presented.
+        """
+        profiler = self.profiler
+        if profiler is not None and not profiler.enabled:
+            profiler = None
+
+        start = 0 if profiler is None else profiler.now()
+        if not self.dirty_rect:
+            pygame.display.flip()
+        elif self.updated_rects:
+            pygame.display.update(self.updated_rects)
+
+        if profiler is not None:
+            profiler.record("flip", "display", start)
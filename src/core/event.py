@@ -1,13 +1,15 @@
 """
 Event module.
 """
-from typing import Callable, Dict, List
+from types import MappingProxyType
+from typing import Callable, Dict, List, Tuple, Any, Mapping
 import inspect
 
 import pygame
 from pygame.event import Event
 
 from src.core.context import Context
+from src.core.profiler import Profiler
 
 
 class EventListener:
@@ -22,21 +24,19 @@ class EventListener:
         # The callback function to invoke when the event occurs
         self._callback = callback
 
+        # The name of this listener in profiles
+        self.name: str = getattr(callback, "__name__", repr(callback))
+
         # The number of parameters in the callback function
         self._callback_param_len = len(inspect.signature(callback).parameters)
 
         if self._callback_param_len > 1:
             raise Exception("The callback function should have either zero or one parameter.")
 
-    def invoke(self, context: Context):
-        """
-        Invokes the callback function.
-        :param context: The game context.
-        """
-        if self._callback_param_len == 0:
-            self._callback()
-        else:
-            self._callback(context)
+        # The function that takes the game context and invokes the callback function
+        self.invoke: Callable[[Context], None] = (
+            callback if self._callback_param_len == 1 else lambda context: callback()
+        )
 
 
 class EventManager:
@@ -44,12 +44,26 @@ class EventManager:
     An event manager serves as an observer that actively monitors all game events. Upon the
     occurrence of a game event, the corresponding callback functions within the registered event
     listeners are invoked.
+
+    Input events come from the Pygame event queue, while the game dispatches its own events, such
+    as the phases of a frame, directly to the listeners without going through the queue.
     """
 
-    def __init__(self):
+    # The event data of events without data; it is read-only, as it is shared by all events
+    EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+    def __init__(self, profiler: Profiler | None = None):
         # A mapping from event types to lists of event listeners
         self._event_listener_map: Dict[int, List[EventListener]] = {}
 
+        # A mapping from event types to the names and invoke functions of their listeners; it is
+        # rebuilt when a listener is registered, so dispatching does not look up the listeners,
+        # and listeners registered during a dispatch are not invoked by it
+        self._invoke_map: Dict[int, Tuple[Tuple[str, Callable[[Context], None]], ...]] = {}
+
+        # The profiler to record the time of each listener
+        self.profiler: Profiler | None = profiler
+
     def register(self, event_listener: EventListener) -> EventListener:
         """
         Registers an event listener.
@@ -62,6 +76,9 @@ class EventManager:
             self._event_listener_map[event_type] = []
 
         self._event_listener_map[event_type].append(event_listener)
+        self._invoke_map[event_type] = tuple(
+            (listener.name, listener.invoke) for listener in self._event_listener_map[event_type]
+        )
 
         return event_listener
 
@@ -76,18 +93,40 @@ class EventManager:
         """
         return self.register(EventListener(event_type, callback))
 
+    def dispatch(self, event_type: int, context: Context, data: Dict | None = None) -> None:
+        """
+        Dispatches an event directly to the registered event listeners.
+        :param event_type: The type of the event to dispatch.
+        :param context: The game context.
+        :param data: Extra data associated with the event, if applicable.
+        """
+        invokes = self._invoke_map.get(event_type)
+        if invokes is None:
+            return
+
+        # The event data of an event dispatched by a listener is restored once it is done
+        previous_data = context.event_data
+        context.event_data = EventManager.EMPTY_DATA if data is None else data
+
+        profiler = self.profiler
+        if profiler is None or not profiler.enabled:
+            for _, invoke in invokes:
+                invoke(context)
+        else:
+            for name, invoke in invokes:
+                start = profiler.now()
+                invoke(context)
+                profiler.record(name, "listener", start)
+
+        context.event_data = previous_data
+
     def trigger(self, event: Event, context: Context):
         """
         Triggers an event, invoking registered event listeners.
         :param event: The event to trigger.
         :param context: The game context.
         """
-        event_listener_list = self._event_listener_map.get(event.type)
-
-        if event_listener_list is not None:
-            for event_listener in event_listener_list:
-                context.event_data = event.dict
-                event_listener.invoke(context)
+        self.dispatch(event.type, context, event.dict)
 
     def trigger_all(self, context: Context):
         """
@@ -96,7 +135,7 @@ class EventManager:
         """
         events = pygame.event.get()
         for event in events:
-            self.trigger(event, context)
+            self.dispatch(event.type, context, event.dict)
 
     @staticmethod
     def create_event(event_type: int, data: Dict | None = None) -> Event:
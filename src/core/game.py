@@ -1,15 +1,17 @@
 """
 Game module.
 """
+import os
+
 import pygame
 
 from .display import Display
 from .event import EventManager
 from .loop import LoopManager
+from .profiler import Profiler
 from .settings import Settings
 from .context import Context
 from .constant import EventTypes
-from src.world.data.registries import Registries
 
 
 class Game:
@@ -24,18 +26,35 @@ class Game:
         # Game context
         self.context: Context = Context(self)
 
+        # Game profiler
+        self.profiler: Profiler = Profiler(self.settings.profiler_window)
+        self.profiler.enabled = self.settings.profiler
+
         # Game event manager
-        self.event_manager: EventManager = EventManager()
+        self.event_manager: EventManager = EventManager(self.profiler)
+
+        # Headless mode runs without a window or an audio device
+        if self.settings.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
 
         # Game display
-        self.display: Display = Display(self.settings.display_window_size, self.settings.background)
+        self.display: Display = Display(
+            self.settings.display_window_size,
+            self.settings.background,
+            self.settings.display_dirty_rect,
+            self.profiler,
+        )
 
         # Game loop manager
-        self.loop_manager: LoopManager = LoopManager()
+        self.loop_manager: LoopManager = LoopManager(self.profiler)
 
         # Whether the game is running
         self.running: bool = True
 
+        # Time in milliseconds that has passed but has not been simulated yet
+        self._accumulator: float = 0
+
     def init(self):
         """
         Initializes the game.
@@ -46,30 +65,97 @@ class Game:
         # Window
         pygame.display.set_caption(self.settings.display_window_caption)
 
+        # The world is loaded once the display exists, so that tiles and sprites are converted to
+        # the display pixel format when they are registered
+        from src.world.data.registries import Registries
+
         # Register all events to event manager
         for ref in Registries.EventListener.get_ref_list():
             event_listener = ref.res
             self.event_manager.register(event_listener)
 
         # Triggers on-start events
-        self.event_manager.trigger(EventManager.create_event(EventTypes.ON_START), self.context)
+        self.event_manager.dispatch(EventTypes.ON_START, self.context)
 
         # white
         self.display.screen.fill("white")
 
     def run(self):
         """
-        Starts the game loop. The game loop will never stop until users quit this game.
+        Starts the game loop. The game loop will never stop until users quit this game. In
+        headless mode, frames are neither rendered nor presented, and the game runs as fast as
+        possible with a fixed delta time.
         """
         clock = pygame.time.Clock()
+        headless = self.settings.headless
         while self.running:
-            EventManager.post(EventTypes.BEFORE_RENDER)
-            self.event_manager.trigger_all(self.context)
+            self._frame(self.context.dt, not headless, not headless)
+
+            if headless:
+                self.context.dt = self.settings.headless_dt
+            else:
+                self.context.dt = round(clock.tick(self.settings.fps))
+
+        if self.profiler.enabled and self.settings.profiler_trace_file is not None:
+            self.profiler.export_chrome_trace(self.settings.profiler_trace_file)
+
+    def step(self, dt: int, render: bool = False) -> None:
+        """
+        Advances the game by one frame without presenting it; loops, events and the character
+        are updated as if the frame took the given time.
+        :param dt: The delta time in milliseconds.
+        :param render: Whether to render the frame on the screen surface.
+        """
+        self._frame(dt, render, False)
+
+    def _frame(self, dt: int, render: bool, present: bool) -> None:
+        """
+        Runs a frame. Input events are handled first, then the game is simulated in fixed steps
+        for the time of the frame, and the frame is rendered once, interpolated between the last
+        two steps.
+        :param dt: The delta time of the frame in milliseconds.
+        :param render: Whether to render the frame on the screen surface.
+        :param present: Whether to present the rendered frame.
+        """
+        profiler = self.profiler if self.profiler.enabled else None
+        start = 0 if profiler is None else profiler.now()
+        self.event_manager.trigger_all(self.context)
+
+        self._simulate(dt)
+        self.event_manager.dispatch(EventTypes.BEFORE_RENDER, self.context)
 
+        if render:
             self.display.render()
+        else:
+            self.display.skip_frame()
+
+        if present:
             self.display.flip()
 
-            after_render_event = EventManager.create_event(EventTypes.AFTER_RENDER)
-            self.event_manager.trigger(after_render_event, self.context)
+        self.event_manager.dispatch(EventTypes.AFTER_RENDER, self.context)
+
+        if profiler is not None:
+            profiler.record("frame", "game", start)
 
-            self.context.dt = round(clock.tick(self.settings.fps))
+    def _simulate(self, dt: int) -> None:
+        """
+        Runs the simulation steps that fit in the time passed, and sets the interpolation factor
+        of the frame to the fraction of a step that is left. Time that exceeds the maximum number
+        of steps is carried into the following frames.
+        :param dt: The time passed in milliseconds.
+        """
+        step_dt = self.settings.simulation_dt
+        self._accumulator += dt
+        self.context.dt = step_dt
+
+        num_steps = 0
+        while self._accumulator >= step_dt and num_steps < self.settings.simulation_max_steps:
+            self.event_manager.dispatch(EventTypes.SIMULATE, self.context)
+            self._accumulator -= step_dt
+            num_steps += 1
+        self.context.dt = dt
+
+        # Carry the time that does not fit, up to the maximum lag; a frame that is behind renders
+        # the last step
+        self._accumulator = min(self._accumulator, self.settings.simulation_max_lag)
+        self.context.alpha = min(self._accumulator / step_dt, 1)
@@ -1,17 +1,46 @@
 """
 Loop module.
 """
-from typing import Callable, List
+import heapq
+import itertools
+from typing import Callable, List, Dict, Tuple, Optional, Any
 
 from src.core.common import CallbackNode
+from src.core.profiler import Profiler
 
 
 class Loop:
     """
-    A frame-based loop that triggers a callback at specified intervals.
+    A frame-based loop that triggers a callback at specified intervals. Loops are driven by the
+    loop manager they are registered with.
     """
 
-    def __init__(self, fps: float, count_per_period: int, callback: Callable[[int], None]):
+    class Policy:
+        """
+        What a loop does when several counts are due in one update, such as after a long frame.
+        """
+
+        # Triggers one count per update; the loop lags behind real time after a long frame
+        Lag = 0
+
+        # Triggers all due counts, so that the loop keeps up with real time
+        CatchUp = 1
+
+        # Triggers the latest due count once; the callback also receives the number of skipped
+        # counts as a second argument
+        Coalesce = 2
+
+        # Triggers the latest due count once; skipped counts are lost
+        Drop = 3
+
+    def __init__(
+        self,
+        fps: float,
+        count_per_period: int,
+        callback: Callable[[int], None] | Callable[[int, int], None],
+        name: str | None = None,
+        policy: int = Policy.Lag,
+    ):
         # Frame per second, or count per second
         self.fps: float = fps
 
@@ -19,84 +48,243 @@ class Loop:
         self.count_per_period: int = count_per_period
 
         # Callback function to be triggered
-        self.callback: Callable[[int], None] = callback
+        self.callback: Callable[..., None] = callback
+
+        # What this loop does when several counts are due in one update; coalescing and dropping
+        # loops never skip the last count of a period
+        self.policy: int = policy
 
         # Time in milliseconds for one count
         self.each_count_time: float = 1000 / fps
 
-        # Time elapsed since the last update
-        self.elapsed_time: float = 0
-
         # Current count
         self.current_count: int = -1
 
-        # Whether it is paused
-        self.paused: bool = False
+        # The name of this loop in profiles
+        self.name: str = name or getattr(callback, "__qualname__", repr(callback))
 
-    def update(self, dt: float) -> None:
+        # The loop manager this loop is registered with
+        self._manager: Optional["LoopManager"] = None
+
+        # The time of the loop manager when the elapsed time of this loop was zero
+        self._origin: float = 0
+
+        # The time of the loop manager when this loop was paused; None if it is not paused
+        self._paused_at: float | None = None
+
+        # The sequence number of the live entry of this loop in the queue; None if this loop is
+        # not queued
+        self._seq: int | None = None
+
+        # The registration number of this loop; loops due in the same update fire in this order
+        self._order: int = 0
+
+    @property
+    def elapsed_time(self) -> float:
         """
-        Update the frame-based loop. The callback is triggered at each count.
-        :param dt: The delta time.
+        Time elapsed since the last reset.
         """
-        self.elapsed_time += dt
+        if self._manager is None:
+            return 0
+
+        now = self._manager.time if self._paused_at is None else self._paused_at
+        return now - self._origin
 
-        if self.elapsed_time < (self.current_count + 1) * self.each_count_time:
+    @property
+    def paused(self) -> bool:
+        """
+        Whether it is paused. A paused loop does not advance.
+        """
+        return self._paused_at is not None
+
+    @paused.setter
+    def paused(self, paused: bool) -> None:
+        if paused == self.paused or self._manager is None:
             return
 
-        self.current_count += 1
-        if self.current_count >= self.count_per_period:
-            self.reset()
+        if paused:
+            self._paused_at = self._manager.time
+            self._seq = None
+        else:
+            self._origin += self._manager.time - self._paused_at
+            self._paused_at = None
+            self._manager.schedule(self)
+
+    def get_deadline(self, num_counts: int = 1) -> float:
+        """
+        Returns the time of the loop manager when a count is due.
+        :param num_counts: The number of counts after the current one; 1 is the next count.
+        """
+        return self._origin + (self.current_count + num_counts) * self.each_count_time
 
-        self.callback(self.current_count)
+    def fire(self) -> None:
+        """
+        Advances this loop and triggers the callback according to the policy.
+        """
+        if self.policy == Loop.Policy.Lag:
+            self._advance(1)
+            self.callback(self.current_count)
+        elif self.policy == Loop.Policy.CatchUp:
+            self._advance(1)
+            self.callback(self.current_count)
+            while self._is_pending() and self.get_deadline() <= self._manager.time:
+                self._advance(1)
+                self.callback(self.current_count)
+        else:
+            skipped = self._advance(self._get_num_due_counts()) - 1
+            if self.policy == Loop.Policy.Coalesce:
+                self.callback(self.current_count, skipped)
+            else:
+                self.callback(self.current_count)
+
+    def _advance(self, num_counts: int) -> int:
+        """
+        Advances this loop by a number of counts, stopping at the end of a period; the period
+        wraps when the loop advances from its last count.
+        :param num_counts: The number of counts to advance by.
+        :return: The number of counts advanced by.
+        """
+        if self.current_count + 1 >= self.count_per_period:
+            # Catching up loops wrap at the deadline to stay in time; the others start over now
+            if self.policy == Loop.Policy.CatchUp:
+                self._origin += self.count_per_period * self.each_count_time
+            else:
+                self._origin = self._manager.time
+            self.current_count = 0
+            return 1
+
+        last_count = min(self.current_count + num_counts, self.count_per_period - 1)
+        num_counts = last_count - self.current_count
+        self.current_count = last_count
+
+        return num_counts
+
+    def _get_num_due_counts(self) -> int:
+        """
+        Returns the number of counts that are due, which is at least one.
+        """
+        now = self._manager.time
+        num_counts = max(1, int((now - self.get_deadline()) // self.each_count_time) + 1)
+
+        # Correct the rounding errors of the division
+        while self.get_deadline(num_counts + 1) <= now:
+            num_counts += 1
+        while num_counts > 1 and self.get_deadline(num_counts) > now:
+            num_counts -= 1
+
+        return num_counts
+
+    def _is_pending(self) -> bool:
+        """
+        Whether this loop is still registered and was neither reset nor paused by its callback.
+        """
+        return self._seq is None and self._paused_at is None and self in self._manager
 
     def reset(self) -> None:
         """
         Resets this loop.
         """
-        self.elapsed_time = 0
         self.current_count = 0
+        if self._manager is not None:
+            self._origin = self._manager.time
+            if self._paused_at is None:
+                self._manager.schedule(self)
+            else:
+                self._paused_at = self._origin
 
 
 class LoopManager:
     """
-    Loop manager.
+    Loop manager. The deadlines of loops are kept in a priority queue, so that each frame only
+    the loops that are due are visited.
     """
 
-    def __init__(self):
-        # A list of loops
-        self._loops: List[Loop] = []
+    def __init__(self, profiler: Profiler | None = None):
+        # Registered loops in the order of registration
+        self._loops: Dict[Loop, None] = {}
+
+        # A priority queue of (deadline, sequence number, loop); an entry is stale if the
+        # sequence number is not the one of the loop
+        self._queue: List[Tuple[float, int, Loop]] = []
+
+        # Sequence numbers of queue entries and registration numbers of loops
+        self._seq_counter = itertools.count()
+        self._order_counter = itertools.count()
 
-    def loop(self, fps: float, count_per_period: int, callback: Callable[[int], None]) -> Loop:
+        # Time in milliseconds accumulated by updates
+        self.time: float = 0
+
+        # The time at the start of the update being dispatched; None if no update is dispatched
+        self._frame_start: float | None = None
+
+        # The profiler to record the time of each loop callback
+        self.profiler: Profiler | None = profiler
+
+    def __len__(self) -> int:
+        return len(self._loops)
+
+    def __contains__(self, loop: Loop) -> bool:
+        return loop in self._loops
+
+    def loop(
+        self,
+        fps: float,
+        count_per_period: int,
+        callback: Callable[[int], None] | Callable[[int, int], None],
+        name: str | None = None,
+        policy: int = Loop.Policy.Lag,
+    ) -> Loop:
         """
         Registers a loop.
         :param fps: Frame per second, or count per second.
         :param count_per_period: Number of counts per period.
         :param callback: Callback function to be called.
+        :param name: The name of the loop in profiles; defaults to the name of the callback.
+        :param policy: What the loop does when several counts are due in one update.
+        :return: The loop registered.
+        """
+        return self.add(Loop(fps, count_per_period, callback, name, policy))
+
+    def add(self, loop: Loop) -> Loop:
+        """
+        Registers a loop. The first count is triggered by the next update, or by the update
+        being dispatched if a loop callback registers the loop.
+        :param loop: The loop to register.
         :return: The loop registered.
         """
-        loop = Loop(fps, count_per_period, callback)
-        self._loops.append(loop)
+        loop._manager = self
+        loop._order = next(self._order_counter)
+        loop._origin = self.time if self._frame_start is None else self._frame_start
+        self._loops[loop] = None
+        self.schedule(loop)
 
         return loop
 
-    def once(self, fps: float, count_per_period: int, callback: Callable[[int], None]) -> Loop:
+    def once(
+        self,
+        fps: float,
+        count_per_period: int,
+        callback: Callable[[int], None] | Callable[[int, int], None],
+        policy: int = Loop.Policy.Lag,
+    ) -> Loop:
         """
         Registers a loop that will be deleted after one period.
         :param fps: Frames per second, or counts per second.
         :param count_per_period: Number of counts per period.
         :param callback: Callback function to be called when indices change.
+        :param policy: What the loop does when several counts are due in one update.
         :return: The once loop registered.
         """
 
-        def fn(index: int) -> None:
-            callback(index)
+        def fn(index: int, *args: Any) -> None:
+            callback(index, *args)
             if index == count_per_period - 1:
-                self._loops.remove(loop)
+                self.remove(loop)
 
-        loop = Loop(fps, count_per_period, fn)
-        self._loops.append(loop)
+        name = getattr(callback, "__qualname__", None)
+        loop = Loop(fps, count_per_period, fn, name, policy)
 
-        return loop
+        return self.add(loop)
 
     def delay(self, delay_ms: int, callback: Callable[[], None]) -> Loop:
         """
@@ -109,10 +297,9 @@ class LoopManager:
         def delay_fn(index: int) -> None:
             if index == 1:
                 callback()
-                self._loops.remove(loop)
+                self.remove(loop)
 
-        loop = self.loop(1000 / delay_ms, 2, delay_fn)
-        self._loops.append(loop)
+        loop = self.loop(1000 / delay_ms, 2, delay_fn, getattr(callback, "__qualname__", None))
 
         return loop
 
@@ -127,27 +314,83 @@ class LoopManager:
         def delay_fn(index: int) -> None:
             if index == 1:
                 callback_node.invoke()
-                self._loops.remove(loop)
+                self.remove(loop)
 
         loop = self.loop(1000 / delay_ms, 2, delay_fn)
-        self._loops.append(loop)
 
         return callback_node
 
     def remove(self, loop: Loop) -> None:
         """
-        Removes a loop from the list if it exists.
+        Removes a loop if it exists. Loops can be removed safely by loop callbacks.
         :param loop: The loop to remove.
         """
         if loop in self._loops:
-            self._loops.remove(loop)
+            del self._loops[loop]
+            loop._seq = None
+
+    def schedule(self, loop: Loop) -> None:
+        """
+        Queues a registered loop at its deadline, replacing its previous entry in the queue.
+        :param loop: The loop to queue.
+        """
+        if loop not in self._loops:
+            return
+
+        loop._seq = next(self._seq_counter)
+        heapq.heappush(self._queue, (loop.get_deadline(), loop._seq, loop))
+
+        # Drop stale entries once they outnumber the live ones
+        if len(self._queue) > 2 * len(self._loops) + 64:
+            self._queue[:] = [entry for entry in self._queue if entry[1] == entry[2]._seq]
+            heapq.heapify(self._queue)
 
     def update(self, dt: float) -> None:
         """
-        Updates all loops.
+        Updates all loops. Loops that are due are triggered in the order of registration; only
+        catching up loops trigger their callbacks more than once per update.
+        :param dt: The delta time.
         """
-        for loop in self._loops:
-            if loop.paused:
-                continue
+        self._frame_start = self.time
+        self.time += dt
+
+        queue = self._queue
+        fired: List[Loop] = []
+        try:
+            # Loops registered by loop callbacks may be due in the same update
+            while queue and queue[0][0] <= self.time:
+                due: List[Tuple[float, int, Loop]] = []
+                while queue and queue[0][0] <= self.time:
+                    entry = heapq.heappop(queue)
+                    if entry[1] == entry[2]._seq:
+                        due.append(entry)
+
+                due.sort(key=lambda _entry: _entry[2]._order)
+                for _, seq, loop in due:
+                    # Loops removed, reset or paused by earlier callbacks are skipped
+                    if loop._seq != seq:
+                        continue
+
+                    loop._seq = None
+                    self._fire(loop)
+                    fired.append(loop)
+        finally:
+            self._frame_start = None
+
+        # Fired loops are queued after dispatching, so that none is triggered twice
+        for loop in fired:
+            if loop._seq is None and loop._paused_at is None:
+                self.schedule(loop)
+
+    def _fire(self, loop: Loop) -> None:
+        """
+        Fires a loop and records the time of the callback.
+        """
+        profiler = self.profiler
+        if profiler is None or not profiler.enabled:
+            loop.fire()
+            return
 
-            loop.update(dt)
+        start = profiler.now()
+        loop.fire()
+        profiler.record(loop.name, "loop", start)
@@ -0,0 +1,107 @@
+"""
+Profiler module.
+"""
+import json
+import time
+from collections import deque
+from typing import Dict, Deque, List, Tuple, Any
+
+
+class Profiler:
+    """
+    An opt-in profiler that records the wall time of named sections, such as event listeners,
+    loop callbacks and layer rendering. It keeps a rolling window of samples for each section to
+    compute percentiles, and a bounded trace that can be exported in the Chrome trace format.
+    """
+
+    # Percentiles reported for each section
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window: int = 300, trace_size: int = 100_000):
+        # Whether sections are recorded
+        self.enabled: bool = False
+
+        # The number of recent samples kept for each section
+        self.window: int = window
+
+        # A map from section names to recent durations in milliseconds
+        self._samples: Dict[str, Deque[float]] = {}
+
+        # Recorded sections as (name, category, start, end) in seconds
+        self._trace: Deque[Tuple[str, str, float, float]] = deque(maxlen=trace_size)
+
+        # The time all trace timestamps are relative to
+        self._origin: float = time.perf_counter()
+
+    @staticmethod
+    def now() -> float:
+        """
+        Returns the current time in seconds; sections are measured with this clock.
+        """
+        return time.perf_counter()
+
+    def record(self, name: str, category: str, start: float) -> None:
+        """
+        Records a section that started at a given time and ends now.
+        :param name: The name of the section.
+        :param category: The category of the section, such as "listener" or "loop".
+        :param start: The start time of the section returned by now().
+        """
+        end = time.perf_counter()
+        key = f"{category}/{name}"
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+
+        samples.append((end - start) * 1000)
+        self._trace.append((name, category, start, end))
+
+    def get_percentiles(self, key: str) -> Tuple[float, ...]:
+        """
+        Returns the percentiles of the recent durations of a section.
+        :param key: The key of the section, which is "<category>/<name>".
+        :return: Durations in milliseconds at PERCENTILES.
+        """
+        samples = sorted(self._samples[key])
+        last = len(samples) - 1
+
+        return tuple(samples[round(last * percentile / 100)] for percentile in self.PERCENTILES)
+
+    def get_stats(self) -> List[Tuple[str, Tuple[float, ...]]]:
+        """
+        Returns the percentiles of all sections, from the slowest to the fastest at the highest
+        percentile.
+        :return: A list of (key, percentiles).
+        """
+        stats = [(key, self.get_percentiles(key)) for key in self._samples]
+        stats.sort(key=lambda stat: stat[1][-1], reverse=True)
+
+        return stats
+
+    def reset(self) -> None:
+        """
+        Discards all samples and the trace.
+        """
+        self._samples.clear()
+        self._trace.clear()
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Exports the trace as a JSON file that can be loaded in chrome://tracing or Perfetto.
+        :param path: The path of the file to write.
+        """
+        events: List[Dict[str, Any]] = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1_000_000,
+                "dur": (end - start) * 1_000_000,
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, category, start, end in self._trace
+        ]
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
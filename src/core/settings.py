@@ -21,13 +21,47 @@ class Settings:
             # Assets directory (absolute path)
             self.assets_dir = os.path.abspath(os.path.join(__file__, "../../../assets"))
 
-            # Frame per second
+            # Cache directory for baked assets (absolute path)
+            self.cache_dir = os.path.abspath(os.path.join(__file__, "../../../.cache"))
+
+            # Frame per second; frames are rendered at this rate, so a rate lower than the
+            # simulation rate renders less often than the game is simulated
             self.fps = 60
 
+            # Delta time in milliseconds of each fixed simulation step; each frame runs as many
+            # steps as fit in the time it took
+            self.simulation_dt = 16
+
+            # The maximum number of simulation steps per frame; the time that does not fit is
+            # carried into the following frames, so that a stall, such as loading a map, delays
+            # the game clock but does not lose time
+            self.simulation_max_steps = 8
+
+            # The maximum time in milliseconds carried into the following frames; the rest is
+            # dropped. A longer lag keeps the clock accurate after longer stalls, but the game
+            # runs faster than real time for longer while it catches up, and a game that is
+            # always slower than the simulation falls this far behind
+            self.simulation_max_lag = 5000
+
+            # Headless mode; the dummy video and audio drivers are used and frames are not presented
+            self.headless = False
+
+            # Delta time in milliseconds of each frame in headless mode
+            self.headless_dt = round(1000 / self.fps)
+
             # Debug mode
             self.debug = False
             # self.debug = True
 
+            # [Debug] profiler; records the time of listeners, loops, layers and flips
+            self.profiler = False
+
+            # [Debug] the number of recent samples percentiles are computed over
+            self.profiler_window = 300
+
+            # [Debug] the file to export the profiler trace to when the game quits
+            self.profiler_trace_file: str | None = None
+
             # [Display] Window caption
             self.display_window_caption = "Wildtrace Farm"
 
@@ -37,6 +71,9 @@ class Settings:
             # [Display] Default display background
             self.background = "#333333"
 
+            # [Display] Only recomposite and present the damaged areas of the screen each frame
+            self.display_dirty_rect = True
+
             # [Display] tile scale factor
             self.display_tile_scale_factor = 3
 
@@ -50,6 +87,24 @@ class Settings:
                 16 * self.display_tile_scale_factor, 16 * self.display_tile_scale_factor
             )
 
+            # [Display] page size of texture atlases
+            self.display_atlas_page_size = Size(1024, 1024)
+
+            # [Display] the maximum size of cached text surfaces in bytes
+            self.text_cache_max_bytes = 4 * 1024 * 1024
+
+            # [Map] maps with at least this many cells use chunked layers
+            self.map_chunked_min_cells = 32 * 32
+
+            # [Map] chunk size of chunked layers; how many cells does a chunk contain
+            self.map_chunk_size = Size(16, 16)
+
+            # [Map] chunks within this many chunks of the camera are materialized
+            self.map_chunk_margin = 1
+
+            # [Map] the maximum number of materialized chunks per layer
+            self.map_max_chunks = 32
+
             # [Character] animation fps
             self.character_animation_fps = 10
 
@@ -0,0 +1,68 @@
+"""
+Surface pool module.
+"""
+from typing import Dict, List, Tuple
+
+import pygame
+from pygame import Surface
+
+# A key of pooled surfaces, which is (width, height, flags)
+PoolKey = Tuple[int, int, int]
+
+
+class SurfacePool:
+    """
+    A pool of transient work surfaces keyed by size and flags. Surfaces released to the pool are
+    handed out again by later acquisitions of the same size and flags, so that rendering in a
+    steady state does not allocate surfaces.
+    """
+
+    # Surface flags that distinguish pooled surfaces
+    KEY_FLAGS = pygame.SRCALPHA
+
+    def __init__(self, max_surfaces_per_key: int = 4):
+        # The maximum number of idle surfaces kept for each key
+        self.max_surfaces_per_key: int = max_surfaces_per_key
+
+        # A map from keys to idle surfaces
+        self._idle: Dict[PoolKey, List[Surface]] = {}
+
+        # The number of surfaces allocated by this pool
+        self.num_allocations: int = 0
+
+    def acquire(self, size: Tuple[int, int], flags: int = 0) -> Surface:
+        """
+        Acquires a surface from this pool. The contents of the surface are undefined, so callers
+        should fill it before use.
+        :param size: The size of the surface.
+        :param flags: The flags of the surface, such as pygame.SRCALPHA.
+        :return: The surface.
+        """
+        idle = self._idle.get((int(size[0]), int(size[1]), flags & SurfacePool.KEY_FLAGS))
+        if idle:
+            return idle.pop()
+
+        self.num_allocations += 1
+        return Surface(size, flags)
+
+    def release(self, surface: Surface) -> None:
+        """
+        Returns a surface to this pool. The surface must not be used after being released, and
+        must not have a surface alpha or a color key set.
+        :param surface: The surface acquired from this pool.
+        """
+        width, height = surface.get_size()
+        key = (width, height, surface.get_flags() & SurfacePool.KEY_FLAGS)
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_surfaces_per_key:
+            idle.append(surface)
+
+    def clear(self) -> None:
+        """
+        Drops all idle surfaces.
+        """
+        self._idle.clear()
+
+
+# The surface pool shared by all modules
+surface_pool: SurfacePool = SurfacePool()
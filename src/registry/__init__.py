@@ -2,6 +2,7 @@
 Registry library.
 """
 from .builtin import *
+from .path_trie import *
 from .ref import *
 from .registry import *
 from .res import *
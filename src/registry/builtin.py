@@ -1,7 +1,7 @@
 """
 Registry builtin module.
 """
-from typing import cast
+from typing import cast, Optional
 
 from .res import ResKey, ResLocBuilder, ResLoc
 from .registry import Registry
@@ -74,3 +74,12 @@ class RegistryUtil:
                 registry_key.loc, Registry(registry_key)
             ),
         )
+
+    @staticmethod
+    def prewarm(namespace: Optional[str] = None) -> None:
+        """
+        Creates all lazy resources in a namespace across all registries.
+        :param namespace: The namespace of the resources to create; None creates all.
+        """
+        for ref in RegistryBuiltin.ROOT_REGISTRY.get_ref_list():
+            cast(Registry, ref.res).prewarm(namespace)
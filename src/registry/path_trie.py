@@ -0,0 +1,55 @@
+"""
+Path trie module.
+"""
+from typing import Dict, List
+
+from .ref import Ref
+
+
+class PathTrie:
+    """
+    A trie over the paths of resource locations. Paths are split into segments by slashes, and
+    each node keeps the references of all paths under it, so that the references under a prefix
+    are found by walking the segments of the prefix only.
+    """
+
+    _SEPARATOR = "/"
+
+    def __init__(self):
+        # Child nodes by path segment
+        self.children: Dict[str, PathTrie] = {}
+
+        # References of all paths under this node, in the order they were added
+        self.refs: List[Ref] = []
+
+    def add(self, path: str, ref: Ref) -> None:
+        """
+        Adds the reference of a path.
+        :param path: The path.
+        :param ref: The reference.
+        """
+        node = self
+        node.refs.append(ref)
+        for segment in path.split(PathTrie._SEPARATOR):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = PathTrie()
+            node = child
+            node.refs.append(ref)
+
+    def get(self, prefix: str) -> List[Ref]:
+        """
+        Returns the references of the paths under a prefix. A prefix matches whole segments, so
+        "product" matches "product" and "product/wheat", but not "products/wheat".
+        :param prefix: The prefix; an empty prefix matches all paths.
+        :return: The references in the order they were added.
+        """
+        node = self
+        prefix = prefix.strip(PathTrie._SEPARATOR)
+        if prefix:
+            for segment in prefix.split(PathTrie._SEPARATOR):
+                node = node.children.get(segment)
+                if node is None:
+                    return []
+
+        return list(node.refs)
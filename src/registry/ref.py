@@ -1,10 +1,12 @@
 """
 Resource reference module.
 """
-from typing import Set
+from typing import Set, Callable, Any, Optional, Generic, TypeVar
 
 from .res import ResKey
 
+T = TypeVar("T")
+
 
 class Tag:
     """
@@ -24,12 +26,38 @@ class Ref:
     # To save memory
     _EmptyTagSet = set()
 
-    def __init__(self, res_key: ResKey, res: object, _id: int):
+    def __init__(
+        self,
+        res_key: ResKey,
+        res: object,
+        _id: int,
+        factory: Optional[Callable[[], Any]] = None,
+    ):
         self.res_key: ResKey = res_key
-        self.res: object = res
+        self._res: object = res
         self._id: int = _id
         self._tag_set: Set[Tag] = Ref._EmptyTagSet
 
+        # The factory of a lazy resource; it is dropped once the resource is created
+        self._factory: Optional[Callable[[], Any]] = factory
+
+    @property
+    def res(self) -> object:
+        """
+        Returns the resource. A lazy resource is created on the first access.
+        """
+        if self._factory is not None:
+            self._res = self._factory()
+            self._factory = None
+
+        return self._res
+
+    def is_resolved(self) -> bool:
+        """
+        Tests whether the resource has been created.
+        """
+        return self._factory is None
+
     def get_id(self) -> int:
         """
         Returns the id of this reference.
@@ -53,3 +81,17 @@ class Ref:
         :return: true if the tag is bound; false otherwise.
         """
         return tag in self._tag_set
+
+
+class LazyRes(Generic[T]):
+    """
+    A class attribute that resolves to a lazy resource when it is accessed, so that resource
+    classes can hold lazy resources the same way as ordinary ones.
+    """
+
+    def __init__(self, ref: Ref):
+        # The reference of the lazy resource
+        self.ref: Ref = ref
+
+    def __get__(self, instance: Any, owner: Any) -> T:
+        return self.ref.res
@@ -1,10 +1,13 @@
 """
 Registry module.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional
 
+import numpy as np
+
+from .path_trie import PathTrie
 from .res import ResLoc, ResKey
-from .ref import Ref
+from .ref import Ref, Tag
 
 
 class Registry:
@@ -12,6 +15,9 @@ class Registry:
     Registry.
     """
 
+    # The maximum number of tags bound through a registry; tag masks are 64-bit signed integers
+    MAX_TAGS = 63
+
     def __init__(self, key: ResKey):
         # Registry key
         self.key = key
@@ -28,6 +34,26 @@ class Registry:
         # A mapping of res and its location
         self.by_res: Dict[Any, ResLoc] = {}
 
+        # References of lazy resources that are not in by_res yet
+        self._lazy_refs: List[Ref] = []
+
+        # A trie of the paths of resource locations
+        self._path_trie: PathTrie = PathTrie()
+
+        # A mapping of tags and the references they are bound to
+        self.by_tag: Dict[Tag, List[Ref]] = {}
+
+        # Links to the references of other registries, such as items to their products; a
+        # mapping of registries and mappings of references and linked references
+        self._links: Dict["Registry", Dict[Ref, Ref]] = {}
+
+        # The bit masks of the tags bound through this registry; each tag has its own bit
+        self._tag_bits: Dict[Tag, int] = {}
+
+        # The tag masks of resources indexed by ID; None if they have changed since they were
+        # last built
+        self._tag_masks: np.ndarray | None = None
+
     def register(self, res_loc: ResLoc, res: Any) -> Any:
         """
         Registers a resource.
@@ -35,35 +61,44 @@ class Registry:
         :param res: The resource to register.
         :return: The resource.
         """
-
-        loc_str: str = res_loc.__repr__()
-        res_key = ResKey(self.key.loc, res_loc)
-        if self.key_map.get(loc_str) is not None:
-            raise ResKeyConflictException(res_key)
-
-        ref = Ref(res_key, res, len(self.by_id))
-        self.key_map[loc_str] = res_key
-        self.by_id.append(ref)
-        self.by_loc[res_loc] = ref
+        self._add_ref(res_loc, res)
         self.by_res[res] = res_loc
 
         return res
 
+    def register_lazy(self, res_loc: ResLoc, factory: Callable[[], Any]) -> Ref:
+        """
+        Registers a lazy resource. The factory is called to create the resource the first time it
+        is retrieved, and the resource is memoized afterward.
+        :param res_loc: The location of the resource.
+        :param factory: A function that creates the resource.
+        :return: The reference of the resource.
+        """
+        ref = self._add_ref(res_loc, None, factory)
+        self._lazy_refs.append(ref)
+
+        return ref
+
+    def prewarm(self, namespace: Optional[str] = None) -> None:
+        """
+        Creates all lazy resources in a namespace, for example during a loading screen.
+        :param namespace: The namespace of the resources to create; None creates all.
+        """
+        for ref in self._lazy_refs:
+            if namespace is None or ref.res_key.loc.namespace == namespace:
+                _ = ref.res
+
     def get_ref(self, res_loc: ResLoc) -> Ref:
         """
         Returns the reference of a resource.
         :param res_loc: The location of the resource.
         """
         ref = self.by_loc.get(res_loc)
-
         if ref is None:
-            loc_str = res_loc.__repr__()
-            res_key = self.key_map.get(loc_str)
-
-            if res_key is None:
-                raise ResNotFoundException(res_loc)
+            raise ResNotFoundException(res_loc)
 
-            return self.get_ref(res_key.loc)
+        # Lazy resources are created here
+        _ = ref.res
 
         return ref
 
@@ -74,12 +109,112 @@ class Registry:
         :return: The reference of the given resource.
         """
         res_loc = self.by_res.get(res)
+        if res_loc is None and self._lazy_refs:
+            self._index_lazy_refs()
+            res_loc = self.by_res.get(res)
 
         if res_loc is None:
             raise ResNotRegisteredException(res)
 
         return self.get_ref(res_loc)
 
+    def get_id_by_res(self, res: Any, default: int = -1) -> int:
+        """
+        Returns the ID of a resource.
+        :param res: A resource.
+        :param default: The ID to return if the resource is not registered.
+        """
+        res_loc = self.by_res.get(res)
+        if res_loc is None and self._lazy_refs:
+            self._index_lazy_refs()
+            res_loc = self.by_res.get(res)
+
+        if res_loc is None:
+            return default
+
+        return self.by_loc[res_loc].get_id()
+
+    def bind_tag(self, ref: Ref, tag: Tag) -> None:
+        """
+        Binds a tag to the reference of a resource of this registry. Tags should be bound through
+        the registry, so that the tag masks are kept up to date.
+        :param ref: The reference.
+        :param tag: The tag to bind.
+        """
+        if ref.contain_tag(tag):
+            return
+
+        if tag not in self._tag_bits:
+            if len(self._tag_bits) >= Registry.MAX_TAGS:
+                raise TooManyTagsException(self.key, tag)
+            self._tag_bits[tag] = 1 << len(self._tag_bits)
+
+        ref.bind_tag(tag)
+        self.by_tag.setdefault(tag, []).append(ref)
+        self._tag_masks = None
+
+    def get_refs_by_tag(self, tag: Tag) -> List[Ref]:
+        """
+        Returns the references a tag is bound to through this registry.
+        :param tag: The tag.
+        :return: The references in the order the tag was bound to them.
+        """
+        return list(self.by_tag.get(tag, ()))
+
+    def get_refs_by_prefix(self, prefix: str) -> List[Ref]:
+        """
+        Returns the references of the resources whose paths are under a prefix. A prefix
+        matches whole segments of paths, so "product" matches "product/wheat".
+        :param prefix: The prefix of paths.
+        :return: The references in the order of registration.
+        """
+        return self._path_trie.get(prefix)
+
+    def link(self, ref: Ref, registry: "Registry", linked_ref: Ref) -> None:
+        """
+        Links the reference of a resource to the reference of a resource of another registry,
+        such as an item to its product.
+        :param ref: The reference of a resource of this registry.
+        :param registry: The other registry.
+        :param linked_ref: The reference of a resource of the other registry.
+        """
+        self._links.setdefault(registry, {})[ref] = linked_ref
+
+    def get_link(self, ref: Ref, registry: "Registry") -> Ref | None:
+        """
+        Returns the reference of another registry that a reference is linked to.
+        :param ref: The reference of a resource of this registry.
+        :param registry: The other registry.
+        :return: The linked reference; None if the reference is not linked to the registry.
+        """
+        links = self._links.get(registry)
+        if links is None:
+            return None
+
+        return links.get(ref)
+
+    def get_tag_mask(self, tag: Tag) -> int:
+        """
+        Returns the bit mask of a tag in the tag masks of this registry.
+        :param tag: The tag.
+        :return: The bit mask; 0 if the tag is not bound to any resource of this registry.
+        """
+        return self._tag_bits.get(tag, 0)
+
+    def get_tag_masks(self) -> np.ndarray:
+        """
+        Returns the tag masks of resources as an array indexed by ID, so that tags of many
+        resources can be tested at once. The array has an extra zero at the end, so that the ID
+        -1, which stands for no resource, has no tags.
+        """
+        if self._tag_masks is None:
+            tag_masks = np.zeros(len(self.by_id) + 1, np.int64)
+            for tag, refs in self.by_tag.items():
+                tag_masks[[ref.get_id() for ref in refs]] |= self._tag_bits[tag]
+            self._tag_masks = tag_masks
+
+        return self._tag_masks
+
     def get_by_loc(self, res_loc: ResLoc) -> object:
         """
         Returns the location of a resource.
@@ -100,6 +235,39 @@ class Registry:
         """
         return self.by_id
 
+    def _add_ref(
+        self, res_loc: ResLoc, res: Any, factory: Optional[Callable[[], Any]] = None
+    ) -> Ref:
+        """
+        Creates the reference of a resource and adds it to this registry.
+        """
+        loc_str: str = res_loc.__repr__()
+        res_key = ResKey(self.key.loc, res_loc)
+        if self.key_map.get(loc_str) is not None:
+            raise ResKeyConflictException(res_key)
+
+        ref = Ref(res_key, res, len(self.by_id), factory)
+        self.key_map[loc_str] = res_key
+        self.by_id.append(ref)
+        self.by_loc[res_loc] = ref
+        self._path_trie.add(res_loc.path, ref)
+        self._tag_masks = None
+
+        return ref
+
+    def _index_lazy_refs(self) -> None:
+        """
+        Adds the lazy resources that have been created to by_res.
+        """
+        lazy_refs: List[Ref] = []
+        for ref in self._lazy_refs:
+            if ref.is_resolved():
+                self.by_res[ref.res] = ref.res_key.loc
+            else:
+                lazy_refs.append(ref)
+
+        self._lazy_refs = lazy_refs
+
 
 class ResKeyConflictException(Exception):
     """
@@ -119,6 +287,17 @@ class ResNotFoundException(Exception):
         super().__init__(f"Resource not found at location: [ {res_loc} ]")
 
 
+class TooManyTagsException(Exception):
+    """
+    Too many tags exception.
+    """
+
+    def __init__(self, registry_key: ResKey, tag: Tag):
+        super().__init__(
+            f"Fail to bind tag [ {tag.label} ]: registry [ {registry_key} ] has run out of tag bits"
+        )
+
+
 class ResNotRegisteredException(Exception):
     """
     Resource not registered exception.
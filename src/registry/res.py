@@ -1,39 +1,89 @@
 """
 Resource module.
 """
+from typing import Dict, Tuple, Any
 
 
 class ResLoc:
     """
-    Resource location.
+    Resource location. Locations are immutable and interned: creating a location that already
+    exists returns the existing one. Equal locations are thus the same object, and they are
+    hashed and compared by identity, which needs no Python calls in dictionary lookups.
     """
 
+    __slots__ = ("namespace", "path", "_repr")
+
     _DELIMITER = ':'
 
-    def __init__(self, namespace: str, path: str):
-        # The namespace
-        self.namespace: str = namespace
+    # Interned locations; a table from paths to locations for each namespace
+    _table: Dict[str, Dict[str, "ResLoc"]] = {}
+
+    def __new__(cls, namespace: str, path: str) -> "ResLoc":
+        locs = ResLoc._table.get(namespace)
+        if locs is None:
+            locs = ResLoc._table[namespace] = {}
+
+        res_loc = locs.get(path)
+        if res_loc is None:
+            res_loc = locs[path] = object.__new__(cls)
+
+            # The namespace
+            object.__setattr__(res_loc, "namespace", namespace)
+
+            # The path of the resource
+            object.__setattr__(res_loc, "path", path)
 
-        # The path of the resource
-        self.path: str = path
+            # The string form, which is formatted once
+            object.__setattr__(res_loc, "_repr", f"{namespace}{ResLoc._DELIMITER}{path}")
+
+        return res_loc
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Resource locations are immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return ResLoc, (self.namespace, self.path)
 
     def __repr__(self):
-        return f"{self.namespace}{ResLoc._DELIMITER}{self.path}"
+        return self._repr
 
 
 class ResKey:
     """
-    Resource key.
+    Resource key. Keys are immutable and interned like resource locations.
     """
 
+    __slots__ = ("parent", "loc", "_repr")
+
     _DELIMITER = '@'
 
-    def __init__(self, parent: ResLoc, loc: ResLoc):
-        self.parent: ResLoc = parent
-        self.loc: ResLoc = loc
+    # Interned keys by their parent and location
+    _table: Dict[Tuple[ResLoc, ResLoc], "ResKey"] = {}
+
+    def __new__(cls, parent: ResLoc, loc: ResLoc) -> "ResKey":
+        res_key = ResKey._table.get((parent, loc))
+        if res_key is None:
+            res_key = ResKey._table[(parent, loc)] = object.__new__(cls)
+
+            # The location of the parent
+            object.__setattr__(res_key, "parent", parent)
+
+            # The location
+            object.__setattr__(res_key, "loc", loc)
+
+            # The string form, which is formatted once
+            object.__setattr__(res_key, "_repr", f"{parent}{ResKey._DELIMITER}{loc}")
+
+        return res_key
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Resource keys are immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return ResKey, (self.parent, self.loc)
 
     def __repr__(self):
-        return f"{self.parent}{ResKey._DELIMITER}{self.loc}"
+        return self._repr
 
 
 class ResLocBuilder:
@@ -45,10 +95,17 @@ class ResLocBuilder:
         # Default namespace
         self.namespace = namespace
 
+        # The interned locations of the namespace
+        self._locs: Dict[str, ResLoc] = ResLoc._table.setdefault(namespace, {})
+
     def create(self, path: str):
         """
         Creates a resource location.
         :param path: The path of the resource.
         :return: a resource location.
         """
-        return ResLoc(self.namespace, path)
+        res_loc = self._locs.get(path)
+        if res_loc is None:
+            res_loc = ResLoc(self.namespace, path)
+
+        return res_loc
@@ -0,0 +1,41 @@
+"""
+Test array grid.
+"""
+import unittest
+
+import numpy as np
+
+from src.core.common import ArrayGrid, Size
+
+
+class TestArrayGrid(unittest.TestCase):
+    def test_cells(self):
+        """
+        Test accessing cells by coordinates, indices and views.
+        """
+        grid = ArrayGrid(Size(4, 3), np.uint8)
+        grid.set((1, 2), 5)
+        self.assertEqual(grid.get((1, 2)), 5)
+        self.assertEqual(grid[grid.get_index((1, 2))], 5)
+        grid[3] = 7
+        self.assertEqual(grid.get((3, 0)), 7)
+        self.assertEqual(len(grid), 12)
+
+        # Views share cells with the grid
+        view = grid.view((1, 3), (1, 3))
+        self.assertEqual(view.size.toTuple(), (2, 2))
+        view.fill(9)
+        self.assertEqual(grid[1:3, 1:3].tolist(), [[9, 9], [9, 9]])
+        self.assertEqual(list(grid.get_iterator((2, 3), (0, 3))), [0, 9, 9])
+
+    def test_mask(self):
+        """
+        Test vectorized fills and iterating over cells that are not empty.
+        """
+        blocks = ArrayGrid(Size(3, 2), bool)
+        blocks.set((2, 0), True)
+        grid = ArrayGrid(Size(3, 2))
+        grid.fill("a", blocks.get_mask())
+        grid.set((0, 1), "b")
+        self.assertEqual(list(grid.iter_nonempty()), [((2, 0), "a"), ((0, 1), "b")])
+        self.assertIsNone(grid.get((1, 1)))
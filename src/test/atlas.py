@@ -0,0 +1,115 @@
+"""
+Test atlas.
+"""
+import os
+import tempfile
+import unittest
+
+import pygame
+from pygame import Surface, Rect
+
+from src.core.atlas import Atlas, AtlasCache
+from src.core.common import Size
+
+
+class TestAtlas(unittest.TestCase):
+    def test_packing(self):
+        """
+        Test packing images into pages.
+        """
+        atlas = Atlas(Size(100, 100))
+
+        # Images are placed on shelves from left to right
+        image = Surface((40, 30), pygame.SRCALPHA)
+        image.fill((10, 20, 30, 128))
+        first = atlas.add(image)
+        second = atlas.add(image)
+        third = atlas.add(image)
+        self.assertEqual(first.get_abs_offset(), (0, 0))
+        self.assertEqual(second.get_abs_offset(), (40, 0))
+        self.assertEqual(third.get_abs_offset(), (0, 30))
+        self.assertEqual(len(atlas.pages), 1)
+
+        # Pixels are copied as they are
+        self.assertEqual(tuple(third.get_at((0, 0))), (10, 20, 30, 128))
+
+        # A full page opens a new one
+        for _ in range(4):
+            atlas.add(image)
+        self.assertEqual(len(atlas.pages), 2)
+
+        # Images larger than a page get a page of their own
+        large = atlas.add(Surface((120, 10), pygame.SRCALPHA))
+        self.assertEqual(large.get_abs_parent().get_size(), (120, 10))
+        self.assertEqual(len(atlas.pages), 3)
+
+    def test_locate(self):
+        """
+        Test locating regions in their pages.
+        """
+        atlas = Atlas(Size(100, 100))
+        atlas.add(Surface((40, 30), pygame.SRCALPHA))
+        region = atlas.add(Surface((20, 10), pygame.SRCALPHA))
+
+        page, area = Atlas.locate(region)
+        self.assertIs(page, atlas.pages[0])
+        self.assertEqual(area, Rect(40, 0, 20, 10))
+
+        # Surfaces that are not regions are located in themselves
+        surface = Surface((5, 5))
+        page, area = Atlas.locate(surface)
+        self.assertIs(page, surface)
+        self.assertEqual(area, Rect(0, 0, 5, 5))
+
+
+class TestAtlasCache(unittest.TestCase):
+    def test_bake(self):
+        """
+        Test baking an atlas and loading it back.
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            source = os.path.join(cache_dir, "source.txt")
+            with open(source, "w") as file:
+                file.write("source")
+
+            def create() -> Surface:
+                image = Surface((10, 10), pygame.SRCALPHA)
+                image.fill((1, 2, 3, 4))
+                return image
+
+            # A cold cache creates the images
+            cache = AtlasCache(Atlas(Size(100, 100)), "test", cache_dir, [source], (3,))
+            cache.get("a", create)
+            cache.get("b", create)
+            self.assertTrue(cache.dirty)
+            cache.bake()
+
+            # A warm cache loads them
+            cache = AtlasCache(Atlas(Size(100, 100)), "test", cache_dir, [source], (3,))
+            region = cache.get("b", self.fail)
+            self.assertEqual(Atlas.locate(region)[1], Rect(10, 0, 10, 10))
+            self.assertEqual(tuple(region.get_at((0, 0))), (1, 2, 3, 4))
+            self.assertFalse(cache.dirty)
+
+            # Changing a parameter invalidates the cache
+            cache = AtlasCache(Atlas(Size(100, 100)), "test", cache_dir, [source], (2,))
+            cache.get("a", create)
+            self.assertTrue(cache.dirty)
+            cache.bake()
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+    def test_unwritable_cache_dir(self):
+        """
+        Test that an atlas whose cache directory cannot be written is kept in memory.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # A file in place of the cache directory
+            cache_dir = os.path.join(temp_dir, "cache")
+            with open(cache_dir, "w") as file:
+                file.write("not a directory")
+
+            cache = AtlasCache(Atlas(Size(100, 100)), "test", cache_dir, [cache_dir], ())
+            region = cache.get("a", lambda: Surface((10, 10), pygame.SRCALPHA))
+            cache.bake()
+            self.assertIs(cache.get("a", self.fail), region)
+            self.assertTrue(cache.dirty)
@@ -0,0 +1,55 @@
+"""
+Test collision maintenance.
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.core.game import Game
+from src.core.settings import Settings
+
+
+class TestCollision(unittest.TestCase):
+    def setUp(self):
+        # Settings and the environment are shared by all tests; atlases are cached in a temporary
+        # directory if this test registers them
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        for patcher in (
+            mock.patch.object(Settings(), "headless", True),
+            mock.patch.object(Settings(), "cache_dir", cache_dir.name),
+            mock.patch.dict(os.environ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_update_cell(self):
+        """
+        Test that updating a cell of a layer updates the blocking of the cell.
+        """
+        game = Game()
+        game.init()
+
+        from src.world.data.maps import Maps
+        from src.world.data.registries import Registries
+        from src.world.data.tiles import TileTags
+        from src.world.map import MapController
+
+        # A copy of the farm, so that the shared map is not changed
+        controller = MapController(Maps.Farm.clone(), game.context)
+        refs = Registries.Tile.get_ref_list()
+        collision_tile = next(ref for ref in refs if ref.contain_tag(TileTags.COLLISION_OBJECT))
+        coordinate = (10, 10)
+        self.assertFalse(controller.is_block(coordinate))
+
+        # Two layers block the cell; it is blocked until both are cleared
+        furniture_bottom = controller.map.get_layer("furniture_bottom")
+        furniture_top = controller.map.get_layer("furniture_top")
+        furniture_bottom.update_cell(coordinate, collision_tile.res)
+        furniture_top.update_cell(coordinate, collision_tile.res)
+        self.assertEqual(controller.blocker_counts.get(coordinate), 2)
+        furniture_top.update_cell(coordinate, None)
+        self.assertTrue(controller.is_block(coordinate))
+        furniture_bottom.update_cell(coordinate, None)
+        self.assertFalse(controller.is_block(coordinate))
@@ -0,0 +1,54 @@
+"""
+Test event manager.
+"""
+import unittest
+
+from src.core.context import Context
+from src.core.event import EventManager
+from src.core.profiler import Profiler
+
+
+class TestEventManager(unittest.TestCase):
+    def test_dispatch(self):
+        """
+        Test dispatching events to listeners with and without the context.
+        """
+        event_manager = EventManager()
+        context = Context(None)
+        calls = []
+        event_manager.on(1, lambda: calls.append("zero"))
+        event_manager.on(1, lambda _context: calls.append(_context.event_data.get("key")))
+
+        event_manager.dispatch(1, context, {"key": 7})
+        event_manager.dispatch(2, context)
+        self.assertEqual(calls, ["zero", 7])
+
+        # The event data of a nested event is restored once the nested event is done
+        event_manager.on(3, lambda _context: event_manager.dispatch(1, _context))
+        event_manager.on(3, lambda _context: calls.append(_context.event_data["key"]))
+        event_manager.dispatch(3, context, {"key": 8})
+        self.assertEqual(calls, ["zero", 7, "zero", None, 8])
+
+        # The data of events without data cannot be changed by listeners
+        event_manager.on(4, lambda _context: _context.event_data.update(key=9))
+        with self.assertRaises(AttributeError):
+            event_manager.dispatch(4, context)
+        self.assertEqual(EventManager.EMPTY_DATA, {})
+
+    def test_register_during_dispatch(self):
+        """
+        Test that a listener registered during a dispatch is not invoked by it, with and without
+        profiling.
+        """
+        for enabled in (False, True):
+            profiler = Profiler()
+            profiler.enabled = enabled
+            event_manager = EventManager(profiler)
+            context = Context(None)
+            calls = []
+            event_manager.on(1, lambda: event_manager.on(1, lambda: calls.append("late")))
+
+            event_manager.dispatch(1, context)
+            self.assertEqual(calls, [])
+            event_manager.dispatch(1, context)
+            self.assertEqual(calls, ["late"])
@@ -0,0 +1,97 @@
+"""
+Test grid layers.
+"""
+import random
+import unittest
+
+import pygame
+from pygame import Surface, Rect
+
+from src.core.common import Size
+from src.core.display import GridLayer, ChunkedGridLayer
+
+
+class TestGridLayer(unittest.TestCase):
+    def test_overflowing_tile_in_view(self):
+        """
+        Test that a tile larger than a cell is rendered when only the part sticking out of its
+        cell is in view.
+        """
+        layer = GridLayer(Size(10, 10), Size(8, 8))
+        layer.rect = Rect(16, 16, 32, 32)
+
+        # A bed, two cells tall, one row above the viewport
+        bed = Surface((8, 16), pygame.SRCALPHA)
+        bed.fill((200, 40, 40, 255))
+        layer.update_cell((3, 1), bed)
+
+        # A tile outside of the viewport stays pending
+        tile = Surface((8, 8), pygame.SRCALPHA)
+        tile.fill((40, 200, 40, 255))
+        layer.update_cell((9, 9), tile)
+
+        layer.render()
+        self.assertEqual(tuple(layer.surface.get_at((24, 16))), (200, 40, 40, 255))
+        self.assertEqual(list(layer.updated_indices), [layer.grid.get_index((9, 9))])
+
+    def test_chunked_matches_grid_layer(self):
+        """
+        Test that a chunked layer holds the same pixels as a grid layer while its chunks are
+        evicted and materialized again.
+        """
+        grid_size, cell_size = Size(12, 12), Size(4, 4)
+        layer = GridLayer(grid_size, cell_size)
+        chunked_layer = ChunkedGridLayer(grid_size, cell_size, Size(3, 3), 0, 2)
+
+        # Semi-transparent tiles, and tiles that stick out of their cells and chunks
+        surfaces = []
+        for index, size in enumerate([(4, 4), (4, 4), (4, 4), (4, 8), (8, 4), (14, 14)]):
+            surface = Surface(size, pygame.SRCALPHA)
+            surface.fill((40 * index, 255 - 40 * index, 90, 96 + 30 * index))
+            surface.fill((255, 255, 0, 255), Rect(0, 0, 2, 2))
+            surfaces.append(surface)
+
+        rand = random.Random(3)
+        for _ in range(600):
+            coordinate = (rand.randrange(12), rand.randrange(12))
+            action = rand.random()
+            if action < 0.5:
+                surface = rand.choice(surfaces)
+                layer.update_cell(coordinate, surface)
+                chunked_layer.update_cell(coordinate, surface)
+            elif action < 0.6:
+                layer.update_cell(coordinate, None)
+                chunked_layer.update_cell(coordinate, None)
+            elif action < 0.75:
+                alpha = rand.choice([0, 255])
+                layer.wipe_cell(coordinate, alpha)
+                chunked_layer.wipe_cell(coordinate, alpha)
+            else:
+                chunked_layer.rect = Rect(rand.randrange(48), rand.randrange(48), 8, 8)
+                layer.render()
+                chunked_layer.render()
+                self.assertChunksEqual(chunked_layer, layer)
+
+        # Materialize all chunks again, and a copy of the layer
+        layer.render()
+        chunked_layer.render()
+        chunked_layer.rect = None
+        chunked_layer.max_chunks = 32
+        for _layer in (chunked_layer, chunked_layer.clone()):
+            _layer.rect = None
+            _layer.render()
+            self.assertEqual(len(_layer._materialized), 4 * 4)
+            self.assertChunksEqual(_layer, layer)
+
+    def assertChunksEqual(self, chunked_layer: ChunkedGridLayer, layer: GridLayer) -> None:
+        """
+        Asserts that the materialized chunks of a chunked layer hold the pixels of a grid layer.
+        """
+        bounds = layer.surface.get_rect()
+        for chunk in chunked_layer._materialized.values():
+            area = chunk.rect.clip(bounds)
+            expected = layer.surface.subsurface(area)
+            actual = chunk.surface.subsurface(area.move(-chunk.rect.x, -chunk.rect.y))
+            self.assertEqual(
+                pygame.image.tobytes(actual, "RGBA"), pygame.image.tobytes(expected, "RGBA")
+            )
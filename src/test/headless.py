@@ -0,0 +1,78 @@
+"""
+Test headless mode.
+"""
+import os
+import unittest
+from unittest import mock
+
+from src.core.constant import EventTypes
+from src.core.game import Game
+from src.core.settings import Settings
+
+
+class TestHeadless(unittest.TestCase):
+    def setUp(self):
+        # Settings and the environment are shared by all tests; they are restored after each test
+        for patcher in (
+            mock.patch.object(Settings(), "headless", True),
+            mock.patch.dict(os.environ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_step(self):
+        """
+        Test stepping the game without presenting frames.
+        """
+        game = Game()
+        game.init()
+
+        # Loops advance by the given delta time; the first count is triggered right away
+        counts = []
+        game.loop_manager.loop(10, 1000, counts.append)
+        for _ in range(100):
+            game.step(16)
+        self.assertEqual(len(counts), 17)
+
+        # Frames are rendered on request only
+        screen = game.display.screen
+        screen.fill("black")
+        game.step(16)
+        self.assertEqual(tuple(screen.get_at(game.display.center)), (0, 0, 0, 255))
+        game.step(16, render=True)
+        self.assertNotEqual(tuple(screen.get_at(game.display.center)), (0, 0, 0, 255))
+
+    def test_fixed_step(self):
+        """
+        Test simulating in fixed steps.
+        """
+        game = Game()
+        game.init()
+
+        # Frames run as many steps as fit in their time; the rest is carried to the next frame
+        step_dt = game.settings.simulation_dt
+        steps = []
+        game.event_manager.on(EventTypes.SIMULATE, lambda context: steps.append(context.dt))
+        game.step(step_dt * 2 + step_dt // 2)
+        self.assertEqual(steps, [step_dt, step_dt])
+        self.assertAlmostEqual(game.context.alpha, 0.5)
+        game.step(step_dt // 2)
+        self.assertEqual(len(steps), 3)
+        self.assertAlmostEqual(game.context.alpha, 0)
+
+        # Slow frames are capped, and the rest of their time is carried into the following frames
+        game.step(step_dt * 100)
+        self.assertEqual(len(steps), 3 + game.settings.simulation_max_steps)
+        self.assertAlmostEqual(game.context.alpha, 1)
+        while len(steps) < 103:
+            game.step(0)
+        game.step(0)
+        self.assertEqual(len(steps), 103)
+        self.assertAlmostEqual(game.context.alpha, 0)
+
+        # Lag beyond the maximum is dropped after the steps of the slow frame
+        max_steps, max_lag = game.settings.simulation_max_steps, game.settings.simulation_max_lag
+        game.step(max_lag * 2)
+        while game.context.alpha == 1:
+            game.step(0)
+        self.assertEqual(len(steps), 103 + max_steps + max_lag // step_dt)
@@ -0,0 +1,106 @@
+"""
+Test loops.
+"""
+import unittest
+
+from src.core.loop import LoopManager, Loop
+
+
+class TestLoopManager(unittest.TestCase):
+    def test_loop(self):
+        """
+        Test triggering counts and wrapping periods.
+        """
+        loop_manager = LoopManager()
+        indices = []
+        loop_manager.loop(10, 3, indices.append)
+
+        # The first count is triggered right away, then every 100 ms
+        for _ in range(25):
+            loop_manager.update(20)
+        self.assertEqual(indices, [0, 1, 2, 0, 1, 2])
+
+    def test_delay(self):
+        """
+        Test delaying a callback; it is triggered once.
+        """
+        loop_manager = LoopManager()
+        calls = []
+        loop_manager.delay(100, lambda: calls.append(loop_manager.time))
+        for _ in range(30):
+            loop_manager.update(10)
+
+        self.assertEqual(calls, [100])
+        self.assertEqual(len(loop_manager), 0)
+
+    def test_remove_while_dispatching(self):
+        """
+        Test removing loops in loop callbacks.
+        """
+        loop_manager = LoopManager()
+        calls = []
+
+        def first(index: int) -> None:
+            calls.append(("first", index))
+            loop_manager.remove(second)
+
+        loop_manager.loop(10, 2, first)
+        second = loop_manager.loop(10, 2, lambda index: calls.append(("second", index)))
+        loop_manager.once(10, 2, lambda index: calls.append(("once", index)))
+        for _ in range(3):
+            loop_manager.update(100)
+
+        expected = [("first", 0), ("once", 0), ("first", 1), ("once", 1), ("first", 0)]
+        self.assertEqual(calls, expected)
+        self.assertEqual(len(loop_manager), 1)
+
+    def test_pause(self):
+        """
+        Test pausing loops.
+        """
+        loop_manager = LoopManager()
+        indices = []
+        loop = loop_manager.loop(10, 10, indices.append)
+        loop_manager.update(50)
+        loop.paused = True
+        loop_manager.update(500)
+        loop.paused = False
+        loop_manager.update(40)
+        self.assertEqual(indices, [0])
+        loop_manager.update(10)
+        self.assertEqual(indices, [0, 1])
+
+    def test_policies(self):
+        """
+        Test what loops do when several counts are due in one update.
+        """
+        loop_manager = LoopManager()
+        calls = {policy: [] for policy in range(4)}
+        loop_manager.loop(10, 5, lambda index: calls[Loop.Policy.Lag].append(index))
+        loop_manager.loop(
+            10, 5, lambda index: calls[Loop.Policy.CatchUp].append(index), None, Loop.Policy.CatchUp
+        )
+        loop_manager.loop(
+            10,
+            5,
+            lambda index, skipped: calls[Loop.Policy.Coalesce].append((index, skipped)),
+            None,
+            Loop.Policy.Coalesce,
+        )
+        loop_manager.loop(
+            10, 5, lambda index: calls[Loop.Policy.Drop].append(index), None, Loop.Policy.Drop
+        )
+
+        # Counts 1 to 3 are due after a long frame
+        loop_manager.update(10)
+        loop_manager.update(350)
+        self.assertEqual(calls[Loop.Policy.Lag], [0, 1])
+        self.assertEqual(calls[Loop.Policy.CatchUp], [0, 1, 2, 3])
+        self.assertEqual(calls[Loop.Policy.Coalesce], [(0, 0), (3, 2)])
+        self.assertEqual(calls[Loop.Policy.Drop], [0, 3])
+
+        # Coalescing and dropping loops do not skip the last count of a period
+        loop_manager.update(500)
+        self.assertEqual(calls[Loop.Policy.CatchUp], [0, 1, 2, 3, 4, 0, 1, 2, 3])
+        self.assertEqual(calls[Loop.Policy.Coalesce][-1], (4, 0))
+        self.assertEqual(calls[Loop.Policy.Drop][-1], 4)
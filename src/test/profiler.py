@@ -0,0 +1,45 @@
+"""
+Test profiler.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from src.core.profiler import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def test_percentiles(self):
+        """
+        Test rolling percentiles.
+        """
+        profiler = Profiler(window=100)
+        profiler.enabled = True
+
+        # Record durations from 1 ms to 200 ms; only the last 100 are kept
+        for duration in range(1, 201):
+            start = Profiler.now() - duration / 1000
+            profiler.record("update", "listener", start)
+
+        p50, p95, p99 = profiler.get_percentiles("listener/update")
+        self.assertAlmostEqual(p50, 151, delta=0.5)
+        self.assertAlmostEqual(p95, 195, delta=0.5)
+        self.assertAlmostEqual(p99, 199, delta=0.5)
+        self.assertEqual(profiler.get_stats()[0][0], "listener/update")
+
+    def test_chrome_trace(self):
+        """
+        Test exporting a Chrome trace.
+        """
+        profiler = Profiler()
+        profiler.record("flip", "display", Profiler.now())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            profiler.export_chrome_trace(path)
+            with open(path) as file:
+                trace = json.load(file)
+
+        event = trace["traceEvents"][0]
+        self.assertEqual((event["name"], event["cat"], event["ph"]), ("flip", "display", "X"))
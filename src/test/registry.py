@@ -1,8 +1,9 @@
 """
 Test registry.
 """
+import copy
 import unittest
-from src.registry import RegistryUtil
+from src.registry import RegistryUtil, Registry, Tag, ResLoc, ResKey, TooManyTagsException
 
 
 class TestRegistry(unittest.TestCase):
@@ -30,3 +31,119 @@ class TestRegistry(unittest.TestCase):
         # Test references
         ref_chinese_hello_world = registry.get_ref(loc_chinese_hello_world)
         self.assertEqual(ref_chinese_hello_world.get_id(), 1)
+
+    def test_lazy(self):
+        """
+        Test lazy resources.
+        """
+        registry = RegistryUtil.createRegistry("lazy")
+        calls = []
+
+        def create_greeting() -> str:
+            calls.append("greeting")
+            return "Hello world!"
+
+        # Lazy resources are not created on registration
+        loc_greeting = RegistryUtil.createLoc("greeting")
+        ref_greeting = registry.register_lazy(loc_greeting, create_greeting)
+        self.assertFalse(ref_greeting.is_resolved())
+        self.assertEqual(calls, [])
+
+        # They are created on the first retrieval and memoized
+        self.assertEqual(registry.get_by_loc(loc_greeting), "Hello world!")
+        self.assertEqual(registry.get_by_loc(loc_greeting), "Hello world!")
+        self.assertEqual(calls, ["greeting"])
+        self.assertIs(registry.get_ref_by_res("Hello world!"), ref_greeting)
+
+        # Prewarming creates all lazy resources of a namespace
+        loc_farewell = RegistryUtil.createLoc("farewell")
+        ref_farewell = registry.register_lazy(loc_farewell, lambda: "Goodbye!")
+        registry.prewarm("Other")
+        self.assertFalse(ref_farewell.is_resolved())
+        registry.prewarm(loc_farewell.namespace)
+        self.assertTrue(ref_farewell.is_resolved())
+
+    def test_tag_masks(self):
+        """
+        Test IDs and tag masks.
+        """
+        registry = RegistryUtil.createRegistry("tag_masks")
+        tag_round, tag_red = Tag("ROUND"), Tag("RED")
+        registry.register(RegistryUtil.createLoc("ball"), "ball")
+        registry.register(RegistryUtil.createLoc("apple"), "apple")
+        ref_apple = registry.get_ref_by_res("apple")
+        registry.bind_tag(ref_apple, tag_round)
+        registry.bind_tag(ref_apple, tag_red)
+        registry.bind_tag(registry.get_ref_by_res("ball"), tag_round)
+
+        self.assertEqual(registry.get_id_by_res("apple"), 1)
+        self.assertEqual(registry.get_id_by_res("pear"), -1)
+
+        # The ID -1 has no tags
+        tag_masks = registry.get_tag_masks()
+        ids = [0, 1, -1]
+        mask_round, mask_red = registry.get_tag_mask(tag_round), registry.get_tag_mask(tag_red)
+        self.assertEqual(list(tag_masks[ids] & mask_round != 0), [True, True, False])
+        self.assertEqual(list(tag_masks[ids] & mask_red != 0), [False, True, False])
+        self.assertEqual(registry.get_tag_mask(Tag("GREEN")), 0)
+
+        # Each registry has its own tag bits, up to a limit
+        many_tags = RegistryUtil.createRegistry("many_tags")
+        many_tags.register(RegistryUtil.createLoc("ball"), "ball")
+        ref_ball = many_tags.get_ref_by_res("ball")
+        for index in range(Registry.MAX_TAGS):
+            many_tags.bind_tag(ref_ball, Tag(f"TAG_{index}"))
+        self.assertEqual(many_tags.get_tag_masks()[0], (1 << Registry.MAX_TAGS) - 1)
+        with self.assertRaises(TooManyTagsException):
+            many_tags.bind_tag(ref_ball, Tag("ONE_TOO_MANY"))
+
+    def test_interned_locations(self):
+        """
+        Test that equal locations and keys are the same object.
+        """
+        registry = RegistryUtil.createRegistry("interned")
+        registry.register(RegistryUtil.createLoc("interned/apple"), "apple")
+
+        res_loc = RegistryUtil.createLoc("interned/apple")
+        self.assertIs(res_loc, ResLoc(res_loc.namespace, "interned/apple"))
+        self.assertIs(copy.deepcopy(res_loc), res_loc)
+        self.assertEqual(registry.get_by_loc(res_loc), "apple")
+        self.assertIs(registry.get_ref(res_loc).res_key, ResKey(registry.key.loc, res_loc))
+        with self.assertRaises(AttributeError):
+            res_loc.path = "interned/pear"
+
+    def test_indexes(self):
+        """
+        Test queries by path prefix, tag and link.
+        """
+        fruits = RegistryUtil.createRegistry("indexed_fruits")
+        ref_apple = fruits.register_lazy(RegistryUtil.createLoc("fruit/apple"), lambda: "apple")
+        ref_pear = fruits.register_lazy(RegistryUtil.createLoc("fruit/pear"), lambda: "pear")
+        ref_apple_seeds = fruits.register_lazy(
+            RegistryUtil.createLoc("seeds/apple"), lambda: "apple seeds"
+        )
+        ref_fruits = fruits.register_lazy(RegistryUtil.createLoc("fruits/all"), lambda: "all")
+
+        # Prefixes match whole segments of paths
+        self.assertEqual(fruits.get_refs_by_prefix("fruit"), [ref_apple, ref_pear])
+        self.assertEqual(fruits.get_refs_by_prefix("fruit/"), [ref_apple, ref_pear])
+        self.assertEqual(fruits.get_refs_by_prefix("fruit/pear"), [ref_pear])
+        self.assertEqual(fruits.get_refs_by_prefix("fruit/pea"), [])
+        self.assertEqual(fruits.get_refs_by_prefix("vegetable"), [])
+        self.assertEqual(len(fruits.get_refs_by_prefix("")), 4)
+
+        # Tags bound twice are indexed once
+        tag_sweet = Tag("sweet")
+        fruits.bind_tag(ref_pear, tag_sweet)
+        fruits.bind_tag(ref_apple, tag_sweet)
+        fruits.bind_tag(ref_pear, tag_sweet)
+        self.assertEqual(fruits.get_refs_by_tag(tag_sweet), [ref_pear, ref_apple])
+        self.assertEqual(fruits.get_refs_by_tag(Tag("sour")), [])
+
+        # Links to other registries
+        trees = RegistryUtil.createRegistry("indexed_trees")
+        ref_apple_tree = trees.register_lazy(RegistryUtil.createLoc("apple"), lambda: "tree")
+        fruits.link(ref_apple_seeds, trees, ref_apple_tree)
+        self.assertIs(fruits.get_link(ref_apple_seeds, trees), ref_apple_tree)
+        self.assertIsNone(fruits.get_link(ref_apple, trees))
+        self.assertIsNone(fruits.get_link(ref_fruits, fruits))
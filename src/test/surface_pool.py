@@ -0,0 +1,30 @@
+"""
+Test surface pool.
+"""
+import unittest
+
+import pygame
+
+from src.core.surface_pool import SurfacePool
+
+
+class TestSurfacePool(unittest.TestCase):
+    def test_reuse(self):
+        """
+        Test reusing released surfaces of the same size and flags.
+        """
+        pool = SurfacePool(max_surfaces_per_key=1)
+        surface = pool.acquire((10, 20), pygame.SRCALPHA)
+        pool.release(surface)
+
+        # Surfaces of other sizes or flags are allocated
+        self.assertIsNot(pool.acquire((10, 20)), surface)
+        self.assertIsNot(pool.acquire((20, 10), pygame.SRCALPHA), surface)
+        self.assertIs(pool.acquire((10, 20), pygame.SRCALPHA), surface)
+        self.assertEqual(pool.num_allocations, 3)
+
+        # Idle surfaces beyond the limit are dropped
+        pool.release(surface)
+        pool.release(pygame.Surface((10, 20), pygame.SRCALPHA))
+        self.assertIs(pool.acquire((10, 20), pygame.SRCALPHA), surface)
+        self.assertIsNot(pool.acquire((10, 20), pygame.SRCALPHA), surface)
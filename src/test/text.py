@@ -0,0 +1,35 @@
+"""
+Test text cache.
+"""
+import unittest
+
+import pygame
+
+from src.world.text import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def test_cache(self):
+        """
+        Test hits, misses and eviction.
+        """
+        pygame.font.init()
+        font = pygame.font.Font(None, 16)
+        size = TextCache._get_bytes(font.render("a", True, "black"))
+        cache = TextCache(size * 2)
+
+        # The same text is rendered once
+        first = cache.render(font, "a", "black")
+        self.assertIs(cache.render(font, "a", "black"), first)
+        self.assertIsNot(cache.render(font, "a", "white"), first)
+        self.assertEqual(cache.get_stats(), (1, 2, 2, size * 2))
+
+        # The least recently used surface is evicted once the budget is exceeded
+        cache.render(font, "a", "black")
+        cache.render(font, "a", "red")
+        self.assertIs(cache.render(font, "a", "black"), first)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.misses, 3)
+
+        cache.render(font, "a", "white")
+        self.assertEqual(cache.misses, 4)
@@ -27,6 +27,10 @@ class Camera:
         # be (0, 0)
         self.offset: Vector2 = Vector2(0, 0)
 
+        # Offset at the end of the previous simulation step; rendered frames are interpolated
+        # between it and the offset
+        self.previous_offset: Vector2 = Vector2(0, 0)
+
     def move(self, displacement: Vector2) -> None:
         """
         Moves the camera frame towards certain direction.
@@ -34,32 +38,63 @@ class Camera:
         """
         self.offset += displacement
 
-    def get_screen_rect(self) -> Rect:
+    def jump(self, offset: Vector2) -> None:
+        """
+        Moves the camera frame to an offset, without interpolating from the previous offset.
+        :param offset: The offset to move to.
+        """
+        self.offset = Vector2(offset)
+        self.previous_offset = Vector2(offset)
+
+    def begin_step(self) -> None:
+        """
+        Begins a simulation step; the current offset becomes the previous offset.
+        """
+        self.previous_offset.update(self.offset)
+
+    def get_offset(self, alpha: float = 1) -> Vector2:
+        """
+        Returns the offset interpolated between the previous and the current simulation step.
+        :param alpha: The interpolation factor; 0 is the previous step and 1 is the current step.
+        """
+        if alpha >= 1 or self.previous_offset == self.offset:
+            return self.offset
+
+        return self.previous_offset.lerp(self.offset, max(alpha, 0))
+
+    def get_screen_rect(self, alpha: float = 1) -> Rect:
         """
-        Returns the rectangle of the real screen.
+        Returns the rectangle of the real screen relative to the map. The screen is centered on
+        the virtual center, and it never goes beyond the map.
+        :param alpha: The interpolation factor between the last two simulation steps.
         """
         pos = [0, 0]
+        virtual_center = self.get_virtual_center(alpha)
 
         # x
         if self.screen_size.width < self.map_size.width:
-            pos[0] = min(max(self.offset.x, 0), self.map_size.width - self.screen_size.width)
+            left = virtual_center[0] - self.screen_size.width // 2
+            pos[0] = min(max(left, 0), self.map_size.width - self.screen_size.width)
         else:
             pos[0] = 0
 
         # y
         if self.screen_size.height < self.map_size.height:
-            pos[1] = min(max(self.offset.y, 0), self.map_size.height - self.screen_size.height)
+            top = virtual_center[1] - self.screen_size.height // 2
+            pos[1] = min(max(top, 0), self.map_size.height - self.screen_size.height)
         else:
             pos[1] = 0
 
         return Rect(pos[0], pos[1], self.screen_size.width, self.screen_size.height)
 
-    def get_virtual_center(self) -> Tuple[int, int]:
+    def get_virtual_center(self, alpha: float = 1) -> Tuple[int, int]:
         """
         Returns the center of the virtual screen.
+        :param alpha: The interpolation factor between the last two simulation steps.
         """
         # [MATH] virtual_center = (camera.offset + screen.size) / 2
+        offset = self.get_offset(alpha)
         return (
-            (self.offset.x + self.screen_size.width) / 2,
-            (self.offset.y + self.screen_size.height) / 2,
+            (offset.x + self.screen_size.width) / 2,
+            (offset.y + self.screen_size.height) / 2,
         )
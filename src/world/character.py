@@ -186,9 +186,11 @@ class Character(ContextModule):
         map_offset = self._get_map_offset()
         # [MATH] virtual_center = (camera.offset + screen.size) / 2
         # camera.offset = virtual_center * 2 - screen.size
-        camera.offset = Vector2(
-            (map_offset.x + center[0]) * 2 - screen_size.width + self.size.width // 2,
-            (map_offset.y + center[1]) * 2 - screen_size.height + self.size.height // 2,
+        camera.jump(
+            Vector2(
+                (map_offset.x + center[0]) * 2 - screen_size.width + self.size.width // 2,
+                (map_offset.y + center[1]) * 2 - screen_size.height + self.size.height // 2,
+            )
         )
 
     def _update_after_key_status_change(self) -> None:
@@ -240,8 +242,10 @@ class Character(ContextModule):
 
     def update(self) -> None:
         """
-        Updates this character.
+        Updates this character by one simulation step.
         """
+        camera: Camera = self.context["camera"]
+        camera.begin_step()
         if self.frozen:
             return
 
@@ -249,7 +253,6 @@ class Character(ContextModule):
             self._update_after_key_status_change()
 
         self._update_camera()
-        self._update_character_layer()
         # Debug.get_module("coordinate").print(self.get_coordinate())
 
     def get_current_center(self) -> Tuple[int, int]:
@@ -342,16 +345,19 @@ class Character(ContextModule):
         )
         camera.move(real_displacement)
 
-    def _update_character_layer(self) -> None:
+    def update_layer(self) -> None:
         """
-        Updates character layer.
+        Updates character layer; the position is interpolated between the last two simulation
+        steps.
         """
+        alpha = self.context.alpha
         camera: Camera = self.context["camera"]
-        virtual_center: Tuple[int, int] = camera.get_virtual_center()
+        virtual_center: Tuple[int, int] = camera.get_virtual_center(alpha)
+        screen_rect: Rect = camera.get_screen_rect(alpha)
         character_layer: GridLayer = self.context.display.get_layer("character")
         character_layer.offset = Vector2(
-            virtual_center[0] - self.size.width // 2,
-            virtual_center[1] - self.size.height // 2,
+            virtual_center[0] - screen_rect.x - self.size.width // 2,
+            virtual_center[1] - screen_rect.y - self.size.height // 2,
         )
 
     def get_rect(self, coordinate: Tuple[int, int]) -> Rect | None:
@@ -2,7 +2,7 @@
 Context getters module. This module provides a bunch of utility functions that get a value from the
 given context.
 """
-from src.core.common import Grid
+from src.core.common import ArrayGrid
 from src.core.context import Context
 from src.world.character import Character
 from src.world.crop_window import CropWindow
@@ -14,6 +14,7 @@ from src.world.message_box import MessageBox
 from src.world.music import Music
 from src.world.scene_manager import SceneManager
 from src.world.shopping import Shopping
+from src.world.update_scheduler import UpdateScheduler
 
 
 def get_character(context: Context) -> Character:
@@ -72,10 +73,10 @@ def get_crop_window(context: Context) -> CropWindow:
     return context["crop_window"]
 
 
-def get_crop_grid(context: Context) -> Grid:
+def get_crop_grid(context: Context) -> ArrayGrid:
     """
     Returns the crop grid object in the given context.
-    :returns: Grid[GameCrop | None]
+    :returns: ArrayGrid[GameCrop | None]
     """
     return context["crop_grid"]
 
@@ -92,3 +93,10 @@ def get_shopping(context: Context) -> Shopping:
     Returns the shopping object in the given context.
     """
     return context["shopping"]
+
+
+def get_update_scheduler(context: Context) -> UpdateScheduler:
+    """
+    Returns the update scheduler object in the given context.
+    """
+    return context["update_scheduler"]
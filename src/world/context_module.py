@@ -12,3 +12,15 @@ class ContextModule:
     def __init__(self, context: Context):
         # Game context
         self.context = context
+
+    def is_active(self) -> bool:
+        """
+        Whether this module is shown or animating, that is, whether updating it does any work.
+        The update scheduler skips modules that are not active.
+        """
+        return True
+
+    def update(self) -> None:
+        """
+        Updates this module.
+        """
@@ -8,6 +8,7 @@ from src.core.context import Context
 from src.core.display import Layer
 from src.world.context_module import ContextModule
 from src.world.item.crop import GameCrop
+from src.world.text import render_text
 from src.world.util import get_font
 
 
@@ -25,6 +26,15 @@ class CropWindow(ContextModule):
         # Alpha value
         self.alpha: int = 200
 
+        # The game crop being displayed
+        self.game_crop: GameCrop | None = None
+
+        # The stage of the game crop when it was last drawn
+        self._drawn_stage: int | None = None
+
+        # Whether the layer needs to be redrawn
+        self._dirty: bool = False
+
         # Init
         self._init_layer()
 
@@ -38,8 +48,9 @@ class CropWindow(ContextModule):
         self.context.display.set_layer("crop_window", self.layer)
 
         # Fill color (white, translucent)
-        self.layer.surface.fill("white")
+        self.layer.surface = Surface(self.layer.size.toTuple())
         self.layer.surface.set_alpha(self.alpha)
+        self.reset_layer()
 
         # By default, it is hidden
         self.layer.hidden = True
@@ -48,47 +59,74 @@ class CropWindow(ContextModule):
         """
         Resets the layer.
         """
-        self.layer.surface = Surface(self.layer.size.toTuple())
-        self.layer.surface.fill("white")
-        self.layer.surface.set_alpha(self.alpha)
+        self.layer.fill("white")
 
     def display_crop_info(self, game_crop: GameCrop | None) -> None:
         """
-        Displays the information of a game crop.
+        Displays the information of a game crop. The layer is only redrawn when another game crop
+        is displayed, or when the stage or the watered flag of the game crop changes.
         :param game_crop: The game crop object to display.
         """
+        self.watch(game_crop)
         self.layer.hidden = game_crop is None
-        if self.layer.hidden:
+        if self.layer.hidden or not self._dirty:
             return
 
+        self._dirty = False
+        self._drawn_stage = game_crop.stage
         self.reset_layer()
         font = get_font(24)
 
         def get_key_text(key: str) -> Surface:
-            return font.render(key, False, "#4a4e69")
+            return render_text(font, key, "#4a4e69", False)
 
         def get_value_text(value: str, color: str) -> Surface:
-            return font.render(value, False, color)
+            return render_text(font, value, color, False)
 
         # 1. Name
         product = game_crop.crop.product
         name = product.item.name
-        self.layer.surface.blit(get_key_text("Name:"), Vector2(10, 10))
-        self.layer.surface.blit(get_value_text(name, "#3a86ff"), Vector2(75, 10))
+        self.layer.blit(get_key_text("Name:"), Vector2(10, 10))
+        self.layer.blit(get_value_text(name, "#3a86ff"), Vector2(75, 10))
 
         # 2. Stage string
         stage_str = game_crop.stage_str
-        self.layer.surface.blit(get_key_text("Stage:"), Vector2(10, 40))
-        self.layer.surface.blit(get_value_text(stage_str, "#57cc99"), Vector2(75, 40))
+        self.layer.blit(get_key_text("Stage:"), Vector2(10, 40))
+        self.layer.blit(get_value_text(stage_str, "#57cc99"), Vector2(75, 40))
 
         # 3. Whether the crop is watered
         is_watered_str = "Irrigated" if game_crop.watered else "Unirrigated"
         is_watered_color = "#27a300" if game_crop.watered else "#ff5400"
-        self.layer.surface.blit(get_key_text("Status:"), Vector2(10, 70))
-        self.layer.surface.blit(get_value_text(is_watered_str, is_watered_color), Vector2(75, 70))
+        self.layer.blit(get_key_text("Status:"), Vector2(10, 70))
+        self.layer.blit(get_value_text(is_watered_str, is_watered_color), Vector2(75, 70))
+
+    def watch(self, game_crop: GameCrop | None) -> None:
+        """
+        Observes a game crop to display, and stops observing the previous one.
+        :param game_crop: The game crop to observe.
+        """
+        if game_crop is self.game_crop:
+            return
+
+        if self.game_crop is not None:
+            self.game_crop.unobserve(self._on_crop_change)
+        if game_crop is not None:
+            game_crop.observe(self._on_crop_change)
+
+        self.game_crop = game_crop
+        self._dirty = True
+
+    def _on_crop_change(self, name: str) -> None:
+        """
+        Marks the layer to be redrawn when the stage or the watered flag of the game crop changes.
+        :param name: The name of the changed attribute.
+        """
+        if name == "watered" or self.game_crop.stage != self._drawn_stage:
+            self._dirty = True
 
     def hide(self) -> None:
         """
         Hides this crop window.
         """
+        self.watch(None)
         self.layer.hidden = True
@@ -3,6 +3,7 @@ Curtain module
 """
 from src.core.context import Context
 from src.core.display import Layer
+from src.core.loop import Loop
 from src.core.common.methodical import CallbackNode
 from src.world.context_module import ContextModule
 
@@ -24,6 +25,9 @@ class Curtain(ContextModule):
         # Alpha (0 is transparent, 1 is opaque)
         self.alpha: int = 0
 
+        # The alpha the layer was last filled with
+        self._filled_alpha: int = 0
+
         # Callback node
         self.callback_node: CallbackNode = CallbackNode()
 
@@ -52,7 +56,7 @@ class Curtain(ContextModule):
                 self.alpha = Curtain.MAX_ALPHA
                 self.callback_node.invoke()
 
-        self.context.loop_manager.once(10, count, fade)
+        self.context.loop_manager.once(10, count, fade, Loop.Policy.Drop)
         self.callback_node = CallbackNode()
 
         return self.callback_node
@@ -73,16 +77,26 @@ class Curtain(ContextModule):
                 self.alpha = Curtain.MIN_ALPHA
                 self.callback_node.invoke()
 
-        self.context.loop_manager.once(10, count, fade)
+        self.context.loop_manager.once(10, count, fade, Loop.Policy.Drop)
         self.callback_node = CallbackNode()
 
         return self.callback_node
 
+    def is_active(self) -> bool:
+        """
+        The curtain is active while its alpha changes.
+        """
+        return self.alpha != self._filled_alpha
+
     def update(self) -> None:
         """
-        Updates the layer.
+        Updates the layer. The layer is only refilled when the alpha changes.
         """
-        self.layer.surface.fill((0, 0, 0, self.alpha))
+        if self.alpha == self._filled_alpha:
+            return
+
+        self.layer.fill((0, 0, 0, self.alpha))
+        self._filled_alpha = self.alpha
 
     def is_ongoing(self) -> bool:
         """
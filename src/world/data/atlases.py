@@ -0,0 +1,42 @@
+"""
+Texture atlas resource module.
+"""
+import os
+
+from src.core.atlas import Atlas, AtlasCache
+from src.core.settings import Settings
+from .registries import Registries
+
+settings = Settings()
+page_size = settings.display_atlas_page_size
+
+
+def create_cache(atlas: Atlas, name: str, module_file: str) -> AtlasCache:
+    """
+    Creates the on-disk cache of an atlas. The cache is keyed by the data module that registers
+    the images, the tile set files and the display settings.
+    :param atlas: The atlas to cache.
+    :param name: The name of the cache.
+    :param module_file: The file of the data module that registers the images.
+    :return: The atlas cache.
+    """
+    tile_set_files = [
+        os.path.join(settings.assets_dir, ref.res_key.loc.path)
+        for ref in Registries.TileSet.get_ref_list()
+    ]
+    params = (
+        settings.display_tile_scale_factor,
+        settings.display_character_scale_factor,
+        page_size.toTuple(),
+    )
+
+    return AtlasCache(atlas, name, settings.cache_dir, [module_file, *tile_set_files], params)
+
+
+class Atlases:
+    """
+    Texture atlases. Tiles and sprites are copied into these when they are registered.
+    """
+
+    Tile = Atlas(page_size)
+    Sprite = Atlas(page_size)
@@ -11,11 +11,17 @@ from src.world.item.crop_item import CropItem
 
 def register(path: str, crop_item: CropItem) -> Crop:
     """
-    Register a crop item.
+    Register a crop item and link its item to its crop.
     :param path: The path of the crop.
     :param crop_item: The crop item to register.
     :return: The crop item.
     """
+    Registries.Item.link(
+        Registries.Item.get_ref_by_res(crop_item.item),
+        Registries.Crop,
+        Registries.Crop.get_ref_by_res(crop_item.crop),
+    )
+
     return Registries.CropItem.register(RegistryUtil.createLoc(path), crop_item)
 
 
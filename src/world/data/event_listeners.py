@@ -11,20 +11,22 @@ from src.core.event import EventListener
 from src.core.constant import EventTypes
 from src.world.data.registries import Registries
 from src.world.events.crop import init_crop, update_crop_window
-from src.world.events.curtain import init_curtain, update_curtain
-from src.world.events.data_window import init_data_window, update_data_window
-from src.world.events.debug import init_debug, update_debug
+from src.world.events.curtain import init_curtain
+from src.world.events.data_window import init_data_window
+from src.world.events.debug import init_debug
 from src.world.events.game import init_flags, before_all, init_music
-from src.world.events.inventory import init_inventory, update_inventory, inventory_key_down
+from src.world.events.inventory import init_inventory, inventory_key_down
 from src.world.events.layer import init_layer
 from src.world.events.message_box import init_message_box, update_message_box, message_box_key_down
-from src.world.events.shopping import init_shopping, update_shopping, shopping_key_down
+from src.world.events.shopping import init_shopping, shopping_key_down
+from src.world.events.update_scheduler import init_update_scheduler, update_modules
 from src.world.events.window import quit_game, update_loops
 from src.world.events.character import (
     init_character,
     character_key_up,
     character_key_down,
     update_character,
+    update_character_layer,
 )
 from src.world.events.map import init_map, update_map
 from src.world.events.hotbar import init_hotbar, update_hotbar, hotbar_key_down
@@ -55,6 +57,7 @@ class EventListeners:
 
     # On start
     InitFlags = register(EventTypes.ON_START, init_flags)
+    InitUpdateScheduler = register(EventTypes.ON_START, init_update_scheduler)
     InitLayer = register(EventTypes.ON_START, init_layer)
     InitDebug = register(EventTypes.ON_START, init_debug)
     InitCharacter = register(EventTypes.ON_START, init_character)
@@ -69,17 +72,16 @@ class EventListeners:
     InitShopping = register(EventTypes.ON_START, init_shopping)
     BeforeAll = register(EventTypes.ON_START, before_all)
 
+    # Simulate
+    UpdateLoops = register(EventTypes.SIMULATE, update_loops)
+    UpdateCharacter = register(EventTypes.SIMULATE, update_character)
+
     # Before render
-    UpdateDebug = register(EventTypes.BEFORE_RENDER, update_debug)
-    UpdateLoops = register(EventTypes.BEFORE_RENDER, update_loops)
-    UpdateCharacter = register(EventTypes.BEFORE_RENDER, update_character)
+    UpdateCharacterLayer = register(EventTypes.BEFORE_RENDER, update_character_layer)
     UpdateMap = register(EventTypes.BEFORE_RENDER, update_map)
     UpdateHotbar = register(EventTypes.BEFORE_RENDER, update_hotbar)
     UpdateMessageBox = register(EventTypes.BEFORE_RENDER, update_message_box)
-    UpdateDataWindow = register(EventTypes.BEFORE_RENDER, update_data_window)
-    UpdateCurtain = register(EventTypes.BEFORE_RENDER, update_curtain)
-    UpdateInventory = register(EventTypes.BEFORE_RENDER, update_inventory)
-    UpdateShopping = register(EventTypes.BEFORE_RENDER, update_shopping)
+    UpdateModules = register(EventTypes.BEFORE_RENDER, update_modules)
     UpdateCropWindow = register(EventTypes.BEFORE_RENDER, update_crop_window)
 
     # Key down
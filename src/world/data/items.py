@@ -60,7 +60,7 @@ class ItemTags:
 tool_items = [Items.WateringCan, Items.Hoe]
 for tool_item in tool_items:
     ref = Registries.Item.get_ref_by_res(tool_item)
-    ref.bind_tag(ItemTags.TOOL)
+    Registries.Item.bind_tag(ref, ItemTags.TOOL)
 
 # seeds tag
 seeds_items = [
@@ -73,4 +73,4 @@ seeds_items = [
 ]
 for seeds_item in seeds_items:
     ref = Registries.Item.get_ref_by_res(seeds_item)
-    ref.bind_tag(ItemTags.SEEDS)
+    Registries.Item.bind_tag(ref, ItemTags.SEEDS)
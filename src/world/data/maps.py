@@ -1,21 +1,23 @@
 """
 Map resource module.
 """
-from src.registry import RegistryUtil
+from typing import Callable
+
+from src.registry import RegistryUtil, LazyRes
 from src.world.data.registries import Registries
 from src.world.map import Map
 from src.world.maps.home import HomeMap
 from src.world.maps.farm import FarmMap
 
 
-def register(path: str, _map: Map.__subclasses__()) -> Map.__subclasses__():
+def register(path: str, factory: Callable[[], Map]) -> LazyRes:
     """
-    Register a map.
+    Register a map. Maps are created when they are first retrieved.
     :param path: The path of the map.
-    :param _map: The map to register.
-    :return: The map registered.
+    :param factory: A function that creates the map.
+    :return: The lazy map.
     """
-    return Registries.Map.register(RegistryUtil.createLoc(path), _map)
+    return LazyRes(Registries.Map.register_lazy(RegistryUtil.createLoc(path), factory))
 
 
 class Maps:
@@ -23,5 +25,5 @@ class Maps:
     Map resources.
     """
 
-    Home: HomeMap = register("house", HomeMap())
-    Farm: FarmMap = register("farm", FarmMap())
+    Home: HomeMap = register("house", HomeMap)
+    Farm: FarmMap = register("farm", FarmMap)
@@ -8,15 +8,27 @@ from src.world.item.product import Product
 from src.world.item.item import Item
 
 
-def register(path: str, item: Item, price: int) -> Product:
+def register(path: str, item: Item, price: int, shippable: bool = True) -> Product:
     """
-    Register a product.
+    Register a product. The item of a shippable product is linked to it, so that shipping the item
+    sells the product.
     :param path: The path of the product.
     :param item: The item of the product.
     :param price: The selling price of the product.
+    :param shippable: Whether the item can be shipped.
     :return: The product.
     """
-    return Registries.Product.register(RegistryUtil.createLoc(path), Product(item, price))
+    product = Registries.Product.register(RegistryUtil.createLoc(path), Product(item, price))
+    if not shippable:
+        return product
+
+    Registries.Item.link(
+        Registries.Item.get_ref_by_res(item),
+        Registries.Product,
+        Registries.Product.get_ref_by_res(product),
+    )
+
+    return product
 
 
 class Products:
@@ -33,9 +45,9 @@ class Products:
     Pumpkin = register("pumpkin", Items.PumpkinProduct, 54)
 
     # Seeds
-    WheatSeeds = register("seeds/wheat", Items.WheatSeeds, 4)
-    BeetSeeds = register("seeds/beet", Items.BeetSeeds, 5)
-    CarrotSeeds = register("seeds/carrot", Items.CarrotSeeds, 4)
-    CauliflowerSeeds = register("seeds/cauliflower", Items.CauliflowerSeeds, 8)
-    EggplantSeeds = register("seeds/eggplant", Items.EggplantSeeds, 9)
-    PumpkinSeeds = register("seeds/pumpkin", Items.PumpkinSeeds, 12)
+    WheatSeeds = register("seeds/wheat", Items.WheatSeeds, 4, shippable=False)
+    BeetSeeds = register("seeds/beet", Items.BeetSeeds, 5, shippable=False)
+    CarrotSeeds = register("seeds/carrot", Items.CarrotSeeds, 4, shippable=False)
+    CauliflowerSeeds = register("seeds/cauliflower", Items.CauliflowerSeeds, 8, shippable=False)
+    EggplantSeeds = register("seeds/eggplant", Items.EggplantSeeds, 9, shippable=False)
+    PumpkinSeeds = register("seeds/pumpkin", Items.PumpkinSeeds, 12, shippable=False)
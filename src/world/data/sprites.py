@@ -9,11 +9,15 @@ from src.registry import RegistryUtil
 from src.core.settings import Settings
 from src.world.data.registries import Registries
 from src.world.data.tiles import Tilesets
+from src.world.data.atlases import Atlases, create_cache
 from ..util import crop_image, scale_image
 
 tile_sf: int = Settings().display_tile_scale_factor
 character_sf: int = Settings().display_character_scale_factor
 
+# Sprites are loaded from this cache instead of being cropped and scaled if it is up to date
+atlas_cache = create_cache(Atlases.Sprite, "sprite", __file__)
+
 
 def register(
     path: str,
@@ -31,13 +35,13 @@ def register(
     :param size: The size of the tile (width, height).
     :param is_character: Whether the sprite is the character.
     :param sf: Scale factor.
-    :return: The magnified sprite image.
+    :return: The magnified sprite image, which is a region of the atlas.
     """
     if sf is None:
         sf = character_sf if is_character else tile_sf
-    image = scale_image(crop_image(tile_set, pos, size), sf)
+    image = atlas_cache.get(path, lambda: scale_image(crop_image(tile_set, pos, size), sf))
 
-    return Registries.TileSet.register(RegistryUtil.createLoc(path), image)
+    return Registries.Sprite.register(RegistryUtil.createLoc(path), image)
 
 
 class Sprites:
@@ -452,3 +456,6 @@ class Sprites:
     Watering6 = register("watering/6", Tilesets.Watering, (48 * 6, 0), sf=1)
     Watering7 = register("watering/7", Tilesets.Watering, (48 * 7, 0), sf=1)
     Watering8 = register("watering/8", Tilesets.Watering, (48 * 8, 0), sf=1)
+
+
+atlas_cache.bake()
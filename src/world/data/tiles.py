@@ -9,10 +9,14 @@ from src.registry import RegistryUtil, Tag
 from src.core.settings import Settings
 from .tilesets import Tilesets
 from .registries import Registries
+from .atlases import Atlases, create_cache
 from ..util import crop_image, scale_image
 
 default_scale_factor = Settings().display_tile_scale_factor
 
+# Tiles are loaded from this cache instead of being cropped and scaled if it is up to date
+atlas_cache = create_cache(Atlases.Tile, "tile", __file__)
+
 
 def register(
     path: str,
@@ -28,15 +32,23 @@ def register(
     :param pos: The position of the tile in the given tile set.
     :param size: The size of the tile (width, height).
     :param scale_factor: The scale factor.
-    :return: The magnified tile image.
+    :return: The magnified tile image, which is a region of the atlas.
     """
-    image = scale_image(crop_image(tile_set, pos, size), scale_factor)
+    image = atlas_cache.get(
+        path, lambda: scale_image(crop_image(tile_set, pos, size), scale_factor)
+    )
 
     return Registries.Tile.register(RegistryUtil.createLoc(path), image)
 
 
-darken_surface = Surface((48, 48))
-darken_surface.fill("#B0805A")
+def create_darken_surface() -> Surface:
+    """
+    Creates the surface of darken tilled dirt.
+    """
+    surface = Surface((48, 48))
+    surface.fill("#B0805A")
+
+    return surface
 
 
 class TileTags:
@@ -91,7 +103,8 @@ class Tiles:
 
     # Darken tilled dirt
     DarkenTilledDirt15 = Registries.Tile.register(
-        RegistryUtil.createLoc("darken_tilled_dirt/15"), darken_surface
+        RegistryUtil.createLoc("darken_tilled_dirt/15"),
+        atlas_cache.get("darken_tilled_dirt/15", create_darken_surface),
     )
 
     # Water
@@ -300,4 +313,9 @@ collision_objects = [
 
 for collision_object in collision_objects:
     ref = Registries.Tile.get_ref_by_res(collision_object)
-    ref.bind_tag(TileTags.COLLISION_OBJECT)
+    Registries.Tile.bind_tag(ref, TileTags.COLLISION_OBJECT)
+
+# arable tag; seeds can be sown on tilled dirt that is not watered
+Registries.Tile.bind_tag(Registries.Tile.get_ref_by_res(Tiles.TilledDirt15), TileTags.ARABLE)
+
+atlas_cache.bake()
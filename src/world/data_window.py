@@ -1,13 +1,14 @@
 """
 Data window module
 """
-from pygame import Vector2, Surface
+from pygame import Vector2, Rect
 
-from src.core.common import Size
+from src.core.common import Size, Observable, Observed
 from src.core.context import Context
 from src.core.display import Layer
 from src.core.loop import Loop
 from src.world.context_module import ContextModule
+from src.world.text import render_text
 from src.world.util import get_font
 
 
@@ -51,13 +52,20 @@ class Time:
         self.hour %= 24
 
 
-class DataWindow(ContextModule):
+class DataWindow(ContextModule, Observable):
     """
-    Data window.
+    Data window. Observers are notified with "day", "time" or "money" when the attribute changes.
+    The layer is only redrawn after a change.
     """
 
+    # Observed attributes
+    day: Observed[int] = Observed()
+    time: Observed[Time] = Observed()
+    money: Observed[int] = Observed()
+
     def __init__(self, context: Context):
-        super().__init__(context)
+        ContextModule.__init__(self, context)
+        Observable.__init__(self)
 
         # Day
         self.day: int = 1
@@ -74,6 +82,10 @@ class DataWindow(ContextModule):
         # Time elapse loop
         self.time_elapse_loop: Loop | None = None
 
+        # Whether the layer needs to be redrawn
+        self._dirty: bool = True
+        self.observe(self._on_change)
+
         # Init
         self._init_layer()
         self._init_time_elapse()
@@ -90,7 +102,7 @@ class DataWindow(ContextModule):
             screen_size.width - size.width, (screen_size.height - size.height) * 0.1
         )
 
-        self.layer.surface.fill("#c38e70")
+        self.layer.fill("#c38e70")
 
     def _init_time_elapse(self) -> None:
         """
@@ -104,16 +116,35 @@ class DataWindow(ContextModule):
                 return
 
             self.time.increase_minute(10)
+            self.notify("time")
             if self.time.hour == 0:
                 # Next day
                 pass
 
-        self.time_elapse_loop = loop_manager.loop(1, count_per_period, time_elapse)
+        # The clock catches up after long frames, so that it keeps real time
+        self.time_elapse_loop = loop_manager.loop(
+            1, count_per_period, time_elapse, policy=Loop.Policy.CatchUp
+        )
+
+    def _on_change(self, name: str) -> None:
+        """
+        Marks the layer to be redrawn when an observed attribute changes.
+        :param name: The name of the attribute.
+        """
+        self._dirty = True
+
+    def is_active(self) -> bool:
+        """
+        The data window is active after the day, the time or the money changes.
+        """
+        return self._dirty
 
     def update(self) -> None:
         """
         Updates the layer
         """
+        self._dirty = False
+
         # Day 1
         # 15:50 AM
         # $ 000000
@@ -121,24 +152,18 @@ class DataWindow(ContextModule):
         text_font = get_font(24, "manaspace/manaspc.ttf")
 
         # Day
-        day_surface = Surface((150, 30))
-        day_surface.fill("white")
-        day_text = text_font.render(f"Day{str(self.day).rjust(5)}", False, "blue")
-        self.layer.blit(day_surface, Vector2(10, 10))
+        day_text = render_text(text_font, f"Day{str(self.day).rjust(5)}", "blue", False)
+        self.layer.fill("white", Rect(10, 10, 150, 30))
         self.layer.blit(day_text, Vector2(20, 16))
 
         # Time
-        time_surface = Surface((150, 30))
-        time_surface.fill("white")
-        time_text = text_font.render(str(self.time), False, "pink")
-        self.layer.blit(day_surface, Vector2(10, 50))
+        time_text = render_text(text_font, str(self.time), "pink", False)
+        self.layer.fill("white", Rect(10, 50, 150, 30))
         self.layer.blit(time_text, Vector2(20, 56))
 
         # Money
-        money_surface = Surface((150, 30))
-        money_surface.fill("white")
-        money_text = text_font.render(f"${str(self.money).rjust(7)}", False, "orange")
-        self.layer.blit(money_surface, Vector2(10, 90))
+        money_text = render_text(text_font, f"${str(self.money).rjust(7)}", "orange", False)
+        self.layer.fill("white", Rect(10, 90, 150, 30))
         self.layer.blit(money_text, Vector2(20, 96))
 
     def reset_time(self) -> None:
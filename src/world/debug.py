@@ -2,13 +2,14 @@
 Debug module.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from pygame import Vector2
 
 from src.core.context import Context
 from src.core.display import Layer
 from src.world.context_module import ContextModule
+from src.world.text import render_text, text_cache
 from src.world.util import get_font
 
 
@@ -19,6 +20,9 @@ class Debug(ContextModule):
 
     INSTANCE: "Debug" = None
 
+    # The number of the slowest profiled sections to print
+    NUM_PROFILED_SECTIONS = 15
+
     class Module:
         def __init__(self, name: str):
             # Module name
@@ -56,6 +60,18 @@ class Debug(ContextModule):
         # Debug font
         self.font = get_font(self._font_size, "menlo/Menlo.ttc")
 
+    def is_active(self) -> bool:
+        """
+        The debug tool is active in debug mode.
+        """
+        return self.context.settings.debug
+
+    def update(self) -> None:
+        """
+        Prints all modules and profiled sections.
+        """
+        self.print_all()
+
     def print_all(self) -> None:
         if not self.context.settings.debug:
             return
@@ -63,11 +79,31 @@ class Debug(ContextModule):
         debug_layer: Layer = self.context.display.get_layer("debug")
         debug_layer.clear()
 
-        for i, module in enumerate(self._by_name.values()):
+        lines = [module.text for module in self._by_name.values()]
+        lines.extend(self._get_profiler_lines())
+        for i, line in enumerate(lines):
             offset = Vector2(self._font_size, self._font_size * (i + 1))
-            text_surface = self.font.render(module.text, True, (0xFF,) * 3)
+            text_surface = render_text(self.font, line, (0xFF,) * 3)
             debug_layer.blit(text_surface, offset)
 
+    def _get_profiler_lines(self) -> List[str]:
+        """
+        Returns the lines showing the percentiles of the slowest profiled sections, along with the
+        statistics of the text cache.
+        """
+        profiler = self.context.profiler
+        if not profiler.enabled:
+            return []
+
+        lines = ["[Profiler] p50 / p95 / p99 (ms)"]
+        for key, percentiles in profiler.get_stats()[: Debug.NUM_PROFILED_SECTIONS]:
+            lines.append(f"{key}: " + " / ".join(f"{value:.2f}" for value in percentiles))
+
+        hits, misses, size, num_bytes = text_cache.get_stats()
+        lines.append(f"[Text cache] {hits} hits / {misses} misses, {size} surfaces, {num_bytes} B")
+
+        return lines
+
     @staticmethod
     def get_module(name: str) -> "Debug.Module":
         """
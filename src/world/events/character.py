@@ -1,14 +1,13 @@
 """
 Character related events.
 """
-from typing import Dict, Callable, List
+from typing import Dict, Callable, List, Tuple
 
 import pygame
 
 from src.core.constant import Direction
 from src.core.context import Context
 from src.core.display import GridLayer
-from src.registry import RegistryUtil
 from src.world.character import Character
 from src.core.common.methodical import CallbackQueue, CallbackNode
 from src.world.context_getters import (
@@ -28,13 +27,13 @@ from src.world.data.items import ItemTags, Items
 from src.world.data.maps import Maps
 from src.world.data.music import Music
 from src.world.data.registries import Registries
-from src.world.data.tiles import Tiles
+from src.world.data.tiles import Tiles, TileTags
 from src.world.events.crop import update_crop
 from src.world.events.game import first_time_to_farm
 from src.world.item.chest import Chest
 from src.world.item.crop import Crop, GameCrop
 from src.world.item.hotbar import Hotbar
-from src.world.item.item import GameItem, Item
+from src.world.item.item import GameItem
 from src.world.item.product import Product
 from src.world.map import Map
 from src.world.maps.farm import FarmMap
@@ -102,12 +101,13 @@ def character_key_down(context: Context):
             return
 
 
-def is_tilled_dirt_cell(cell: GridLayer.Cell) -> bool:
+def is_arable_cell(layer: GridLayer, coordinate: Tuple[int, int]) -> bool:
     """
-    Checks whether a cell is tilled dirt cell.
+    Checks whether the tile of a cell is arable.
     """
-    # return cell.surface in Renderers.TilledDirt.tiles
-    return cell.surface == Tiles.TilledDirt15
+    tag_masks = Registries.Tile.get_tag_masks()
+    mask = Registries.Tile.get_tag_mask(TileTags.ARABLE)
+    return bool(tag_masks[layer.get_tile_id(coordinate)] & mask)
 
 
 def character_use_item(context: Context) -> bool:
@@ -140,19 +140,18 @@ def character_use_item(context: Context) -> bool:
         # Check whether the cell is arable
         farm_map: FarmMap = scene_manager.controller.map
         if (
-            not is_tilled_dirt_cell(farm_map.floor.get_cell(coordinate))
+            not is_arable_cell(farm_map.floor, coordinate)
             or farm_map.crop.get_cell(coordinate).surface is not None
         ):
             return False
 
         # Sow seeds: consume a packet of seeds; update the crop layer
-        crop_item_mapping: Dict[Item, Crop] = context["crop_item_mapping"]
-        crop: Crop | None = crop_item_mapping.get(selected_item.item)
-        if crop is None:
+        crop_ref = Registries.Item.get_link(item_ref, Registries.Crop)
+        if crop_ref is None:
             return False
 
         hotbar.chest.consume_selected_item()
-        game_crop = GameCrop(crop)
+        game_crop = GameCrop(crop_ref.res)
         crop_grid = get_crop_grid(context)
         crop_grid.set(coordinate, game_crop)
         farm_map.crop.update_cell(coordinate, game_crop.image)
@@ -175,9 +174,7 @@ def character_use_watering_can(context: Context, character: Character) -> bool:
 
     # Play watering animation
     scene_manager = get_scene_manager(context)
-    animation_layer = GridLayer(
-        scene_manager.controller.map.size, context.settings.display_cell_size
-    )
+    animation_layer = scene_manager.controller.create_layer("animation")
     context.display.set_layer("animation", animation_layer)
     watering_frames = Frames.Watering.list
 
@@ -498,15 +495,12 @@ def shipping(context: Context) -> CallbackNode | None:
         if game_item is None:
             continue
 
+        # Get product; items that are not shippable, such as seeds, have none
         item_ref = Registries.Item.get_ref_by_res(game_item.item)
-        loc = item_ref.res_key.loc
-        path = loc.path
-        if not path.startswith("product/"):
+        product_ref = Registries.Item.get_link(item_ref, Registries.Product)
+        if product_ref is None:
             continue
 
-        # Get product
-        product_name = path[8:]
-        product_ref = Registries.Product.get_ref(RegistryUtil.createLoc(product_name))
         product_id: int = product_ref.get_id()
 
         # Aggregate
@@ -536,9 +530,7 @@ def shipping(context: Context) -> CallbackNode | None:
     data_window.money += total_price
 
     # Clear all items in the chest
-    item_list = shipping_chest.item_list
-    for i in range(len(item_list)):
-        item_list[i] = None
+    shipping_chest.clear()
 
     # Display price using message box
     message_box = get_message_box(context)
@@ -616,3 +608,11 @@ def update_character(context: Context):
     """
     character: Character = context["character"]
     character.update()
+
+
+def update_character_layer(context: Context):
+    """
+    Updates character's layer position.
+    """
+    character: Character = context["character"]
+    character.update_layer()
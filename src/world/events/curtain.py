@@ -1,4 +1,5 @@
 from src.core.context import Context
+from src.world.context_getters import get_update_scheduler
 from src.world.curtain import Curtain
 
 
@@ -6,12 +7,5 @@ def init_curtain(context: Context) -> None:
     """
     Initializes curtain.
     """
-    context["curtain"] = Curtain(context)
-
-
-def update_curtain(context: Context) -> None:
-    """
-    Updates the curtain.
-    """
-    curtain: Curtain = context["curtain"]
-    curtain.update()
+    curtain = context["curtain"] = Curtain(context)
+    get_update_scheduler(context).add(curtain)
@@ -2,6 +2,7 @@
 Data window related events.
 """
 from src.core.context import Context
+from src.world.context_getters import get_update_scheduler
 from src.world.data_window import DataWindow
 
 
@@ -9,12 +10,5 @@ def init_data_window(context: Context) -> None:
     """
     Initializes data window.
     """
-    context["data_window"] = DataWindow(context)
-
-
-def update_data_window(context: Context) -> None:
-    """
-    Updates data window.
-    """
-    data_window: DataWindow = context["data_window"]
-    data_window.update()
+    data_window = context["data_window"] = DataWindow(context)
+    get_update_scheduler(context).add(data_window)
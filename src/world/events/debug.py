@@ -3,6 +3,7 @@ Initialized events.
 """
 from src.core.context import Context
 from src.core.display import Layer
+from src.world.context_getters import get_update_scheduler
 from src.world.debug import Debug
 
 
@@ -11,14 +12,7 @@ def init_debug(context: Context) -> None:
     Initializes the debug tool.
     """
     context["debug"] = Debug.INSTANCE = Debug(context)
+    get_update_scheduler(context).add(Debug.INSTANCE)
 
     # debug layer
     context.display.set_layer("debug", Layer(context.display.size))
-
-
-def update_debug(context: Context) -> None:
-    """
-    Updates debug.
-    """
-    debug: Debug = context["debug"]
-    debug.print_all()
@@ -6,9 +6,7 @@ from src.core.context import Context
 from src.core.common.methodical import CallbackNode, CallbackQueue
 from src.world.context_getters import get_message_box, get_hotbar
 from src.world.data.items import Items
-from src.world.data.registries import Registries
 from src.world.item.chest import Chest
-from src.world.item.crop_item import CropItem
 from src.world.message_box import MessageBox
 from src.world.music import Music
 
@@ -42,12 +40,6 @@ def before_all(context: Context) -> None:
     context["shipping_chest"] = Chest(Size(10, 3))
     context["home_chest"] = Chest(Size(10, 3))
 
-    # Item-crop mapping
-    crop_item_mapping = context["crop_item_mapping"] = {}
-    for ref in Registries.CropItem.get_ref_list():
-        crop_item: CropItem = ref.res
-        crop_item_mapping[crop_item.item] = crop_item.crop
-
     # Items
     hotbar = get_hotbar(context)
     hotbar.chest.add_item(Items.WateringCan)
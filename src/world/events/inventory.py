@@ -7,7 +7,13 @@ import pygame
 
 from src.core.context import Context
 from src.core.display import GridLayer
-from src.world.context_getters import get_inventory, get_character, get_hotbar, get_scene_manager
+from src.world.context_getters import (
+    get_inventory,
+    get_character,
+    get_hotbar,
+    get_scene_manager,
+    get_update_scheduler,
+)
 from src.world.data.frames import Frames
 from src.world.item.inventory import Inventory
 from src.world.item.item import GameItem
@@ -17,14 +23,8 @@ def init_inventory(context: Context) -> None:
     """
     Initializes the inventory.
     """
-    context["inventory"] = Inventory(context)
-
-
-def update_inventory(context: Context) -> None:
-    """
-    Updates the inventory.
-    """
-    get_inventory(context).update()
+    inventory = context["inventory"] = Inventory(context)
+    get_update_scheduler(context).add(inventory)
 
 
 def inventory_key_down(context: Context) -> None:
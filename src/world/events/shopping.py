@@ -1,7 +1,13 @@
 import pygame
 
 from src.core.context import Context
-from src.world.context_getters import get_shopping, get_character, get_hotbar, get_data_window
+from src.world.context_getters import (
+    get_shopping,
+    get_character,
+    get_hotbar,
+    get_data_window,
+    get_update_scheduler,
+)
 from src.world.shopping import Shopping
 
 
@@ -9,14 +15,8 @@ def init_shopping(context: Context) -> None:
     """
     Initializes shopping module.
     """
-    context["shopping"] = Shopping(context)
-
-
-def update_shopping(context: Context) -> None:
-    """
-    Updates shopping module.
-    """
-    get_shopping(context).update()
+    shopping = context["shopping"] = Shopping(context)
+    get_update_scheduler(context).add(shopping)
 
 
 def shopping_key_down(context: Context) -> None:
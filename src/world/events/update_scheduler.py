@@ -0,0 +1,20 @@
+"""
+Update scheduler related functions.
+"""
+from src.core.context import Context
+from src.world.update_scheduler import UpdateScheduler
+
+
+def init_update_scheduler(context: Context) -> None:
+    """
+    Initializes the update scheduler.
+    """
+    context["update_scheduler"] = UpdateScheduler()
+
+
+def update_modules(context: Context) -> None:
+    """
+    Updates the modules added to the update scheduler.
+    """
+    update_scheduler: UpdateScheduler = context["update_scheduler"]
+    update_scheduler.update()
@@ -3,16 +3,19 @@ Chest module.
 """
 from typing import List
 
-from src.core.common import Size
+from src.core.common import Size, Observable
 from src.world.item.item import GameItem, Item
 
 
-class Chest:
+class Chest(Observable):
     """
-    Chest can be used to store items.
+    Chest can be used to store items. Observers are notified with the index of each slot whose
+    item, stack number or selection changes.
     """
 
     def __init__(self, size: Size):
+        super().__init__()
+
         # Inventory size
         self.size: Size = size
 
@@ -30,8 +33,12 @@ class Chest:
         Selects an item.
         :param index: The index of the item.
         """
-        if 0 <= index < self.item_size:
+        if 0 <= index < self.item_size and index != self._selected_index:
+            previous_index = self._selected_index
             self._selected_index = index
+            if previous_index is not None:
+                self.notify(previous_index)
+            self.notify(index)
 
     def get_item(self, index: int) -> GameItem | None:
         """
@@ -65,6 +72,7 @@ class Chest:
         game_item = GameItem(item)
         self.item_list[first_empty_slot_index] = game_item
         game_item.stack = stack
+        self.notify(first_empty_slot_index)
 
         return True
 
@@ -75,9 +83,12 @@ class Chest:
         :param increment: The number of items.
         """
         remaining_number = increment
-        for game_item in self.item_list:
+        for index, game_item in enumerate(self.item_list):
+            if remaining_number == 0:
+                break
             if game_item is not None and game_item.item == item and not game_item.is_full():
                 remaining_number = game_item.stack_to_full(remaining_number)
+                self.notify(index)
 
         if remaining_number > 0:
             return self.add_item(item, remaining_number)
@@ -93,6 +104,8 @@ class Chest:
             return False
 
         self.item_list[first_empty_slot_index] = game_item
+        self.notify(first_empty_slot_index)
+
         return True
 
     def consume_selected_item(self, volume: int = 1) -> bool:
@@ -107,6 +120,7 @@ class Chest:
 
         result = game_item.decrease_stack(volume)
         if result:
+            self.notify(self._selected_index)
             self.refresh()
 
         return result
@@ -117,6 +131,15 @@ class Chest:
         :param index: The index of the item.
         """
         self.item_list[index] = None
+        self.notify(index)
+
+    def clear(self) -> None:
+        """
+        Removes all items from the chest.
+        """
+        for index in range(self.item_size):
+            if self.item_list[index] is not None:
+                self.remove_item(index)
 
     def refresh(self) -> None:
         """
@@ -125,4 +148,4 @@ class Chest:
         for index in range(self.item_size):
             game_item = self.item_list[index]
             if game_item is not None and game_item.stack == 0:
-                self.item_list[index] = None
+                self.remove_item(index)
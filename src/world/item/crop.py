@@ -5,6 +5,7 @@ from typing import List
 
 from pygame import Surface
 
+from src.core.common import Observable, Observed
 from src.world.item.product import Product
 
 
@@ -44,12 +45,18 @@ class Crop:
         return int(day // (self.days_to_ripe / 3))
 
 
-class GameCrop:
+class GameCrop(Observable):
     """
-    Game crop.
+    Game crop. Observers are notified with "day" or "watered" when the attribute changes.
     """
 
+    # Observed attributes
+    day: Observed[float] = Observed()
+    watered: Observed[bool] = Observed()
+
     def __init__(self, crop: Crop):
+        super().__init__()
+
         # Crop
         self.crop = crop
 
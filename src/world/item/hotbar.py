@@ -1,14 +1,18 @@
 """
 Tool box module.
 """
-from pygame import Vector2, font, Rect, Surface
+from typing import Set
+
+from pygame import Vector2, Rect, Surface
 
 from src.core.common import Size
 from src.core.context import Context
 from src.core.display import Layer
+from src.core.surface_pool import surface_pool
 from src.world.context_module import ContextModule
 from src.world.item.chest import Chest
-from src.world.util import get_font, get_outlined_text_surface
+from src.world.text import render_text, render_outlined_text
+from src.world.util import get_font
 
 
 class Hotbar(ContextModule):
@@ -39,6 +43,15 @@ class Hotbar(ContextModule):
         # Chest
         self.chest: Chest = Chest(Size(10, 1))
 
+        # Fonts
+        self.number_text_font = get_font(16)
+        self.stack_text_font = get_font(18)
+
+        # Indices of the slots to render; slots are rendered when their items, stack numbers or
+        # selection change
+        self._dirty_slots: Set[int] = set(range(self.slot_number))
+        self.chest.observe(self._dirty_slots.add)
+
         # Init
         self._init_layer()
 
@@ -53,54 +66,59 @@ class Hotbar(ContextModule):
             screen_size.height * 0.98 - self.size.height,
         )
 
-        self.layer.surface.fill("#c38e70")
+        self.layer.fill(self.context.settings.inventory_background_color)
 
     def update(self) -> None:
         """
-        Updates this tool box.
+        Updates this tool box. Only the slots that changed since the last update are rendered.
+        """
+        if not self._dirty_slots:
+            return
+
+        for index in sorted(self._dirty_slots):
+            left = self.frame_border + index * (self.slot_size.width + self.frame_border)
+            surface = self._render_slot(index)
+            self.layer.blit(surface, (left, self.frame_border))
+            surface_pool.release(surface)
+        self._dirty_slots.clear()
+
+    def _render_slot(self, index: int) -> Surface:
         """
-        item_list = self.chest.item_list
-        selected_item_index: int | None = self.chest.get_selected_index()
-        self.layer.surface.fill(self.context.settings.inventory_background_color)
-        number_text_font = font.Font(None, 16)
-        stack_text_font = get_font(18)
-
-        slot_color = self.context.settings.inventory_slot_background_color
-        selected_slot_color = self.context.settings.inventory_selected_slot_background_color
-        for index in range(self.slot_number):
-            item = item_list[index]
-            rect = Rect(
-                self.frame_border + index * (self.slot_size.width + self.frame_border),
-                self.frame_border,
-                self.slot_size.width,
-                self.slot_size.height,
-            )
-
-            # Fill white color / Blit image
-            is_item_selected = index == selected_item_index
-            background_color = selected_slot_color if is_item_selected else slot_color
-            surface = Surface(self.slot_size.toTuple())
-            surface.fill(background_color)
-            if item is None:
-                self.layer.surface.blit(surface, rect)
-            else:
-                surface.blit(item.image, (0, 0))
-                self.layer.surface.blit(surface, rect)
-
-                # Blit the stack number in the bottom-right corner
-                stack_number = item.stack
-                if stack_number > 1:
-                    stack_str = str(stack_number)
-                    text_surface = get_outlined_text_surface(
-                        stack_str,
-                        stack_text_font,
-                        "#333333",
-                        "#FFFFFF",
-                    )
-                    stack_dest = (rect.right - 5 * (1 + len(stack_str)) - 3, rect.bottom - 16)
-                    self.layer.surface.blit(text_surface, stack_dest)
-
-            # Blit the number in the top-left corner
-            number_text = number_text_font.render(str((index + 1) % 10), True, "#333333")
-            number_dest = (rect.left + 3, rect.top + 3)
-            self.layer.surface.blit(number_text, number_dest)
+        Renders a slot along with its right and bottom frame borders, which the stack number may
+        stick out into.
+        :param index: The index of the slot.
+        :return: The rendered slot, which is acquired from the surface pool.
+        """
+        settings = self.context.settings
+        surface = surface_pool.acquire(
+            (self.slot_size.width + self.frame_border, self.slot_size.height + self.frame_border)
+        )
+        surface.fill(settings.inventory_background_color)
+        rect = Rect((0, 0), self.slot_size.toTuple())
+
+        # Fill white color / Blit image
+        is_item_selected = index == self.chest.get_selected_index()
+        if is_item_selected:
+            surface.fill(settings.inventory_selected_slot_background_color, rect)
+        else:
+            surface.fill(settings.inventory_slot_background_color, rect)
+
+        item = self.chest.get_item(index)
+        if item is not None:
+            surface.blit(item.image, (0, 0))
+
+            # Blit the stack number in the bottom-right corner
+            stack_number = item.stack
+            if stack_number > 1:
+                stack_str = str(stack_number)
+                text_surface = render_outlined_text(
+                    self.stack_text_font, stack_str, "#333333", "#FFFFFF"
+                )
+                stack_dest = (rect.right - 5 * (1 + len(stack_str)) - 3, rect.bottom - 16)
+                surface.blit(text_surface, stack_dest)
+
+        # Blit the number in the top-left corner
+        number_text = render_text(self.number_text_font, str((index + 1) % 10), "#333333")
+        surface.blit(number_text, (rect.left + 3, rect.top + 3))
+
+        return surface
@@ -7,9 +7,11 @@ from pygame import Vector2, Rect, Surface
 from src.core.common import Size
 from src.core.context import Context
 from src.core.display import Layer
+from src.core.surface_pool import surface_pool
 from src.world.context_module import ContextModule
 from src.world.item.chest import Chest
-from src.world.util import get_font, get_outlined_text_surface
+from src.world.text import render_text, render_outlined_text
+from src.world.util import get_font
 
 
 class Inventory(ContextModule):
@@ -46,6 +48,12 @@ class Inventory(ContextModule):
         self.layer.offset = Vector2(100, 100)
         self.layer.hidden = True
 
+    def is_active(self) -> bool:
+        """
+        The inventory is active while a chest is open.
+        """
+        return self.displayed
+
     def update(self) -> None:
         """
         Updates the layer.
@@ -75,45 +83,45 @@ class Inventory(ContextModule):
 
                 index = row * num_col + col
                 color = selected_slot_color if selected_index == index else slot_color
-                self.layer.surface.fill(color, dest)
+                self.layer.fill(color, dest)
 
                 item = self.chest.get_item(index)
                 if item is None:
                     continue
 
                 # Blit image
-                self.layer.surface.blit(item.image, dest)
+                self.layer.blit(item.image, dest)
 
                 # Blit number
                 stack_number = item.stack
                 if stack_number > 1:
                     stack_str = str(stack_number)
-                    text_surface = get_outlined_text_surface(
-                        stack_str,
-                        stack_text_font,
-                        "#333333",
-                        "#FFFFFF",
+                    text_surface = render_outlined_text(
+                        stack_text_font, stack_str, "#333333", "#FFFFFF"
                     )
                     text_dest = (
                         dest.x + cell_width - 5 * (1 + len(stack_str)) - 3,
                         dest.y + cell_height - 16,
                     )
-                    self.layer.surface.blit(text_surface, text_dest)
+                    self.layer.blit(text_surface, text_dest)
 
     def open_chest(self, chest: Chest) -> None:
         """
         Opens a chest and displays the inventory panel.
         """
+        if self.displayed:
+            self._release_surface()
+
         self.chest = chest
         self.displayed = True
 
-        # Create a new surface
+        # Acquire a surface that fits the chest
         num_col = self.chest.size.width
         num_row = self.chest.size.height
         cell_width = self.cell_size.width
         cell_height = self.cell_size.height
         border = self.frame_border
-        self.layer.surface = Surface(
+        self.layer.surface = surface_pool.acquire(
             (
                 self.frame_border * (num_col + 1) + cell_width * num_col,
                 self.frame_border * (num_row + 1) + cell_height * num_row + 75,
@@ -123,7 +131,7 @@ class Inventory(ContextModule):
 
         # Background color
         background_color = self.context.settings.inventory_background_color
-        self.layer.surface.fill(background_color)
+        self.layer.fill(background_color)
 
         screen_size = self.context.display.size
         self.layer.offset = Vector2(
@@ -139,13 +147,25 @@ class Inventory(ContextModule):
             "Press [M] to move an item to the hotbar.",
         ]
         for line_index, illustration in enumerate(illustrations):
-            text_surface = font.render(illustration, False, "black")
+            text_surface = render_text(font, illustration, "black", False)
             y = (border + 1) * num_row + num_row * cell_height + line_index * 25 + 5
-            self.layer.surface.blit(text_surface, Vector2(border * 2, y))
+            self.layer.blit(text_surface, Vector2(border * 2, y))
+
+    def _release_surface(self) -> None:
+        """
+        Returns the surface of the layer to the pool. The layer holds an empty surface until the
+        next chest is opened, so that it never draws on a surface handed out again by the pool.
+        """
+        surface_pool.release(self.layer.surface)
+        self.layer.surface = Surface((0, 0), pygame.SRCALPHA)
 
     def close_chest(self) -> None:
         """
         Closes the chest
         """
+        if self.displayed:
+            self._release_surface()
+
         self.chest = None
         self.displayed = False
+        self.layer.hidden = True
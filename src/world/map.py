@@ -3,12 +3,13 @@ Map module
 """
 from typing import Dict, List, Optional, Tuple, Any
 
+import numpy as np
 from pygame import Vector2, Rect
 
-from src.core.common import Size, Grid
+from src.core.common import Size, ArrayGrid
 from src.core.settings import Settings
 from src.core.context import Context
-from src.core.display import GridLayer
+from src.core.display import GridLayer, ChunkedGridLayer
 from src.world.data.registries import Registries
 from src.world.data.tiles import TileTags
 
@@ -25,18 +26,35 @@ class Map:
         self.size = size
 
         # The layers
-        cell_size = settings.display_cell_size
         self.layers: Dict[str, GridLayer] = {
-            "water": GridLayer(self.size, cell_size),
-            "ground": GridLayer(self.size, cell_size),
-            "floor": GridLayer(self.size, cell_size),
-            "crop": GridLayer(self.size, cell_size),
-            "furniture_bottom": GridLayer(self.size, cell_size),
-            "furniture_top": GridLayer(self.size, cell_size),
+            "water": self.create_layer(),
+            "ground": self.create_layer(),
+            "floor": self.create_layer(),
+            "crop": self.create_layer(),
+            "furniture_bottom": self.create_layer(),
+            "furniture_top": self.create_layer(),
         }
 
         # invisible block grid
-        self.invisible_block_grid: None | Grid = None
+        self.invisible_block_grid: None | ArrayGrid[bool] = None
+
+    def create_layer(self) -> GridLayer:
+        """
+        Creates a grid layer of the size of this map. Large maps use chunked layers, so that only
+        the area around the camera holds pixels.
+        """
+        cell_size = settings.display_cell_size
+        if self.size.width * self.size.height < settings.map_chunked_min_cells:
+            return GridLayer(self.size, cell_size, Registries.Tile)
+
+        return ChunkedGridLayer(
+            self.size,
+            cell_size,
+            settings.map_chunk_size,
+            settings.map_chunk_margin,
+            settings.map_max_chunks,
+            Registries.Tile,
+        )
 
     def get_layer(self, name: str) -> GridLayer:
         """
@@ -86,12 +104,28 @@ class MapController:
         # The context
         self.context: Context = context
 
-        # Block grid; cells are booleans; a cell is marked as true if it is a collision object
-        self.block_grid: Grid = Grid(self.map.size, False)
+        # Block grid; a cell is marked as true if it is a collision object
+        self.block_grid: ArrayGrid[bool] = ArrayGrid(self.map.size, bool)
+
+        # The number of collision objects in each cell, counting one for each layer whose tile
+        # is a collision object and one for an invisible block
+        self.blocker_counts: ArrayGrid[int] = ArrayGrid(self.map.size, np.int16)
 
         # Offset for all layers
         self.offset: Vector2 = Vector2(0, 0)
 
+        # The crop rectangle for all layers
+        self.rect: Optional[Rect] = None
+
+        # Layers that are not part of the map but are moved and cropped with its layers, such as
+        # the layer of an animation, by name
+        self.extra_layers: Dict[str, GridLayer] = {}
+
+        # Blocking is scanned once; afterward, layers notify this controller of updated cells
+        self.refresh_block_grid()
+        for layer in self.map.all_layers():
+            layer.observe(self._on_cell_update)
+
     def set_layers_to_display(self) -> None:
         """
         Sets layers to the game display.
@@ -106,51 +140,77 @@ class MapController:
         """
         self.map.load(self.context)
 
+    def create_layer(self, name: str) -> GridLayer:
+        """
+        Creates a layer of the size of the map that is moved and cropped with the layers of the
+        map; it replaces the extra layer of the same name.
+        :param name: The name of the layer.
+        :return: The layer.
+        """
+        layer = self.map.create_layer()
+        layer.offset = self.offset
+        layer.rect = self.rect
+        self.extra_layers[name] = layer
+
+        return layer
+
     def set_offset(self, offset: Vector2) -> None:
         """
         Sets the offset for all layers.
         """
         self.offset = offset
-        for layer in self.map.all_layers():
+        for layer in self._all_layers():
             layer.offset = offset
 
     def set_rect(self, rect: Optional[Rect]) -> None:
         """
         Sets the rectangle for all layers.
         """
-        for layer in self.map.all_layers():
+        self.rect = rect
+        for layer in self._all_layers():
             layer.rect = rect
 
+    def _all_layers(self) -> List[GridLayer]:
+        """
+        Returns the layers of the map and the extra layers.
+        """
+        return self.map.all_layers() + list(self.extra_layers.values())
+
     def refresh_block_grid(self) -> None:
         """
-        Refreshes the block grid.
+        Rescans the blocking of all cells. Layers notify this controller of updated cells, so a
+        rescan is only needed when the layers are replaced.
         """
+        counts = self.blocker_counts.array
+        counts.fill(0)
+
         # Invisible block
         invisible_block_grid = self.map.invisible_block_grid
         if invisible_block_grid is not None:
-            for index in range(len(invisible_block_grid)):
-                if invisible_block_grid[index]:
-                    self.block_grid[index] = True
+            counts += invisible_block_grid.get_mask()
 
+        tag_masks = Registries.Tile.get_tag_masks()
+        mask = Registries.Tile.get_tag_mask(TileTags.COLLISION_OBJECT)
         for layer in self.map.all_layers():
-            self.refresh_block_grid_of_layer(layer)
+            counts += (tag_masks[layer.tile_ids.array] & mask) != 0
 
-    def refresh_block_grid_of_layer(self, layer):
+        self.block_grid.array[...] = counts > 0
+
+    def _on_cell_update(
+        self, coordinate: Tuple[int, int], previous_tile_id: int, tile_id: int
+    ) -> None:
         """
-        Refreshes block grid of a certain layer.
+        Updates the blocking of a cell whose tile is updated in a layer.
         """
-        size = self.map.size
-
-        iterator = layer.grid.get_iterator((0, size.height), (0, size.width))
-        for cell in iterator:
-            surface = cell.surface
-            index = self.block_grid.get_index(cell.coordinate)
-            if self.block_grid[index] or surface is None:
-                continue
+        tag_masks = Registries.Tile.get_tag_masks()
+        mask = Registries.Tile.get_tag_mask(TileTags.COLLISION_OBJECT)
+        change = bool(tag_masks[tile_id] & mask) - bool(tag_masks[previous_tile_id] & mask)
+        if change == 0:
+            return
 
-            ref = Registries.Tile.get_ref_by_res(surface)
-            if ref.contain_tag(TileTags.COLLISION_OBJECT):
-                self.block_grid[index] = True
+        row, col = coordinate[1], coordinate[0]
+        self.blocker_counts.array[row, col] += change
+        self.block_grid.array[row, col] = self.blocker_counts.array[row, col] > 0
 
     def is_block(self, coordinate: Tuple[int, int]) -> bool:
         """
@@ -160,4 +220,4 @@ class MapController:
         if index < 0 or index > len(self.block_grid):
             return False
 
-        return self.block_grid[index]
+        return bool(self.block_grid[index])
@@ -6,9 +6,10 @@ from typing import List, Dict, Tuple
 
 from pygame import Surface, Rect
 
-from src.core.common import Size, CoordinateSet, Grid
+from src.core.common import Size, CoordinateSet, ArrayGrid
 from src.core.context import Context
 from src.core.display import GridLayer
+from src.core.loop import Loop
 from src.world.data.frames import Frames
 from src.world.data.renderers import Renderers
 from src.world.data.tiles import Tiles
@@ -32,12 +33,12 @@ class FarmMap(Map):
         self.furniture_bottom: GridLayer = self.get_layer("furniture_bottom")
 
         # Crop grid
-        self.crop_grid: Grid = Grid(self.size)
+        self.crop_grid: ArrayGrid = ArrayGrid(self.size)
 
         # Coordinate sets
         self.coordinate_set_map: Dict[str, CoordinateSet] = {}
 
-        self.invisible_block_grid = Grid(self.size, False)
+        self.invisible_block_grid = ArrayGrid(self.size, bool)
 
         # house rect
         self.house_rect: Rect = Rect(16, 2, 6, 4)
@@ -215,4 +216,4 @@ class FarmMap(Map):
                 self.water.update_cell(coordinate, frames[index])
 
         update_water(0)
-        context.game.loop_manager.loop(2, len(frames), update_water)
+        context.game.loop_manager.loop(2, len(frames), update_water, policy=Loop.Policy.Drop)
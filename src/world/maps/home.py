@@ -3,7 +3,7 @@ House map module.
 """
 from pygame import Rect
 
-from src.core.common import Size, CoordinateSet, Grid
+from src.core.common import Size, CoordinateSet, ArrayGrid
 from src.core.display import GridLayer
 from src.world.data.renderers import Renderers
 from src.world.data.tiles import Tiles
@@ -21,7 +21,7 @@ class HomeMap(Map):
         self.floor: GridLayer = self.get_layer("floor")
         self.furniture_bottom: GridLayer = self.get_layer("furniture_bottom")
         self.furniture_top: GridLayer = self.get_layer("furniture_top")
-        self.invisible_block_grid = Grid(self.size)
+        self.invisible_block_grid = ArrayGrid(self.size, bool)
         self.door_coordinate = (4, 5)
 
         self._init_wall()
@@ -1,7 +1,10 @@
 """
 Message box module.
 """
-from pygame import Vector2, Rect
+from itertools import accumulate
+from typing import List, Tuple
+
+from pygame import Vector2, Rect, Surface
 
 from src.core.common import Size
 from src.core.context import Context
@@ -9,6 +12,7 @@ from src.core.display import Layer
 from src.core.loop import LoopManager, Loop
 from src.core.common.methodical import CallbackNode
 from src.world.context_module import ContextModule
+from src.world.text import render_text
 from src.world.util import get_font
 
 
@@ -29,6 +33,13 @@ class MessageBox(ContextModule):
         # Message buffer
         self.message_buffer: str = ""
 
+        # Laid out lines of the message buffer as (index of the first character, rendered line,
+        # widths of the first 0, 1, ..., n characters of the line)
+        self._lines: List[Tuple[int, Surface, List[int]]] = []
+
+        # The number of characters of each line that are drawn on the layer
+        self._drawn_counts: List[int] = []
+
         # Size and offset
         screen_size = self.context.display.size
         self.size: Size = Size(screen_size.width * 0.9, screen_size.height * 0.3)
@@ -42,8 +53,9 @@ class MessageBox(ContextModule):
         # Message box layer
         self.layer: Layer = Layer(self.size)
 
-        # Font
+        # Font and text color
         self.font_size: int = 24
+        self.text_color = (0x33,) * 3
         self.font = get_font(self.font_size, context.settings.message_box_font)
         self.hint_font = get_font(round(self.font_size * 0.75), context.settings.message_box_font)
 
@@ -66,7 +78,7 @@ class MessageBox(ContextModule):
         self.context.display.set_layer("message_box", self.layer)
         self.layer.offset = self.offset
 
-        self.layer.surface.fill("blue")
+        self.layer.fill("blue")
         self.clear_layer()
 
     def play(self, message: str) -> CallbackNode:
@@ -74,7 +86,14 @@ class MessageBox(ContextModule):
         Plays a message.
         :param message: The message to display.
         """
+        if self.loop is not None:
+            self.context.loop_manager.remove(self.loop)
+            self.loop = None
+
         self.message_buffer = message
+        self.message = ""
+        self.clear_layer()
+        self._layout(message)
         message_len = len(message)
         loop_manager: LoopManager = self.context.loop_manager
 
@@ -84,7 +103,9 @@ class MessageBox(ContextModule):
             if index == message_len:
                 self.stop_playing()
 
-        self.loop = loop_manager.loop(self.play_speed, message_len + 1, forward)
+        self.loop = loop_manager.loop(
+            self.play_speed, message_len + 1, forward, policy=Loop.Policy.Drop
+        )
         self.callback_node = CallbackNode()
 
         return self.callback_node
@@ -109,6 +130,8 @@ class MessageBox(ContextModule):
         self.stop_playing()
         self.message = None
         self.message_buffer = ""
+        self._lines = []
+        self._drawn_counts = []
         self.clear_layer()
 
         # Invoke the callback node
@@ -116,25 +139,48 @@ class MessageBox(ContextModule):
 
     def update(self) -> None:
         """
-        Updates the message box layer.
+        Updates the message box layer. Only the characters revealed since the last update are
+        drawn, so the cost of a frame does not depend on the length of the message.
         """
         if self.message is None:
             self.layer.hidden = True
-        else:
-            self.layer.hidden = False
-            lines = self.message.split("\n")
-            for i, line in enumerate(lines):
-                text = self.font.render(line, True, (0x33,) * 3)
-                line_margin = Vector2(self.margin.x, self.margin.y + self.font_size * 1.3 * i)
-                self.layer.surface.blit(text, line_margin)
-
-        # Write hint ("Press [J] to continue...")
-        text = self.hint_font.render("Press [J] to continue ..", True, (0x33,) * 3)
-        self.layer.blit(text, Vector2(self.size.width - 300, self.size.height - 30))
+            return
+
+        self.layer.hidden = False
+        revealed_count = len(self.message)
+        for i, (start, line_surface, widths) in enumerate(self._lines):
+            count = min(max(revealed_count - start, 0), len(widths) - 1)
+            drawn_count = self._drawn_counts[i]
+            if count <= drawn_count:
+                continue
+
+            left, right = widths[drawn_count], widths[count]
+            area = Rect(left, 0, right - left, line_surface.get_height())
+            dest = Vector2(int(self.margin.x) + left, int(self.margin.y + self.font_size * 1.3 * i))
+            self.layer.blit(line_surface, dest, area)
+            self._drawn_counts[i] = count
+
+    def _layout(self, message: str) -> None:
+        """
+        Renders each line of a message once and measures where each character ends, so that the
+        characters can be revealed by blitting areas of the rendered lines.
+        :param message: The message to lay out.
+        """
+        self._lines = []
+        start = 0
+        for line in message.split("\n"):
+            line_surface = render_text(self.font, line, self.text_color)
+            line_width = line_surface.get_width()
+            widths = [self.font.size(line[:i])[0] for i in range(len(line))] + [line_width]
+            widths = [min(width, line_width) for width in accumulate(widths, max)]
+            self._lines.append((start, line_surface, widths))
+            start += len(line) + 1
+
+        self._drawn_counts = [0] * len(self._lines)
 
     def clear_layer(self) -> None:
         """
-        Clears all words in the layer.
+        Clears all words in the layer, and writes the hint ("Press [J] to continue ..").
         """
         rect = Rect(
             self.border_thickness,
@@ -142,7 +188,10 @@ class MessageBox(ContextModule):
             self.layer.size.width - self.border_thickness * 2,
             self.layer.size.height - self.border_thickness * 2,
         )
-        self.layer.surface.fill("white", rect)
+        self.layer.fill("white", rect)
+
+        text = render_text(self.hint_font, "Press [J] to continue ..", self.text_color)
+        self.layer.blit(text, Vector2(self.size.width - 300, self.size.height - 30))
 
     def is_displayed(self) -> None:
         """
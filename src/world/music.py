@@ -61,7 +61,7 @@ class Music(ContextModule):
             if index == count - 1:
                 Music.set_volume(max_volume)
 
-        self.loop = self.context.loop_manager.once(self.fade_fps, count, fade_in)
+        self.loop = self.context.loop_manager.once(self.fade_fps, count, fade_in, Loop.Policy.Drop)
 
     def fade_out(self, fade_time: int = 500) -> None:
         """
@@ -78,7 +78,7 @@ class Music(ContextModule):
             if index == count - 1:
                 self.stop()
 
-        self.loop = self.context.loop_manager.once(self.fade_fps, count, fade_out)
+        self.loop = self.context.loop_manager.once(self.fade_fps, count, fade_out, Loop.Policy.Drop)
 
     def stop(self) -> None:
         """
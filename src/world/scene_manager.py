@@ -43,7 +43,6 @@ class SceneManager:
             # Create a map controller if it does not exist
             controller = MapController(map_to_load, self.context)
             controller.load()
-            controller.refresh_block_grid()
             self._map_controller_map[map_class] = controller
 
         return controller
@@ -83,11 +82,11 @@ class SceneManager:
 
     def update_scene(self) -> None:
         """
-        Updates current scene.
+        Updates current scene; the camera is interpolated between the last two simulation steps.
         """
         # Update the rect
         camera: Camera = self.context["camera"]
-        rect = camera.get_screen_rect()
+        rect = camera.get_screen_rect(self.context.alpha)
         self.controller.set_rect(rect)
 
     def is_map(self, _map: Map) -> bool:
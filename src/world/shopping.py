@@ -4,15 +4,17 @@ Shopping module
 from typing import List
 
 import pygame
-from pygame import Vector2, Surface
+from pygame import Vector2
 
 from src.core.common import Size
 from src.core.context import Context
 from src.core.display import Layer
+from src.core.surface_pool import surface_pool
 from src.world.common.constants import Fonts
 from src.world.context_module import ContextModule
 from src.world.data.products import Products
 from src.world.item.product import Product
+from src.world.text import render_text
 from src.world.util import get_font
 
 
@@ -64,37 +66,45 @@ class Shopping(ContextModule):
 
         self.layer.hidden = True
 
+    def is_active(self) -> bool:
+        """
+        The shopping window is active while it is open.
+        """
+        return not self.layer.hidden
+
     def update(self) -> None:
         """
         Updates the shopping layer.
         """
-        surface = self.layer.surface
-        surface.fill(self.context.settings.inventory_background_color)
+        layer = self.layer
+        layer.fill(self.context.settings.inventory_background_color)
         slot_color = self.context.settings.inventory_slot_background_color
         selected_slot_color = self.context.settings.inventory_selected_slot_background_color
 
         font = get_font(36, Fonts.Manaspace)
+        row_size = (self.size.width - self.border * 2, 60)
         for row, product in enumerate(self.products):
             is_selected = row == self.selected_index
 
-            row_surface = Surface((self.size.width - self.border * 2, 60), pygame.SRCALPHA)
+            row_surface = surface_pool.acquire(row_size, pygame.SRCALPHA)
             row_surface.fill(selected_slot_color if is_selected else slot_color)
             row_surface.blit(product.item.image, Vector2(6, 6))
 
             # blit product
-            surface.blit(row_surface, Vector2(self.border, self.border + row * 70))
+            layer.blit(row_surface, Vector2(self.border, self.border + row * 70))
+            surface_pool.release(row_surface)
 
             # Name text
-            name_text = font.render(product.item.name, True, "black")
-            surface.blit(name_text, Vector2(self.border + 75, self.border + 12 + row * 70))
+            name_text = render_text(font, product.item.name, "black")
+            layer.blit(name_text, Vector2(self.border + 75, self.border + 12 + row * 70))
 
             # Price text
             price_str = str(product.price)
-            price_text = font.render(f"${price_str}", True, "orange")
-            surface.blit(
+            price_text = render_text(font, f"${price_str}", "orange")
+            layer.blit(
                 price_text,
                 Vector2(
-                    surface.get_width() - self.border - 35 - 24 * (len(price_str)),
+                    layer.surface.get_width() - self.border - 35 - 24 * (len(price_str)),
                     self.border + 14 + row * 70,
                 ),
             )
@@ -0,0 +1,157 @@
+"""
+Text module.
+"""
+from collections import OrderedDict
+from typing import Tuple, Hashable, Any
+
+from pygame import Surface, font
+
+from src.core.settings import Settings
+from src.world.util import get_outlined_text_surface
+
+
+class TextCache:
+    """
+    A cache of rendered text surfaces. Surfaces are keyed by the font, the text, the colors, the
+    antialias flag and the outline width, and the least recently used surfaces are evicted once
+    the total size of the cached pixels exceeds a budget.
+
+    Cached surfaces are shared by all callers, so they must not be drawn on.
+    """
+
+    def __init__(self, max_bytes: int):
+        # The maximum total size of cached pixels in bytes
+        self.max_bytes: int = max_bytes
+
+        # The total size of cached pixels in bytes
+        self.bytes: int = 0
+
+        # The number of lookups served from the cache
+        self.hits: int = 0
+
+        # The number of lookups that rendered text
+        self.misses: int = 0
+
+        # A map from keys to rendered surfaces, from the least to the most recently used
+        self._surfaces: OrderedDict[Hashable, Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, _font: font.Font, text: str, color: Any, antialias: bool = True) -> Surface:
+        """
+        Renders text, or returns the surface rendered earlier.
+        :param _font: The font to render with.
+        :param text: The text to render.
+        :param color: The color of the text; it must be hashable, such as a string or a tuple.
+        :param antialias: Whether the text is antialiased.
+        :return: The text surface.
+        """
+        key = (_font, text, color, antialias)
+        surface = self._get(key)
+        if surface is None:
+            surface = self._put(key, _font.render(text, antialias, color))
+
+        return surface
+
+    def render_outlined(
+        self, _font: font.Font, text: str, inner_color: Any, outer_color: Any, outline: int = 2
+    ) -> Surface:
+        """
+        Renders antialiased text with an outline, or returns the surface rendered earlier.
+        :param _font: The font to render with.
+        :param text: The text to render.
+        :param inner_color: The color of the text.
+        :param outer_color: The color of the outline.
+        :param outline: The width of the outline in pixels.
+        :return: The text surface.
+        """
+        key = (_font, text, inner_color, outer_color, outline)
+        surface = self._get(key)
+        if surface is None:
+            surface = get_outlined_text_surface(text, _font, inner_color, outer_color, outline)
+            surface = self._put(key, surface)
+
+        return surface
+
+    def get_stats(self) -> Tuple[int, int, int, int]:
+        """
+        Returns the statistics of this cache.
+        :return: (hits, misses, number of surfaces, bytes)
+        """
+        return self.hits, self.misses, len(self._surfaces), self.bytes
+
+    def clear(self) -> None:
+        """
+        Removes all surfaces from this cache.
+        """
+        self._surfaces.clear()
+        self.bytes = 0
+
+    def _get(self, key: Hashable) -> Surface | None:
+        """
+        Looks up a surface and marks it as the most recently used.
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+
+        return surface
+
+    def _put(self, key: Hashable, surface: Surface) -> Surface:
+        """
+        Adds a surface and evicts the least recently used surfaces that exceed the budget. A
+        surface larger than the whole budget is returned without being cached.
+        """
+        size = TextCache._get_bytes(surface)
+        if size > self.max_bytes:
+            return surface
+
+        self._surfaces[key] = surface
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes -= TextCache._get_bytes(evicted)
+
+        return surface
+
+    @staticmethod
+    def _get_bytes(surface: Surface) -> int:
+        """
+        Returns the size of the pixels of a surface in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+
+# The text cache shared by all modules
+text_cache: TextCache = TextCache(Settings().text_cache_max_bytes)
+
+
+def render_text(_font: font.Font, text: str, color: Any, antialias: bool = True) -> Surface:
+    """
+    Renders text through the shared text cache.
+    :param _font: The font to render with.
+    :param text: The text to render.
+    :param color: The color of the text; it must be hashable, such as a string or a tuple.
+    :param antialias: Whether the text is antialiased.
+    :return: The text surface, which must not be drawn on.
+    """
+    return text_cache.render(_font, text, color, antialias)
+
+
+def render_outlined_text(
+    _font: font.Font, text: str, inner_color: Any, outer_color: Any, outline: int = 2
+) -> Surface:
+    """
+    Renders text with an outline through the shared text cache.
+    :param _font: The font to render with.
+    :param text: The text to render.
+    :param inner_color: The color of the text.
+    :param outer_color: The color of the outline.
+    :param outline: The width of the outline in pixels.
+    :return: The text surface, which must not be drawn on.
+    """
+    return text_cache.render_outlined(_font, text, inner_color, outer_color, outline)
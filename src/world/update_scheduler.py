@@ -0,0 +1,45 @@
+"""
+Update scheduler module.
+"""
+from typing import List
+
+from src.world.context_module import ContextModule
+
+
+class UpdateScheduler:
+    """
+    An update scheduler ticks context modules only while they are active, that is, while they are
+    shown or animating. A module that is hidden and idle costs nothing per frame.
+    """
+
+    def __init__(self):
+        # Modules to update, in the order they were added
+        self.modules: List[ContextModule] = []
+
+        # If false, all modules are updated every frame whether they are active or not
+        self.enabled: bool = True
+
+        # The number of updates run and skipped
+        self.num_updates: int = 0
+        self.num_skips: int = 0
+
+    def add(self, module: ContextModule) -> ContextModule:
+        """
+        Adds a module to update every frame it is active.
+        :param module: The module to add.
+        :return: The module added.
+        """
+        self.modules.append(module)
+
+        return module
+
+    def update(self) -> None:
+        """
+        Updates active modules.
+        """
+        for module in self.modules:
+            if not self.enabled or module.is_active():
+                module.update()
+                self.num_updates += 1
+            else:
+                self.num_skips += 1